@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+AsyncioClient Fan-out Benchmark
+
+Calls 20 backend endpoints that each take 50 ms to answer, as an
+aggregator endpoint would: one after another with StdLibClient, then
+concurrently with AsyncioClient.send_all at different concurrency limits.
+The backends share one local server, so the client's per-host pool is
+sized to let every call have its own connection.
+"""
+
+import asyncio
+import threading
+import time
+
+from http4py.client import AsyncioClient, StdLibClient
+from http4py.core import Request, Response
+from http4py.core.method import GET
+from http4py.core.status import OK
+from http4py.server import StdLibServer
+
+BACKENDS = 20
+BACKEND_DELAY = 0.05
+ROUNDS = 5
+
+
+def backend(request: Request) -> Response:
+    time.sleep(BACKEND_DELAY)
+    return Response(OK).body_(request.query("id") or "")
+
+
+def serial(requests: list[Request]) -> float:
+    client = StdLibClient()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for request in requests:
+            client(request)
+    elapsed = time.perf_counter() - started
+    client.close()
+    return elapsed / ROUNDS
+
+
+def fan_out(requests: list[Request], max_concurrency: int) -> float:
+    async def run() -> float:
+        client = AsyncioClient(max_connections_per_host=BACKENDS)
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            await client.send_all(requests, max_concurrency=max_concurrency)
+        elapsed = time.perf_counter() - started
+        await client.close()
+        return elapsed / ROUNDS
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    server = StdLibServer(0, workers=BACKENDS).serve(backend).start()
+    threading.Thread(target=server.block, daemon=True).start()
+    requests = [Request(GET, f"http://localhost:{server.port()}/?id={i}") for i in range(BACKENDS)]
+    try:
+        print(f"{BACKENDS} backend calls of {BACKEND_DELAY * 1000:.0f} ms each, mean of {ROUNDS} rounds")
+        print(f"  {'StdLibClient, serial':<32} {serial(requests) * 1000:8.1f} ms")
+        for limit in (4, 10, 20):
+            print(f"  {f'AsyncioClient max_concurrency={limit}':<32} {fan_out(requests, limit) * 1000:8.1f} ms")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
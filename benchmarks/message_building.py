@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Message Building Benchmark
+
+Measures the cost of building a Request and a Response header by header (as
+adapters converting an incoming message do) or in a single bulk call,
+followed by a handful of header lookups. 50 headers is a typical proxied
+request; the larger size shows how the cost scales.
+"""
+
+import timeit
+from collections.abc import Callable
+from functools import partial
+
+from http4py.core import Request, Response
+from http4py.core.method import GET
+from http4py.core.status import OK
+
+HEADER_COUNTS = [50, 400]
+ITERATIONS = 2_000
+
+Headers = list[tuple[str, str | None]]
+
+LOOKUPS = ["x-header-0", "x-header-25", "x-header-49", "content-type", "authorization"]
+
+
+def lookup(message: Request | Response) -> str | None:
+    found = None
+    for name in LOOKUPS:
+        found = message.header(name) or found
+    return found
+
+
+def request_one_at_a_time(headers: Headers) -> str | None:
+    request = Request(GET, "/")
+    for name, value in headers:
+        request = request.header_(name, value)
+    return lookup(request)
+
+
+def response_one_at_a_time(headers: Headers) -> str | None:
+    response = Response(OK)
+    for name, value in headers:
+        response = response.header_(name, value)
+    return lookup(response)
+
+
+def request_in_bulk(headers: Headers) -> str | None:
+    return lookup(Request(GET, "/").headers_(headers))
+
+
+def main() -> None:
+    scenarios: list[tuple[str, Callable[[Headers], str | None]]] = [
+        ("Request.header_", request_one_at_a_time),
+        ("Response.header_", response_one_at_a_time),
+        ("Request.headers_", request_in_bulk),
+    ]
+    for count in HEADER_COUNTS:
+        headers: Headers = [(f"X-Header-{i}", f"value-{i}") for i in range(count)]
+        print(f"Building a message with {count} headers")
+        for name, fn in scenarios:
+            seconds = timeit.timeit(partial(fn, headers), number=ITERATIONS)
+            print(f"  {name:<18} {seconds / ITERATIONS * 1_000_000:10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
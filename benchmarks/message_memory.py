@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Message Memory Benchmark
+
+Uses tracemalloc to report the bytes retained per in-flight message, as held
+by a proxy queue or a response cache. Each message gets its own URI, ten
+headers and a small body so that nothing is shared between instances except
+interned constants.
+"""
+
+import tracemalloc
+from collections.abc import Callable
+
+from http4py.core import Request, Response, Uri
+from http4py.core.method import GET
+from http4py.core.status import OK
+
+COUNT = 10_000
+HEADERS = [(f"X-Header-{i}", f"value-{i}") for i in range(10)]
+
+
+def make_uri(i: int) -> object:
+    return Uri.of(f"http://example.com/items/{i}?page={i}")
+
+
+def make_request(i: int) -> object:
+    return Request(GET, f"http://example.com/items/{i}?page={i}").headers_(HEADERS).body_(f"payload {i}")
+
+
+def make_response(i: int) -> object:
+    return Response(OK).headers_(HEADERS).body_(f"payload {i}")
+
+
+def bytes_per_instance(factory: Callable[[int], object]) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    retained = [factory(i) for i in range(COUNT)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    return (after - before) / COUNT
+
+
+def main() -> None:
+    print(f"Bytes retained per instance ({COUNT} instances)")
+    for name, factory in [("Uri", make_uri), ("Request", make_request), ("Response", make_response)]:
+        print(f"  {name:<10} {bytes_per_instance(factory):8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Routing Dispatch Benchmark
+
+Measures how long RoutingHttpHandler takes to dispatch a request as the
+number of registered routes grows. The request always targets the last
+registered route, which is the worst case for a linear scan.
+"""
+
+import timeit
+
+from http4py.core import Request, Response
+from http4py.core.method import GET
+from http4py.core.status import OK
+from http4py.routing import route, routes
+
+ROUTE_COUNTS = [10, 100, 1000]
+ITERATIONS = 20_000
+
+
+def ok(request: Request) -> Response:
+    return Response(OK)
+
+
+def bench_dispatch(route_count: int, template: str, path: str) -> float:
+    app = routes(*[route(template.format(i=i)).bind(GET).to(ok) for i in range(route_count)])
+    request = Request(GET, path.format(i=route_count - 1))
+    seconds = timeit.timeit(lambda: app(request), number=ITERATIONS)
+    return seconds / ITERATIONS * 1_000_000
+
+
+def main() -> None:
+    print(f"{'routes':>8} {'static (us)':>12} {'parameterised (us)':>20}")
+    for count in ROUTE_COUNTS:
+        static = bench_dispatch(count, "/service{i}/items", "/service{i}/items")
+        parameterised = bench_dispatch(count, "/service{i}/items/{{id:int}}", "/service{i}/items/42")
+        print(f"{count:>8} {static:>12.2f} {parameterised:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
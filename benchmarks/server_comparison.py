@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Server Comparison Benchmark
+
+Serves the same small handler from StdLibServer, the native AsyncioServer
+and Uvicorn (when http4py-server-uvicorn is installed), and measures
+requests per second for concurrent clients that each keep one connection
+alive for all of their requests.
+"""
+
+import http.client
+import socket
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from http4py.core import Request, Response
+from http4py.core.status import OK
+from http4py.server import AsyncioServer, Http4pyServer, StdLibServer
+
+CLIENTS = 16
+REQUESTS_PER_CLIENT = 200
+
+
+def hello(request: Request) -> Response:
+    return Response(OK).body_("Hello, http4py!").header_("Content-Type", "text/plain")
+
+
+async def async_hello(request: Request) -> Response:
+    return hello(request)
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("localhost", 0))
+        return int(s.getsockname()[1])
+
+
+def fetch(port: int) -> int:
+    ok = 0
+    connection = http.client.HTTPConnection("localhost", port, timeout=30)
+    for _ in range(REQUESTS_PER_CLIENT):
+        connection.request("GET", "/")
+        response = connection.getresponse()
+        response.read()
+        ok += response.status == 200
+    connection.close()
+    return ok
+
+
+def requests_per_second(server: Http4pyServer, port: int) -> tuple[float, int]:
+    server.start()
+    threading.Thread(target=server.block, daemon=True).start()
+    time.sleep(0.2)
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(CLIENTS) as clients:
+            ok = sum(clients.map(fetch, [port] * CLIENTS))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.stop()
+    return CLIENTS * REQUESTS_PER_CLIENT / elapsed, ok
+
+
+def main() -> None:
+    servers: list[tuple[str, Callable[[int], Http4pyServer]]] = [
+        ("StdLibServer workers=16", lambda port: StdLibServer(port, workers=16).serve(hello)),
+        ("AsyncioServer", lambda port: AsyncioServer(port).serve(hello)),
+        ("AsyncioServer workers=16", lambda port: AsyncioServer(port, workers=16).serve(hello)),
+        ("AsyncioServer async handler", lambda port: AsyncioServer(port).serve(async_hello)),
+    ]
+    try:
+        from http4py.server_uvicorn import Uvicorn
+
+        servers.append(("Uvicorn", lambda port: Uvicorn(port).serve(hello)))
+    except ImportError:
+        print("http4py-server-uvicorn not installed, skipping Uvicorn")
+
+    total = CLIENTS * REQUESTS_PER_CLIENT
+    print(f"{CLIENTS} keep-alive clients, {REQUESTS_PER_CLIENT} requests each")
+    for name, server in servers:
+        port = free_port()
+        rate, ok = requests_per_second(server(port), port)
+        print(f"  {name:<28} {rate:10.0f} req/s   {ok}/{total} ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+StdLibClient Connection Pooling Benchmark
+
+Makes sequential calls to a local StdLibServer, first opening a new
+connection per call through urllib (how StdLibClient used to work), then
+through the pooled StdLibClient, which reuses one keep-alive connection.
+"""
+
+import threading
+import time
+import urllib.request
+
+from http4py.client import StdLibClient
+from http4py.core import Request, Response
+from http4py.core.method import GET
+from http4py.core.status import OK
+from http4py.server import StdLibServer
+
+CALLS = 2000
+
+
+def hello(request: Request) -> Response:
+    return Response(OK).body_("Hello, http4py!").header_("Content-Type", "text/plain")
+
+
+def urllib_per_call(url: str) -> None:
+    for _ in range(CALLS):
+        with urllib.request.urlopen(url) as response:
+            response.read()
+
+
+def pooled_client(url: str) -> None:
+    client = StdLibClient()
+    request = Request(GET, url)
+    for _ in range(CALLS):
+        client(request)
+    client.close()
+
+
+def main() -> None:
+    server = StdLibServer(0, workers=4).serve(hello).start()
+    threading.Thread(target=server.block, daemon=True).start()
+    url = f"http://localhost:{server.port()}/"
+    try:
+        print(f"{CALLS} sequential GET calls")
+        for name, run in [("urllib, connection per call", urllib_per_call), ("pooled StdLibClient", pooled_client)]:
+            started = time.perf_counter()
+            run(url)
+            elapsed = time.perf_counter() - started
+            print(f"  {name:<28} {elapsed / CALLS * 1e6:8.1f} us/call {CALLS / elapsed:10.0f} calls/s")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+StdLibServer Throughput Benchmark
+
+Measures requests per second served by StdLibServer in its default
+single-threaded mode and with a worker pool, under concurrent clients.
+The "io" handler sleeps briefly to stand in for a database or upstream
+call; the "cpu" handler returns immediately, so it shows the overhead of
+handing connections to the pool.
+"""
+
+import http.client
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from http4py.core import HttpHandler, Request, Response
+from http4py.core.status import OK
+from http4py.server import StdLibServer
+
+CLIENTS = 16
+REQUESTS_PER_CLIENT = 25
+IO_DELAY = 0.005
+
+
+def io_handler(request: Request) -> Response:
+    time.sleep(IO_DELAY)
+    return Response(OK).body_("done")
+
+
+def cpu_handler(request: Request) -> Response:
+    return Response(OK).body_("done")
+
+
+def fetch(port: int) -> int:
+    ok = 0
+    for _ in range(REQUESTS_PER_CLIENT):
+        connection = http.client.HTTPConnection("localhost", port, timeout=30)
+        connection.request("GET", "/")
+        response = connection.getresponse()
+        response.read()
+        connection.close()
+        ok += response.status == 200
+    return ok
+
+
+def requests_per_second(config: StdLibServer, handler: HttpHandler) -> tuple[float, int]:
+    server = config.serve(handler).start()
+    threading.Thread(target=server.block, daemon=True).start()
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(CLIENTS) as clients:
+            ok = sum(clients.map(fetch, [server.port()] * CLIENTS))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.stop()
+    return CLIENTS * REQUESTS_PER_CLIENT / elapsed, ok
+
+
+def main() -> None:
+    configs: list[tuple[str, Callable[[], StdLibServer]]] = [
+        ("single-threaded", lambda: StdLibServer(0)),
+        ("workers=4", lambda: StdLibServer(0, workers=4)),
+        ("workers=16", lambda: StdLibServer(0, workers=16)),
+    ]
+    total = CLIENTS * REQUESTS_PER_CLIENT
+    for handler_name, handler in [("io", io_handler), ("cpu", cpu_handler)]:
+        print(f"{handler_name} handler, {CLIENTS} concurrent clients")
+        for name, config in configs:
+            rate, ok = requests_per_second(config(), handler)
+            print(f"  {name:<16} {rate:10.0f} req/s   {ok}/{total} ok")
+
+
+if __name__ == "__main__":
+    main()
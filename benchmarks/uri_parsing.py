@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Uri Parsing Benchmark
+
+Simulates request traffic dominated by a few hundred distinct targets: each
+iteration parses a request target, reads its path and renders the URI back to
+a string, as a server adapter, a router and a client would.
+"""
+
+import timeit
+
+from http4py.core import Uri
+
+DISTINCT_PATHS = 300
+ITERATIONS = 100_000
+
+TARGETS = [f"/api/v1/resource{i}/items?page={i % 7}&sort=name" for i in range(DISTINCT_PATHS)]
+ABSOLUTE = [f"http://backend.internal:8080{target}" for target in TARGETS]
+TRAFFIC = [(i * 7919) % DISTINCT_PATHS for i in range(ITERATIONS)]
+
+
+def server_side() -> None:
+    for i in TRAFFIC:
+        _ = Uri.of(TARGETS[i]).path
+
+
+def client_side() -> None:
+    for i in TRAFFIC:
+        str(Uri.of(ABSOLUTE[i]))
+
+
+def built_uri_rendering() -> None:
+    uri = Uri().scheme_("https").host_("example.com").path_("/a/b").query_("q", "1")
+    for _ in TRAFFIC:
+        str(uri)
+
+
+def main() -> None:
+    for name, fn in [
+        ("Uri.of(target).path", server_side),
+        ("str(Uri.of(absolute))", client_side),
+        ("str(built uri)", built_uri_rendering),
+    ]:
+        seconds = timeit.timeit(fn, number=1)
+        print(f"  {name:<24} {seconds / ITERATIONS * 1_000_000_000:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
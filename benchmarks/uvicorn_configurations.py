@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Uvicorn Configuration Benchmark
+
+Serves the same small handler from Uvicorn with different tuning options
+and measures startup time and requests per second for concurrent clients
+that each keep one connection alive for all of their requests. The uvloop
+and httptools rows only run when those packages are installed.
+"""
+
+import http.client
+import importlib.util
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from http4py.core import Request, Response
+from http4py.core.status import OK
+from http4py.server_uvicorn import Uvicorn
+
+CLIENTS = 16
+REQUESTS_PER_CLIENT = 200
+
+
+def hello(request: Request) -> Response:
+    return Response(OK).body_("Hello, http4py!").header_("Content-Type", "text/plain")
+
+
+def fetch(port: int) -> int:
+    ok = 0
+    connection = http.client.HTTPConnection("localhost", port, timeout=30)
+    for _ in range(REQUESTS_PER_CLIENT):
+        connection.request("GET", "/")
+        response = connection.getresponse()
+        response.read()
+        ok += response.status == 200
+    connection.close()
+    return ok
+
+
+def measure(config: Uvicorn) -> tuple[float, float, int]:
+    started = time.perf_counter()
+    server = config.serve(hello).start()
+    startup = time.perf_counter() - started
+    threading.Thread(target=server.block, daemon=True).start()
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(CLIENTS) as clients:
+            ok = sum(clients.map(fetch, [server.port()] * CLIENTS))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.stop()
+    return startup, CLIENTS * REQUESTS_PER_CLIENT / elapsed, ok
+
+
+def main() -> None:
+    configs: list[tuple[str, Uvicorn]] = [
+        ("defaults", Uvicorn(0)),
+        ("loop=asyncio http=h11", Uvicorn(0, loop="asyncio", http="h11")),
+        ("limit_concurrency=8", Uvicorn(0, limit_concurrency=8)),
+        ("timeout_keep_alive=1", Uvicorn(0, timeout_keep_alive=1)),
+        ("workers=2", Uvicorn(0, workers=2)),
+        ("workers=4", Uvicorn(0, workers=4)),
+    ]
+    if importlib.util.find_spec("uvloop") is not None:
+        configs.append(("loop=uvloop", Uvicorn(0, loop="uvloop")))
+    if importlib.util.find_spec("httptools") is not None:
+        configs.append(("http=httptools", Uvicorn(0, http="httptools")))
+
+    total = CLIENTS * REQUESTS_PER_CLIENT
+    print(f"{CLIENTS} keep-alive clients, {REQUESTS_PER_CLIENT} requests each")
+    for name, config in configs:
+        startup, rate, ok = measure(config)
+        print(f"  {name:<24} startup {startup * 1000:6.1f} ms {rate:10.0f} req/s   {ok}/{total} ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,7 +19,7 @@ def main() -> None:
             route("/").bind(GET).to(lambda req: Response(OK).body_("Welcome to http4py!")),
             route("/health").bind(GET).to(lambda req: Response(OK).body_("OK")),
             route("/echo").bind(POST).to(lambda req: Response(OK).body_(req.body)),
-            route("/hello/{name}").bind(GET).to(lambda req: Response(OK).body_("Hello, Anonymous!")),
+            route("/hello/{name}").bind(GET).to(lambda req: Response(OK).body_(f"Hello, {req.path('name')}!")),
         )
 
         def app_handler(request: Request) -> Response:
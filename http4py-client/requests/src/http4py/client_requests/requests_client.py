@@ -24,8 +24,7 @@ class RequestsClient:
             data = None
             if request.body.bytes:
                 data = request.body.bytes
-                has_content_length = any(name.lower() == "content-length" for name, _ in request.headers)
-                if not has_content_length:
+                if "Content-Length" not in request.headers:
                     headers["Content-Length"] = str(len(data))
 
             response = self._session.request(
@@ -1 +1,2 @@
+from .asyncio_client import AsyncioClient as AsyncioClient
 from .python_client import StdLibClient as StdLibClient
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator
+
+from ..core.body import Body, Chunk, _AsyncIteratorBody, _BufferBody, _MemoryBody
+from ..core.message import Request, Response
+from ..core.method import Method
+from ..core.status import Status
+
+_PoolKey = tuple[str, str, int]
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_IDEMPOTENT = frozenset({Method.GET, Method.HEAD, Method.PUT, Method.DELETE, Method.OPTIONS})
+_BODY_EXPECTED = frozenset({Method.POST, Method.PUT, Method.PATCH})
+_RETRYABLE = (asyncio.IncompleteReadError, ConnectionResetError, BrokenPipeError)
+_NO_BODY_STATUSES = frozenset({204, 304})
+
+
+class _Connection:
+    __slots__ = ("reader", "writer", "returned_at")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.returned_at = 0.0
+
+    def is_stale(self) -> bool:
+        return self.reader.at_eof() or self.writer.is_closing()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _HostConnections:
+    __slots__ = ("idle", "slots")
+
+    def __init__(self, size: int):
+        self.idle: deque[_Connection] = deque()
+        self.slots = asyncio.Semaphore(size)
+
+
+class _ConnectionPool:
+    def __init__(self, max_connections_per_host: int, idle_timeout: float):
+        if max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be at least 1")
+        self._max_connections_per_host = max_connections_per_host
+        self._idle_timeout = idle_timeout
+        self._loops: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_PoolKey, _HostConnections]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _hosts(self) -> dict[_PoolKey, _HostConnections]:
+        loop = asyncio.get_running_loop()
+        hosts = self._loops.get(loop)
+        if hosts is None:
+            hosts = self._loops[loop] = {}
+        return hosts
+
+    async def acquire(self, key: _PoolKey) -> tuple[_Connection, bool]:
+        hosts = self._hosts()
+        host = hosts.get(key)
+        if host is None:
+            host = hosts[key] = _HostConnections(self._max_connections_per_host)
+        await host.slots.acquire()
+        try:
+            self._evict_expired(host)
+            while host.idle:
+                connection = host.idle.pop()
+                if not connection.is_stale():
+                    return connection, True
+                connection.close()
+            scheme, hostname, port = key
+            reader, writer = await asyncio.open_connection(hostname, port, ssl=True if scheme == "https" else None)
+            return _Connection(reader, writer), False
+        except BaseException:
+            host.slots.release()
+            raise
+
+    def release(self, key: _PoolKey, connection: _Connection, reusable: bool) -> None:
+        host = self._hosts()[key]
+        if reusable and not connection.is_stale():
+            connection.returned_at = time.monotonic()
+            host.idle.append(connection)
+        else:
+            connection.close()
+        host.slots.release()
+
+    async def close(self) -> None:
+        closing = []
+        for host in self._hosts().values():
+            while host.idle:
+                connection = host.idle.pop()
+                connection.close()
+                closing.append(connection.writer.wait_closed())
+        await asyncio.gather(*closing, return_exceptions=True)
+
+    def _evict_expired(self, host: _HostConnections) -> None:
+        expired_before = time.monotonic() - self._idle_timeout
+        while host.idle and host.idle[0].returned_at <= expired_before:
+            host.idle.popleft().close()
+
+
+class AsyncioClient:
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        idle_timeout: float = 30.0,
+        timeout: float | None = None,
+    ):
+        self._pool = _ConnectionPool(max_connections_per_host, idle_timeout)
+        self._timeout = timeout
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+    async def __call__(self, request: Request) -> Response:
+        return await self._send(request, self._timeout)
+
+    async def send_all(
+        self,
+        requests: Iterable[Request],
+        max_concurrency: int = 10,
+        timeout: float | None = None,
+    ) -> list[Response]:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        limit = asyncio.Semaphore(max_concurrency)
+        request_timeout = self._timeout if timeout is None else timeout
+
+        async def send(request: Request) -> Response:
+            async with limit:
+                return await self._send(request, request_timeout)
+
+        return list(await asyncio.gather(*(send(request) for request in requests)))
+
+    async def _send(self, request: Request, timeout: float | None) -> Response:
+        try:
+            async with asyncio.timeout(timeout):
+                return await self._round_trip(request)
+        except TimeoutError:
+            return Response(Status.INTERNAL_SERVER_ERROR).body_(f"Client Error: timed out after {timeout}s")
+        except Exception as e:
+            error_body = f"Client Error: {str(e)}"
+            return Response(Status.INTERNAL_SERVER_ERROR).body_(error_body)
+
+    async def _round_trip(self, request: Request) -> Response:
+        uri = request.uri
+        scheme = uri.scheme or "http"
+        key = (scheme, uri.host, uri.port or _DEFAULT_PORTS.get(scheme, 80))
+        head, chunked = _request_head(request, key)
+
+        body = request.body
+        replayable = request.method in _IDEMPOTENT and (
+            body.length == 0 or isinstance(body, (_MemoryBody, _BufferBody))
+        )
+        while True:
+            connection, reused = await self._pool.acquire(key)
+            reusable = False
+            try:
+                response, reusable = await self._exchange(connection, request, head, chunked)
+                return response
+            except _RETRYABLE:
+                if not (reused and replayable):
+                    raise
+            finally:
+                self._pool.release(key, connection, reusable)
+
+    async def _exchange(
+        self, connection: _Connection, request: Request, head: bytes, chunked: bool
+    ) -> tuple[Response, bool]:
+        reader, writer = connection.reader, connection.writer
+        writer.write(head)
+        async for chunk in _body_chunks(request.body):
+            if not chunked:
+                writer.write(chunk)
+            elif chunk:
+                writer.write(b"".join((b"%x\r\n" % len(chunk), chunk, b"\r\n")))
+            await writer.drain()
+        if chunked:
+            writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+        while True:
+            version, code, headers = _parse_response_head(await reader.readuntil(b"\r\n\r\n"))
+            if not 100 <= code < 200:
+                break
+
+        response = Response(Status.from_code(code)).headers_(headers)
+        lowered = {name.lower(): value for name, value in headers}
+        connection_header = lowered.get("connection", "").lower()
+        reusable = "close" not in connection_header if version == "HTTP/1.1" else "keep-alive" in connection_header
+
+        if request.method is Method.HEAD or code in _NO_BODY_STATUSES:
+            content = b""
+        elif "chunked" in lowered.get("transfer-encoding", "").lower():
+            content = await _read_chunked(reader)
+        elif "content-length" in lowered:
+            content = await reader.readexactly(int(lowered["content-length"]))
+        else:
+            content = await reader.read()
+            reusable = False
+
+        if content:
+            response = response.body_(content)
+        return response, reusable
+
+
+async def _body_chunks(body: Body) -> AsyncIterator[Chunk]:
+    if isinstance(body, (_MemoryBody, _BufferBody, _AsyncIteratorBody)):
+        async for chunk in body.achunks():
+            yield chunk
+        return
+    loop = asyncio.get_running_loop()
+    chunks = body.chunks()
+    while (produced := await loop.run_in_executor(None, _next_chunk, chunks)) is not None:
+        yield produced
+
+
+def _next_chunk(chunks: Iterator[Chunk]) -> Chunk | None:
+    return next(chunks, None)
+
+
+def _request_head(request: Request, key: _PoolKey) -> tuple[bytes, bool]:
+    uri = request.uri
+    target = uri.path or "/"
+    if uri.query:
+        target = f"{target}?{uri.query}"
+
+    headers = request.headers
+    lines = [f"{request.method.name} {target} HTTP/1.1"]
+    if "Host" not in headers:
+        scheme, hostname, port = key
+        lines.append(f"Host: {hostname}" if port == _DEFAULT_PORTS.get(scheme) else f"Host: {hostname}:{port}")
+    for name, value in headers:
+        if value is None:
+            continue
+        if "\r" in name or "\n" in name or "\r" in value or "\n" in value:
+            raise ValueError(f"Invalid header {name!r}")
+        lines.append(f"{name}: {value}")
+
+    length = request.body.length
+    chunked = "chunked" in (headers.get("Transfer-Encoding") or "").lower()
+    if not chunked and "Content-Length" not in headers:
+        if length is None:
+            lines.append("Transfer-Encoding: chunked")
+            chunked = True
+        elif length or request.method in _BODY_EXPECTED:
+            lines.append(f"Content-Length: {length}")
+    lines.append("\r\n")
+    return "\r\n".join(lines).encode("latin1"), chunked
+
+
+def _parse_response_head(head: bytes) -> tuple[str, int, list[tuple[str, str]]]:
+    status_line, *header_lines = head[:-4].decode("latin1").split("\r\n")
+    version, code, *_ = status_line.split(" ", 2)
+    headers = []
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers.append((name.strip(), value.strip()))
+    return version, int(code), headers
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    parts = []
+    while True:
+        size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+        if size == 0:
+            break
+        parts.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+    while await reader.readuntil(b"\r\n") != b"\r\n":
+        pass
+    return b"".join(parts)
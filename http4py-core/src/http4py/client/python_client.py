@@ -1,56 +1,280 @@
 from __future__ import annotations
 
+import base64
+import http.client
+import selectors
+import threading
+import time
 import urllib.parse
 import urllib.request
+from collections import deque
+from collections.abc import Callable
 
+from ..core.body import _BufferBody, _MemoryBody
 from ..core.message import Request, Response
+from ..core.method import Method
 from ..core.status import Status
+from ..core.uri import Uri
 
+_PoolKey = tuple[str, str, int]
 
-class StdLibClient:
-    def __call__(self, request: Request) -> Response:
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_IDEMPOTENT = frozenset({Method.GET, Method.HEAD, Method.PUT, Method.DELETE, Method.OPTIONS})
+_BODY_EXPECTED = frozenset({Method.POST, Method.PUT, Method.PATCH})
+_RETRYABLE = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+_REDIRECTS = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 10
+_DROPPED_ON_REDIRECT = ("Host", "Content-Length", "Content-Type", "Transfer-Encoding")
+
+
+class _HostConnections:
+    __slots__ = ("idle", "open")
+
+    def __init__(self) -> None:
+        self.idle: deque[tuple[float, http.client.HTTPConnection]] = deque()
+        self.open = 0
+
+
+class _ConnectionPool:
+    def __init__(
+        self,
+        max_connections_per_host: int,
+        idle_timeout: float,
+        connect: Callable[[_PoolKey], http.client.HTTPConnection],
+    ):
+        if max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be at least 1")
+        self._max_connections_per_host = max_connections_per_host
+        self._idle_timeout = idle_timeout
+        self._connect = connect
+        self._available = threading.Condition()
+        self._hosts: dict[_PoolKey, _HostConnections] = {}
+
+    def acquire(self, key: _PoolKey) -> tuple[http.client.HTTPConnection, bool]:
+        with self._available:
+            host = self._hosts.setdefault(key, _HostConnections())
+            while True:
+                self._evict_expired(host)
+                while host.idle:
+                    _, connection = host.idle.pop()
+                    if not _is_stale(connection):
+                        return connection, True
+                    self._discard(host, connection)
+                if host.open < self._max_connections_per_host:
+                    host.open += 1
+                    break
+                self._available.wait()
         try:
-            url = str(request.uri)
+            return self._connect(key), False
+        except BaseException:
+            with self._available:
+                host.open -= 1
+                self._available.notify()
+            raise
 
-            headers = {}
-            for name, value in request.headers:
-                headers[name] = value
+    def release(self, key: _PoolKey, connection: http.client.HTTPConnection, reusable: bool) -> None:
+        with self._available:
+            host = self._hosts[key]
+            if reusable and connection.sock is not None:
+                host.idle.append((time.monotonic(), connection))
+            else:
+                self._discard(host, connection)
+            self._evict_expired(host)
+            self._available.notify()
 
-            body_data = None
-            if request.body.bytes:
-                body_data = request.body.bytes
-                has_content_length = any(name.lower() == "content-length" for name, _ in request.headers)
-                if not has_content_length:
-                    headers["Content-Length"] = str(len(body_data))
+    def close(self) -> None:
+        with self._available:
+            for host in self._hosts.values():
+                while host.idle:
+                    self._discard(host, host.idle.pop()[1])
+            self._available.notify_all()
 
-            urllib_request = urllib.request.Request(
-                url=url, data=body_data, headers=headers, method=request.method.name
-            )
+    def idle_connections(self, key: _PoolKey) -> int:
+        with self._available:
+            host = self._hosts.get(key)
+            return len(host.idle) if host is not None else 0
 
-            with urllib.request.urlopen(urllib_request) as urllib_response:
-                status_code = urllib_response.getcode()
-                response_headers = [(name, value) for name, value in urllib_response.headers.items()]
-                response_body = urllib_response.read()
+    def _evict_expired(self, host: _HostConnections) -> None:
+        expired_before = time.monotonic() - self._idle_timeout
+        while host.idle and host.idle[0][0] <= expired_before:
+            self._discard(host, host.idle.popleft()[1])
 
-                status = Status.from_code(status_code)
+    def _discard(self, host: _HostConnections, connection: http.client.HTTPConnection) -> None:
+        connection.close()
+        host.open -= 1
+        self._available.notify()
 
-                response = Response(status).headers_(response_headers)
-                if response_body:
-                    response = response.body_(response_body)
 
-                return response
+def _is_stale(connection: http.client.HTTPConnection) -> bool:
+    sock = connection.sock
+    if sock is None:
+        return True
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            return bool(selector.select(0))
+    except (OSError, ValueError):
+        return True
 
-        except urllib.error.HTTPError as e:
-            status = Status.from_code(e.code)
-            response_headers = [(name, value) for name, value in e.headers.items()] if e.headers else []
-            response_body = e.read() if hasattr(e, "read") else b""
 
-            response = Response(status).headers_(response_headers)
-            if response_body:
-                response = response.body_(response_body)
+class StdLibClient:
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        idle_timeout: float = 30.0,
+        timeout: float | None = None,
+        follow_redirects: bool = True,
+    ):
+        self._pool = _ConnectionPool(max_connections_per_host, idle_timeout, self._connect)
+        self._timeout = timeout
+        self._follow_redirects = follow_redirects
+        self._proxies = urllib.request.getproxies()
+
+    def close(self) -> None:
+        self._pool.close()
 
+    def __call__(self, request: Request) -> Response:
+        try:
+            response = self._send(request)
+            redirects = 0
+            while self._follow_redirects and redirects < _MAX_REDIRECTS:
+                redirected = _redirected(request, response)
+                if redirected is None:
+                    break
+                request, redirects = redirected, redirects + 1
+                response = self._send(request)
             return response
 
         except Exception as e:
             error_body = f"Client Error: {str(e)}"
             return Response(Status.INTERNAL_SERVER_ERROR).body_(error_body)
+
+    def _send(self, request: Request) -> Response:
+        uri = request.uri
+        key = _pool_key(uri)
+        target = uri.path or "/"
+        if uri.query:
+            target = f"{target}?{uri.query}"
+        proxy_headers: dict[str, str] = {}
+        if key[0] == "http" and (proxy := self._proxy_for("http", uri.host)) is not None:
+            target = f"http://{_authority(key)}{target}"
+            proxy_headers = _proxy_headers(proxy)
+
+        body = request.body
+        replayable = request.method in _IDEMPOTENT and (
+            body.length == 0 or isinstance(body, (_MemoryBody, _BufferBody))
+        )
+        while True:
+            connection, reused = self._pool.acquire(key)
+            reusable = False
+            try:
+                response = self._exchange(connection, request, target, proxy_headers)
+                content = response.read()
+                reusable = not response.will_close
+            except _RETRYABLE:
+                if reused and replayable:
+                    continue
+                raise
+            finally:
+                self._pool.release(key, connection, reusable)
+
+            http4py_response = Response(Status.from_code(response.status)).headers_(response.getheaders())
+            if content:
+                http4py_response = http4py_response.body_(content)
+            return http4py_response
+
+    def _proxy_for(self, scheme: str, hostname: str) -> urllib.parse.SplitResult | None:
+        proxy = self._proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(hostname):
+            return None
+        return urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+    def _connect(self, key: _PoolKey) -> http.client.HTTPConnection:
+        scheme, hostname, port = key
+        proxy = self._proxy_for(scheme, hostname)
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(hostname, port, timeout=self._timeout)
+            return http.client.HTTPConnection(hostname, port, timeout=self._timeout)
+        proxy_host, proxy_port = proxy.hostname or "", proxy.port or 80
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self._timeout)
+            connection.set_tunnel(hostname, port, _proxy_headers(proxy))
+            return connection
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=self._timeout)
+
+    def _exchange(
+        self, connection: http.client.HTTPConnection, request: Request, target: str, proxy_headers: dict[str, str]
+    ) -> http.client.HTTPResponse:
+        headers = request.headers
+        connection.putrequest(
+            request.method.name,
+            target,
+            skip_host="Host" in headers,
+            skip_accept_encoding="Accept-Encoding" in headers,
+        )
+        for name, value in headers:
+            if value is not None:
+                connection.putheader(name, value)
+        for name, value in proxy_headers.items():
+            connection.putheader(name, value)
+
+        body = request.body
+        length = body.length
+        chunked = "chunked" in (headers.get("Transfer-Encoding") or "").lower()
+        if not chunked and "Content-Length" not in headers:
+            if length is None:
+                connection.putheader("Transfer-Encoding", "chunked")
+                chunked = True
+            elif length or request.method in _BODY_EXPECTED:
+                connection.putheader("Content-Length", str(length))
+        connection.endheaders()
+
+        for chunk in body.chunks():
+            if not chunked:
+                connection.send(chunk)
+            elif chunk:
+                connection.send(b"".join((b"%x\r\n" % len(chunk), chunk, b"\r\n")))
+        if chunked:
+            connection.send(b"0\r\n\r\n")
+        return connection.getresponse()
+
+
+def _pool_key(uri: Uri) -> _PoolKey:
+    scheme = uri.scheme or "http"
+    return scheme, uri.host, uri.port or _DEFAULT_PORTS.get(scheme, 80)
+
+
+def _authority(key: _PoolKey) -> str:
+    scheme, hostname, port = key
+    return hostname if port == _DEFAULT_PORTS.get(scheme) else f"{hostname}:{port}"
+
+
+def _proxy_headers(proxy: urllib.parse.SplitResult) -> dict[str, str]:
+    if proxy.username is None:
+        return {}
+    credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": f"Basic {base64.b64encode(credentials.encode()).decode('ascii')}"}
+
+
+def _redirected(request: Request, response: Response) -> Request | None:
+    code = response.status.code
+    location = response.header("Location")
+    if code not in _REDIRECTS or location is None:
+        return None
+    if request.method in (Method.GET, Method.HEAD):
+        method = request.method
+    elif request.method is Method.POST and code in (301, 302, 303):
+        method = Method.GET
+    else:
+        return None
+
+    uri = Uri.of(urllib.parse.urljoin(str(request.uri), location))
+    if uri.scheme not in _DEFAULT_PORTS:
+        return None
+    headers = request.headers
+    for name in _DROPPED_ON_REDIRECT:
+        headers = headers.remove(name)
+    if _pool_key(uri) != _pool_key(request.uri):
+        headers = headers.remove("Authorization")
+    return Request(method, uri, request.version).headers_(headers)
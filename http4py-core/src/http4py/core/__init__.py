@@ -1,5 +1,7 @@
 from .body import Body as Body
+from .headers import Headers as Headers
 from .http import HttpHandler as HttpHandler, Filter as Filter
+from .http import AsyncHttpHandler as AsyncHttpHandler, AsyncFilter as AsyncFilter
 from .http_version import HttpVersion as HttpVersion
 from .message import Request as Request, Response as Response, HttpMessage as HttpMessage
 from .method import Method as Method
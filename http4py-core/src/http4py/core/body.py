@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import mmap
+import os
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass
-from io import BytesIO
-from typing import BinaryIO
+from io import BufferedReader, BytesIO, RawIOBase
+from typing import BinaryIO, cast
+
+DEFAULT_CHARSET = "utf-8"
+CHUNK_SIZE = 64 * 1024
+
+_UNICODE_CHARSETS = frozenset({"utf-8", "utf-16", "utf-16-le", "utf-16-be", "utf-32", "utf-32-le", "utf-32-be"})
+
+Chunk = bytes | memoryview
+Chunks = Iterable[Chunk | str]
 
 
 class Body(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def stream(self) -> BinaryIO:
@@ -27,22 +42,53 @@ class Body(ABC):
     def length(self) -> int | None:
         pass
 
+    @property
+    def buffer(self) -> memoryview:
+        return memoryview(self.bytes)
+
+    def chunks(self, size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+        stream = self.stream
+        while chunk := stream.read(size):
+            yield chunk
+
+    async def achunks(self, size: int = CHUNK_SIZE) -> AsyncIterator[Chunk]:
+        for chunk in self.chunks(size):
+            yield chunk
+
+    def decode(self, charset: str = DEFAULT_CHARSET) -> str:
+        return self.bytes.decode(charset)
+
     def close(self) -> None:
         pass
 
+    @staticmethod
+    def file(path: str | os.PathLike[str], offset: int = 0, length: int | None = None) -> Body:
+        return _MappedFileBody(path, offset, length)
 
-@dataclass(init=False)
+    @staticmethod
+    def iterator(chunks: Chunks, length: int | None = None, charset: str = DEFAULT_CHARSET) -> Body:
+        return _IteratorBody(chunks, length, charset)
+
+    @staticmethod
+    def async_iterator(chunks: AsyncIterable[Chunk], length: int | None = None) -> Body:
+        return _AsyncIteratorBody(chunks, asyncio.get_running_loop(), length)
+
+
+@dataclass(frozen=True, init=False, slots=True)
 class _MemoryBody(Body):
-    _bytes: bytes
-    _text: str
+    _content: str | bytes
+    _charset: str
+    _bytes: bytes | None
+    _text: str | None
 
-    def __init__(self, content: str | bytes):
-        if isinstance(content, str):
-            self._bytes = content.encode("utf-8")
-            self._text = content
-        else:
-            self._bytes = content
-            self._text = content.decode("utf-8")
+    def __init__(self, content: str | bytes, charset: str = DEFAULT_CHARSET):
+        encoded = None if isinstance(content, str) else content
+        if encoded is None and charset != DEFAULT_CHARSET and codecs.lookup(charset).name not in _UNICODE_CHARSETS:
+            encoded = cast(str, content).encode(charset)
+        object.__setattr__(self, "_content", content)
+        object.__setattr__(self, "_charset", charset)
+        object.__setattr__(self, "_bytes", encoded)
+        object.__setattr__(self, "_text", content if isinstance(content, str) else None)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Body):
@@ -50,35 +96,56 @@ class _MemoryBody(Body):
         return self.bytes == other.bytes
 
     def __hash__(self) -> int:
-        return hash(self._bytes)
+        return hash(self.bytes)
+
+    def with_charset(self, charset: str) -> _MemoryBody:
+        if charset == self._charset:
+            return self
+        return _MemoryBody(self._content, charset)
 
     @property
     def stream(self) -> BinaryIO:
-        return BytesIO(self._bytes)
+        return BytesIO(self.bytes)
 
     @property
     def bytes(self) -> bytes:
-        return self._bytes
+        encoded = self._bytes
+        if encoded is None:
+            encoded = self._content.encode(self._charset) if isinstance(self._content, str) else self._content
+            object.__setattr__(self, "_bytes", encoded)
+        return encoded
 
     @property
     def text(self) -> str:
-        return self._text
+        decoded = self._text
+        if decoded is None:
+            decoded = self._content.decode(self._charset) if isinstance(self._content, bytes) else self._content
+            object.__setattr__(self, "_text", decoded)
+        return decoded
 
     @property
     def length(self) -> int | None:
-        return len(self._bytes)
+        return len(self.bytes)
 
+    def chunks(self, size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+        return _slices(self.buffer, size)
 
-@dataclass(init=False)
+    def decode(self, charset: str = DEFAULT_CHARSET) -> str:
+        if charset == self._charset or isinstance(self._content, str):
+            return self.text
+        return self.bytes.decode(charset)
+
+
+@dataclass(frozen=True, init=False, slots=True)
 class _StreamBody(Body):
     _stream: BinaryIO
     _length: int | None
     _cached_bytes: bytes | None
 
     def __init__(self, stream: BinaryIO, length: int | None = None):
-        self._stream = stream
-        self._length = length
-        self._cached_bytes = None
+        object.__setattr__(self, "_stream", stream)
+        object.__setattr__(self, "_length", length)
+        object.__setattr__(self, "_cached_bytes", None)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Body):
@@ -94,16 +161,23 @@ class _StreamBody(Body):
 
     @property
     def bytes(self) -> bytes:
-        if self._cached_bytes is None:
-            current_pos = self._stream.tell()
-            self._stream.seek(0)
-            self._cached_bytes = self._stream.read()
-            self._stream.seek(current_pos)
-        return self._cached_bytes
+        cached = self._cached_bytes
+        if cached is None:
+            stream = self._stream
+            if stream.seekable():
+                current_pos = stream.tell()
+                stream.seek(0)
+                cached = stream.read()
+                stream.seek(current_pos)
+            else:
+                cached = stream.read()
+                object.__setattr__(self, "_stream", BytesIO(cached))
+            object.__setattr__(self, "_cached_bytes", cached)
+        return cached
 
     @property
     def text(self) -> str:
-        return self.bytes.decode("utf-8")
+        return self.bytes.decode(DEFAULT_CHARSET)
 
     @property
     def length(self) -> int | None:
@@ -112,3 +186,343 @@ class _StreamBody(Body):
     def close(self) -> None:
         if hasattr(self._stream, "close"):
             self._stream.close()
+
+
+@dataclass(frozen=True, init=False, slots=True)
+class _IteratorBody(Body):
+    _source: Chunks
+    _iterator: Iterator[Chunk | str] | None
+    _length: int | None
+    _charset: str
+    _cached_bytes: bytes | None
+
+    def __init__(self, chunks: Chunks, length: int | None = None, charset: str = DEFAULT_CHARSET):
+        object.__setattr__(self, "_source", chunks)
+        object.__setattr__(self, "_iterator", iter(chunks))
+        object.__setattr__(self, "_length", length)
+        object.__setattr__(self, "_charset", charset)
+        object.__setattr__(self, "_cached_bytes", None)
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def _take(self) -> Iterator[Chunk]:
+        iterator = self._iterator
+        if iterator is None:
+            raise RuntimeError("Body has already been consumed")
+        object.__setattr__(self, "_iterator", None)
+        charset = self._charset
+        for chunk in iterator:
+            if chunk:
+                yield chunk.encode(charset) if isinstance(chunk, str) else chunk
+
+    @property
+    def stream(self) -> BinaryIO:
+        cached = self._cached_bytes
+        if cached is not None:
+            return BytesIO(cached)
+        return cast(BinaryIO, BufferedReader(_ChunkReader(self._take()), CHUNK_SIZE))
+
+    @property
+    def bytes(self) -> bytes:
+        cached = self._cached_bytes
+        if cached is None:
+            cached = b"".join(self._take())
+            object.__setattr__(self, "_cached_bytes", cached)
+        return cached
+
+    @property
+    def text(self) -> str:
+        return self.decode(self._charset)
+
+    @property
+    def length(self) -> int | None:
+        cached = self._cached_bytes
+        return self._length if cached is None else len(cached)
+
+    def chunks(self, size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+        cached = self._cached_bytes
+        if cached is not None:
+            return _slices(memoryview(cached), size)
+        return self._take()
+
+    def close(self) -> None:
+        object.__setattr__(self, "_iterator", None)
+        close = getattr(self._source, "close", None)
+        if close is not None:
+            close()
+
+
+@dataclass(frozen=True, init=False, slots=True)
+class _AsyncIteratorBody(Body):
+    _source: AsyncIterable[Chunk]
+    _iterator: AsyncIterator[Chunk] | None
+    _loop: asyncio.AbstractEventLoop
+    _length: int | None
+    _cached_bytes: bytes | None
+
+    def __init__(self, chunks: AsyncIterable[Chunk], loop: asyncio.AbstractEventLoop, length: int | None = None):
+        object.__setattr__(self, "_source", chunks)
+        object.__setattr__(self, "_iterator", aiter(chunks))
+        object.__setattr__(self, "_loop", loop)
+        object.__setattr__(self, "_length", length)
+        object.__setattr__(self, "_cached_bytes", None)
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def _take(self) -> AsyncIterator[Chunk]:
+        iterator = self._iterator
+        if iterator is None:
+            raise RuntimeError("Body has already been consumed")
+        object.__setattr__(self, "_iterator", None)
+        return iterator
+
+    async def achunks(self, size: int = CHUNK_SIZE) -> AsyncIterator[Chunk]:
+        cached = self._cached_bytes
+        if cached is not None:
+            for piece in _slices(memoryview(cached), size):
+                yield piece
+            return
+        async for chunk in self._take():
+            if chunk:
+                yield chunk
+
+    def _blocking_chunks(self) -> Iterator[Chunk]:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            raise RuntimeError("A streamed body cannot be read synchronously on its event loop; use achunks()")
+        iterator = self._take()
+        while (chunk := asyncio.run_coroutine_threadsafe(_anext_or_none(iterator), self._loop).result()) is not None:
+            if chunk:
+                yield chunk
+
+    @property
+    def stream(self) -> BinaryIO:
+        cached = self._cached_bytes
+        if cached is not None:
+            return BytesIO(cached)
+        return cast(BinaryIO, BufferedReader(_ChunkReader(self._blocking_chunks()), CHUNK_SIZE))
+
+    @property
+    def bytes(self) -> bytes:
+        cached = self._cached_bytes
+        if cached is None:
+            cached = b"".join(self._blocking_chunks())
+            object.__setattr__(self, "_cached_bytes", cached)
+        return cached
+
+    @property
+    def text(self) -> str:
+        return self.decode()
+
+    @property
+    def length(self) -> int | None:
+        cached = self._cached_bytes
+        return self._length if cached is None else len(cached)
+
+    def chunks(self, size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+        cached = self._cached_bytes
+        if cached is not None:
+            return _slices(memoryview(cached), size)
+        return Body.chunks(self, size)
+
+    def close(self) -> None:
+        object.__setattr__(self, "_iterator", None)
+
+
+async def _anext_or_none(iterator: AsyncIterator[Chunk]) -> Chunk | None:
+    return await anext(iterator, None)
+
+
+class _ChunkReader(RawIOBase):
+    def __init__(self, chunks: Iterator[Chunk]):
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview | bytearray) -> int:  # type: ignore[override]
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _slices(view: memoryview, size: int) -> Iterator[memoryview]:
+    for start in range(0, view.nbytes, size):
+        yield view[start : start + size]
+
+
+class _ViewReader(RawIOBase):
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview | bytearray) -> int:  # type: ignore[override]
+        chunk = self._view[self._position : self._position + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: len(self._view)}[whence]
+        self._position = max(0, base + offset)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
+@dataclass(frozen=True, init=False, slots=True)
+class _BufferBody(Body):
+    _view: memoryview
+    _cached_bytes: bytes | None
+
+    def __init__(self, content: memoryview | bytearray):
+        view = memoryview(content).cast("B")
+        object.__setattr__(self, "_view", view.toreadonly())
+        object.__setattr__(self, "_cached_bytes", None)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Body):
+            return False
+        return self._view == other.buffer
+
+    def __hash__(self) -> int:
+        return hash(self.bytes)
+
+    @property
+    def stream(self) -> BinaryIO:
+        return cast(BinaryIO, _ViewReader(self._view))
+
+    @property
+    def bytes(self) -> bytes:
+        cached = self._cached_bytes
+        if cached is None:
+            cached = self._view.tobytes()
+            object.__setattr__(self, "_cached_bytes", cached)
+        return cached
+
+    @property
+    def text(self) -> str:
+        return self.decode()
+
+    @property
+    def length(self) -> int | None:
+        return self._view.nbytes
+
+    @property
+    def buffer(self) -> memoryview:
+        return self._view
+
+    def chunks(self, size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+        return _slices(self._view, size)
+
+    def decode(self, charset: str = DEFAULT_CHARSET) -> str:
+        return str(self._view, charset)
+
+
+@dataclass(frozen=True, init=False, slots=True)
+class _MappedFileBody(Body):
+    _path: str
+    _offset: int
+    _length: int
+    _mapping: mmap.mmap | None
+    _view: memoryview | None
+
+    def __init__(self, path: str | os.PathLike[str], offset: int = 0, length: int | None = None):
+        size = os.path.getsize(path)
+        if offset < 0 or offset > size:
+            raise ValueError(f"Offset {offset} is outside of {path} ({size} bytes)")
+        available = size - offset
+        object.__setattr__(self, "_path", os.fspath(path))
+        object.__setattr__(self, "_offset", offset)
+        object.__setattr__(self, "_length", available if length is None else min(length, available))
+        object.__setattr__(self, "_mapping", None)
+        object.__setattr__(self, "_view", None)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Body):
+            return False
+        return self.buffer == other.buffer
+
+    def __hash__(self) -> int:
+        return hash(self._mapped())
+
+    def _mapped(self) -> memoryview:
+        view = self._view
+        if view is None:
+            if self._length == 0:
+                view = memoryview(b"")
+            else:
+                aligned = self._offset - self._offset % mmap.ALLOCATIONGRANULARITY
+                with open(self._path, "rb") as file:
+                    mapping = mmap.mmap(
+                        file.fileno(), self._offset - aligned + self._length, access=mmap.ACCESS_READ, offset=aligned
+                    )
+                object.__setattr__(self, "_mapping", mapping)
+                start = self._offset - aligned
+                view = memoryview(mapping)[start : start + self._length]
+            object.__setattr__(self, "_view", view)
+        return view
+
+    @property
+    def stream(self) -> BinaryIO:
+        return cast(BinaryIO, _ViewReader(self._mapped()))
+
+    @property
+    def bytes(self) -> bytes:
+        return self._mapped().tobytes()
+
+    @property
+    def text(self) -> str:
+        return self.decode()
+
+    @property
+    def length(self) -> int | None:
+        return self._length
+
+    @property
+    def buffer(self) -> memoryview:
+        return self._mapped()
+
+    def chunks(self, size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+        return _slices(self._mapped(), size)
+
+    def decode(self, charset: str = DEFAULT_CHARSET) -> str:
+        return str(self._mapped(), charset)
+
+    def close(self) -> None:
+        view, mapping = self._view, self._mapping
+        object.__setattr__(self, "_view", None)
+        object.__setattr__(self, "_mapping", None)
+        if view is not None:
+            view.release()
+        if mapping is not None:
+            try:
+                mapping.close()
+            except BufferError:
+                pass
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from itertools import chain
+
+HeaderEntry = tuple[str, str | None]
+
+
+class Headers:
+    __slots__ = ("_parent", "_added", "_size", "_entries", "_index")
+
+    def __init__(self, headers: Iterable[HeaderEntry] = ()):
+        entries = tuple(headers)
+        self._parent: Headers | None = None
+        self._added: tuple[HeaderEntry, ...] = entries
+        self._size = len(entries)
+        self._entries: tuple[HeaderEntry, ...] | None = entries
+        self._index: dict[str, list[str | None]] | None = None
+
+    @classmethod
+    def _appended(cls, parent: Headers, added: tuple[HeaderEntry, ...]) -> Headers:
+        headers = cls.__new__(cls)
+        headers._parent = parent
+        headers._added = added
+        headers._size = parent._size + len(added)
+        headers._entries = None
+        headers._index = None
+        return headers
+
+    def get(self, name: str) -> str | None:
+        values = self._lookup().get(name.lower())
+        return values[0] if values else None
+
+    def _first(self, name: str) -> str | None:
+        lowered = name.lower()
+        if self._index is not None:
+            values = self._index.get(lowered)
+            return values[0] if values else None
+        found = None
+        node: Headers | None = self
+        while node is not None:
+            entries = node._entries
+            for entry_name, value in reversed(node._added if entries is None else entries):
+                if entry_name.lower() == lowered:
+                    found = value
+            if entries is not None:
+                break
+            node = node._parent
+        return found
+
+    def get_all(self, name: str) -> list[str | None]:
+        return list(self._lookup().get(name.lower(), ()))
+
+    def add(self, name: str, value: str | None) -> Headers:
+        return Headers._appended(self, ((name, value),))
+
+    def extend(self, headers: Iterable[HeaderEntry]) -> Headers:
+        added = tuple(headers)
+        if not added:
+            return self
+        if not self._size:
+            return Headers(added)
+        return Headers._appended(self, added)
+
+    def remove(self, name: str) -> Headers:
+        lowered = name.lower()
+        return Headers(entry for entry in self._materialise() if entry[0].lower() != lowered)
+
+    def _materialise(self) -> tuple[HeaderEntry, ...]:
+        entries = self._entries
+        if entries is None:
+            segments: list[tuple[HeaderEntry, ...]] = []
+            node = self._parent
+            segments.append(self._added)
+            while node is not None and node._entries is None:
+                segments.append(node._added)
+                node = node._parent
+            if node is not None and node._entries is not None:
+                segments.append(node._entries)
+            entries = tuple(chain.from_iterable(reversed(segments)))
+            self._entries = entries
+            self._parent = None
+        return entries
+
+    def _lookup(self) -> dict[str, list[str | None]]:
+        index = self._index
+        if index is None:
+            index = {}
+            for name, value in self._materialise():
+                index.setdefault(name.lower(), []).append(value)
+            self._index = index
+        return index
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.lower() in self._lookup()
+
+    def __iter__(self) -> Iterator[HeaderEntry]:
+        return iter(self._materialise())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Headers):
+            return self._size == other._size and self._materialise() == other._materialise()
+        if isinstance(other, (list, tuple)):
+            return list(self._materialise()) == list(other)
+        return False
+
+    def __hash__(self) -> int:
+        return hash(self._materialise())
+
+    def __repr__(self) -> str:
+        return f"Headers({list(self._materialise())!r})"
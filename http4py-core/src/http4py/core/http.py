@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
 from dataclasses import dataclass
+from typing import TypeIs
 
 from .message import Request, Response
 
 HttpHandler = Callable[[Request], Response]
+AsyncHttpHandler = Callable[[Request], Awaitable[Response]]
 
 
 @dataclass(frozen=True)
@@ -28,3 +33,39 @@ class Filter(ABC):
                 return self.first(self.second(fn))
 
         return ComposedFilter(self, fn)
+
+
+@dataclass(frozen=True)
+class AsyncFilter(ABC):
+    @abstractmethod
+    def __call__(self, fn: AsyncHttpHandler) -> AsyncHttpHandler:
+        pass
+
+    def then(self, fn: HttpHandler | AsyncHttpHandler, executor: Executor | None = None) -> AsyncHttpHandler:
+        return self(to_async(fn, executor))
+
+    def thenF(self, fn: AsyncFilter) -> AsyncFilter:
+        @dataclass(frozen=True)
+        class ComposedAsyncFilter(AsyncFilter):
+            first: AsyncFilter
+            second: AsyncFilter
+
+            def __call__(self, fn: AsyncHttpHandler) -> AsyncHttpHandler:
+                return self.first(self.second(fn))
+
+        return ComposedAsyncFilter(self, fn)
+
+
+def is_async(fn: HttpHandler | AsyncHttpHandler) -> TypeIs[AsyncHttpHandler]:
+    return inspect.iscoroutinefunction(fn) or (callable(fn) and inspect.iscoroutinefunction(type(fn).__call__))
+
+
+def to_async(fn: HttpHandler | AsyncHttpHandler, executor: Executor | None = None) -> AsyncHttpHandler:
+    if is_async(fn):
+        return fn
+    handler = fn
+
+    async def offloaded(request: Request) -> Response:
+        return await asyncio.get_running_loop().run_in_executor(executor, handler, request)
+
+    return offloaded
@@ -1,41 +1,92 @@
 from __future__ import annotations
 
+import codecs
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, BinaryIO
+from dataclasses import dataclass, field
+from collections.abc import Iterable
+from typing import Any, BinaryIO, cast
 
-from .body import Body, _MemoryBody, _StreamBody
+from .body import DEFAULT_CHARSET, Body, Chunks, _BufferBody, _IteratorBody, _MemoryBody, _StreamBody
+from .headers import HeaderEntry, Headers
 from .http_version import HttpVersion
 from .method import Method
 from .status import Status
 from .uri import Uri
 
 
-@dataclass(frozen=True, init=False)
+_EMPTY_HEADERS = Headers()
+_EMPTY_BODY = _MemoryBody("")
+
+
+def _charset_of(content_type: str | None) -> str | None:
+    if not content_type:
+        return None
+    for parameter in content_type.split(";")[1:]:
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "charset":
+            return _known_charset(value.strip().strip('"'))
+    return None
+
+
+def _known_charset(charset: str) -> str | None:
+    if not charset:
+        return None
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return None
+
+
+BodyContent = str | bytes | bytearray | memoryview | Body | BinaryIO | Chunks
+
+
+def _body_of(content: BodyContent, charset: str) -> Body:
+    if isinstance(content, Body):
+        return content
+    if isinstance(content, (str, bytes)):
+        return _MemoryBody(content, charset)
+    if isinstance(content, (bytearray, memoryview)):
+        return _BufferBody(content)
+    if hasattr(content, "read"):
+        return _StreamBody(cast(BinaryIO, content))
+    return _IteratorBody(content, charset=charset)
+
+
+@dataclass(frozen=True, init=False, slots=True)
 class HttpMessage(ABC):
-    headers: list[tuple[str, str | None]]
+    headers: Headers
     body: Body
     version: HttpVersion
 
     def _init_http_message(self, version: HttpVersion = HttpVersion.HTTP_1_1) -> None:
-        object.__setattr__(self, "headers", [])
-        object.__setattr__(self, "body", _MemoryBody(""))
+        object.__setattr__(self, "headers", _EMPTY_HEADERS)
+        object.__setattr__(self, "body", _EMPTY_BODY)
         object.__setattr__(self, "version", version)
 
     def header(self, name: str) -> str | None:
-        for header_name, header_value in self.headers:
-            if header_name.lower() == name.lower():
-                return header_value
-        return None
+        return self.headers.get(name)
+
+    def header_values(self, name: str) -> list[str | None]:
+        return self.headers.get_all(name)
 
     def body_string(self) -> str:
-        return self.body.text
+        charset = _charset_of(self.headers.get("Content-Type"))
+        return self.body.decode(charset) if charset else self.body.text
+
+    def _content_charset(self, headers: Headers | None = None) -> str:
+        return _charset_of((headers or self.headers)._first("Content-Type")) or DEFAULT_CHARSET
+
+    def _body_for(self, headers: Headers) -> Body:
+        body = self.body
+        if isinstance(body, _MemoryBody):
+            return body.with_charset(self._content_charset(headers))
+        return body
 
     def close(self) -> None:
         self.body.close()
 
     @abstractmethod
-    def body_(self, content: str | bytes | Body | BinaryIO) -> HttpMessage:
+    def body_(self, content: BodyContent) -> HttpMessage:
         pass
 
     @abstractmethod
@@ -43,50 +94,65 @@ class HttpMessage(ABC):
         pass
 
     @abstractmethod
-    def headers_(self, headers: list[tuple[str, str | None]]) -> HttpMessage:
+    def headers_(self, headers: Iterable[HeaderEntry]) -> HttpMessage:
         pass
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, init=False, slots=True)
 class Request(HttpMessage):
     method: Method
     uri: Uri
+    path_parameters: dict[str, Any] = field(compare=False, repr=False)
 
     def __init__(self, method: Method, uri: str | Uri, version: HttpVersion = HttpVersion.HTTP_1_1):
         self._init_http_message(version)
         object.__setattr__(self, "method", method)
         object.__setattr__(self, "uri", uri if isinstance(uri, Uri) else Uri.of(uri))
+        object.__setattr__(self, "path_parameters", {})
 
     def _copy(self, **overrides: Any) -> Request:
-        new_request = Request(
-            overrides.get("method", self.method), overrides.get("uri", self.uri), overrides.get("version", self.version)
-        )
-        object.__setattr__(new_request, "headers", list(overrides.get("headers", self.headers)))
+        new_request = object.__new__(Request)
+        object.__setattr__(new_request, "method", overrides.get("method", self.method))
+        object.__setattr__(new_request, "uri", overrides.get("uri", self.uri))
+        object.__setattr__(new_request, "version", overrides.get("version", self.version))
+        object.__setattr__(new_request, "headers", overrides.get("headers", self.headers))
         object.__setattr__(new_request, "body", overrides.get("body", self.body))
+        object.__setattr__(new_request, "path_parameters", overrides.get("path_parameters", self.path_parameters))
         return new_request
 
-    def body_(self, content: str | bytes | Body | BinaryIO) -> Request:
-        if isinstance(content, Body):
-            new_body = content
-        elif isinstance(content, (str, bytes)):
-            new_body = _MemoryBody(content)
-        else:
-            new_body = _StreamBody(content)
+    def path(self, name: str) -> Any | None:
+        return self.path_parameters.get(name)
 
-        return self._copy(body=new_body)
+    def query(self, name: str) -> str | None:
+        return self.uri.query_value(name)
+
+    def queries(self, name: str) -> list[str | None]:
+        return self.uri.query_values(name)
+
+    def query_(self, name: str, value: str) -> Request:
+        return self._copy(uri=self.uri.query_(name, value))
+
+    def path_parameters_(self, parameters: dict[str, Any]) -> Request:
+        return self._copy(path_parameters={**self.path_parameters, **parameters})
+
+    def body_(self, content: BodyContent) -> Request:
+        return self._copy(body=_body_of(content, self._content_charset()))
 
     def header_(self, name: str, value: str | None) -> Request:
-        new_headers = list(self.headers)
-        new_headers.append((name, value))
+        new_headers = self.headers.add(name, value)
+        if name.lower() == "content-type":
+            return self._copy(headers=new_headers, body=self._body_for(new_headers))
         return self._copy(headers=new_headers)
 
-    def headers_(self, headers: list[tuple[str, str | None]]) -> Request:
-        new_headers = list(self.headers)
-        new_headers.extend(headers)
+    def headers_(self, headers: Iterable[HeaderEntry]) -> Request:
+        added = tuple(headers)
+        new_headers = self.headers.extend(added)
+        if any(name.lower() == "content-type" for name, _ in added):
+            return self._copy(headers=new_headers, body=self._body_for(new_headers))
         return self._copy(headers=new_headers)
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, init=False, slots=True)
 class Response(HttpMessage):
     status: Status
 
@@ -95,27 +161,25 @@ class Response(HttpMessage):
         object.__setattr__(self, "status", status)
 
     def _copy(self, **overrides: Any) -> Response:
-        new_response = Response(overrides.get("status", self.status), overrides.get("version", self.version))
-        object.__setattr__(new_response, "headers", list(overrides.get("headers", self.headers)))
+        new_response = object.__new__(Response)
+        object.__setattr__(new_response, "status", overrides.get("status", self.status))
+        object.__setattr__(new_response, "version", overrides.get("version", self.version))
+        object.__setattr__(new_response, "headers", overrides.get("headers", self.headers))
         object.__setattr__(new_response, "body", overrides.get("body", self.body))
         return new_response
 
-    def body_(self, content: str | bytes | Body | BinaryIO) -> Response:
-        if isinstance(content, Body):
-            new_body = content
-        elif isinstance(content, (str, bytes)):
-            new_body = _MemoryBody(content)
-        else:
-            new_body = _StreamBody(content)
-
-        return self._copy(body=new_body)
+    def body_(self, content: BodyContent) -> Response:
+        return self._copy(body=_body_of(content, self._content_charset()))
 
     def header_(self, name: str, value: str | None) -> Response:
-        new_headers = list(self.headers)
-        new_headers.append((name, value))
+        new_headers = self.headers.add(name, value)
+        if name.lower() == "content-type":
+            return self._copy(headers=new_headers, body=self._body_for(new_headers))
         return self._copy(headers=new_headers)
 
-    def headers_(self, headers: list[tuple[str, str | None]]) -> Response:
-        new_headers = list(self.headers)
-        new_headers.extend(headers)
+    def headers_(self, headers: Iterable[HeaderEntry]) -> Response:
+        added = tuple(headers)
+        new_headers = self.headers.extend(added)
+        if any(name.lower() == "content-type" for name, _ in added):
+            return self._copy(headers=new_headers, body=self._body_for(new_headers))
         return self._copy(headers=new_headers)
@@ -11,7 +11,10 @@ class Status(Enum):
 
     MOVED_PERMANENTLY = (301, "Moved Permanently")
     FOUND = (302, "Found")
+    SEE_OTHER = (303, "See Other")
     NOT_MODIFIED = (304, "Not Modified")
+    TEMPORARY_REDIRECT = (307, "Temporary Redirect")
+    PERMANENT_REDIRECT = (308, "Permanent Redirect")
 
     BAD_REQUEST = (400, "Bad Request")
     UNAUTHORIZED = (401, "Unauthorized")
@@ -51,7 +54,10 @@ ACCEPTED = Status.ACCEPTED
 NO_CONTENT = Status.NO_CONTENT
 MOVED_PERMANENTLY = Status.MOVED_PERMANENTLY
 FOUND = Status.FOUND
+SEE_OTHER = Status.SEE_OTHER
 NOT_MODIFIED = Status.NOT_MODIFIED
+TEMPORARY_REDIRECT = Status.TEMPORARY_REDIRECT
+PERMANENT_REDIRECT = Status.PERMANENT_REDIRECT
 BAD_REQUEST = Status.BAD_REQUEST
 UNAUTHORIZED = Status.UNAUTHORIZED
 FORBIDDEN = Status.FORBIDDEN
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, replace
+from dataclasses import FrozenInstanceError
+from functools import lru_cache
+from typing import Any, NamedTuple
 from urllib.parse import quote, unquote
 
 
@@ -13,127 +15,277 @@ def _url_decode(s: str) -> str:
     return unquote(s)
 
 
-def _to_parameters(query: str) -> list[tuple[str, str | None]]:
+QueryParameter = tuple[str, str | None]
+
+
+def _to_parameters(query: str) -> list[QueryParameter]:
     if not query:
         return []
     return [_to_parameter(param) for param in query.split("&")]
 
 
-def _to_parameter(param: str) -> tuple[str, str | None]:
+def _to_parameter(param: str) -> QueryParameter:
     parts = param.split("=", 1)
     key = _url_decode(parts[0])
     value = _url_decode(parts[1]) if len(parts) > 1 else None
     return (key, value)
 
 
-def _to_url_form_encoded(params: list[tuple[str, str | None]]) -> str:
-    def encode_param(key: str, value: str | None) -> str:
-        encoded_key = _url_encode(key)
-        if value is None:
-            return encoded_key
-        return f"{encoded_key}={_url_encode(value)}"
+def _encode_parameter(key: str, value: str | None) -> str:
+    encoded_key = _url_encode(key)
+    if value is None:
+        return encoded_key
+    return f"{encoded_key}={_url_encode(value)}"
+
+
+def _to_url_form_encoded(params: list[QueryParameter]) -> str:
+    return "&".join(_encode_parameter(k, v) for k, v in params)
+
+
+class _QueryParameters:
+    __slots__ = ("entries", "_index")
+
+    def __init__(self, entries: tuple[QueryParameter, ...]):
+        self.entries = entries
+        self._index: dict[str, list[str | None]] | None = None
+
+    def get(self, name: str) -> str | None:
+        values = self._lookup().get(name)
+        return values[0] if values else None
+
+    def get_all(self, name: str) -> list[str | None]:
+        return list(self._lookup().get(name, ()))
+
+    def add(self, name: str, value: str | None) -> _QueryParameters:
+        return _QueryParameters((*self.entries, (name, value)))
+
+    def _lookup(self) -> dict[str, list[str | None]]:
+        index = self._index
+        if index is None:
+            index = {}
+            for name, value in self.entries:
+                index.setdefault(name, []).append(value)
+            self._index = index
+        return index
+
+
+class _UriParts(NamedTuple):
+    scheme: str
+    userinfo: str
+    host: str
+    port: int | None
+    path: str
+    query: str
+    fragment: str
+
+
+_RFC3986 = re.compile(r"^(?:([^:/?#]+):)?(?://([^/?#]*))?([^?#]*)(?:\?([^#]*))?(?:#(.*))?")
+_AUTHORITY = re.compile(r"(?:([^@]+)@)?([^:]+)(?::(\d+))?")
+
+_PARSE_CACHE_SIZE = 1024
+
+
+def _parse_authority(authority: str) -> tuple[str, str, int | None]:
+    if not authority:
+        return "", "", None
+
+    match = _AUTHORITY.match(authority)
+    if not match:
+        raise ValueError(f"Invalid authority: {authority}")
+
+    userinfo, host, port_str = match.groups()
+    userinfo = userinfo or ""
+    host = host or ""
+    port = int(port_str) if port_str else None
+
+    return userinfo, host, port
+
+
+def _parse(uri: str) -> _UriParts:
+    if uri.startswith("/") and not uri.startswith("//"):
+        rest, _, fragment = uri.partition("#")
+        path, _, query = rest.partition("?")
+        return _UriParts("", "", "", None, path, query, fragment)
+
+    match = _RFC3986.match(uri)
+    if not match:
+        raise ValueError(f"Invalid URI: {uri}")
+
+    scheme, authority, path, query, fragment = match.groups()
+    userinfo, host, port = _parse_authority(authority or "")
+
+    return _UriParts(scheme or "", userinfo, host, port, path or "", query or "", fragment or "")
 
-    return "&".join(encode_param(k, v) for k, v in params)
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _cached_uri(uri: str) -> Uri:
+    parsed = Uri._unparsed(uri)
+    if "//" in uri:
+        parsed._components()
+    return parsed
 
 
-@dataclass
 class Uri:
-    scheme: str = ""
-    userinfo: str = ""
-    host: str = ""
-    port: int | None = None
-    path: str = ""
-    query: str = ""
-    fragment: str = ""
+    __slots__ = ("_raw", "_parts", "_string", "_authority", "_parameters")
+
+    _raw: str | None
+    _parts: _UriParts | None
+    _string: str | None
+    _authority: str | None
+    _parameters: _QueryParameters | None
+
+    def __init__(
+        self,
+        scheme: str = "",
+        userinfo: str = "",
+        host: str = "",
+        port: int | None = None,
+        path: str = "",
+        query: str = "",
+        fragment: str = "",
+    ):
+        object.__setattr__(self, "_raw", None)
+        object.__setattr__(self, "_parts", _UriParts(scheme, userinfo, host, port, path, query, fragment))
+        object.__setattr__(self, "_string", None)
+        object.__setattr__(self, "_authority", None)
+        object.__setattr__(self, "_parameters", None)
 
     @classmethod
     def of(cls, uri: str) -> Uri:
-        match = cls._RFC3986.match(uri)
-        if not match:
-            raise ValueError(f"Invalid URI: {uri}")
+        return _cached_uri(uri)
 
-        scheme, authority, path, query, fragment = match.groups()
-        scheme = scheme or ""
-        authority = authority or ""
-        path = path or ""
-        query = query or ""
-        fragment = fragment or ""
+    @classmethod
+    def _unparsed(cls, uri: str) -> Uri:
+        unparsed = object.__new__(cls)
+        object.__setattr__(unparsed, "_raw", uri)
+        object.__setattr__(unparsed, "_parts", None)
+        object.__setattr__(unparsed, "_string", None)
+        object.__setattr__(unparsed, "_authority", None)
+        object.__setattr__(unparsed, "_parameters", None)
+        return unparsed
 
-        userinfo, host, port = cls._parse_authority(authority)
+    @classmethod
+    def _of_parts(cls, parts: _UriParts, parameters: _QueryParameters | None = None) -> Uri:
+        uri = object.__new__(cls)
+        object.__setattr__(uri, "_raw", None)
+        object.__setattr__(uri, "_parts", parts)
+        object.__setattr__(uri, "_string", None)
+        object.__setattr__(uri, "_authority", None)
+        object.__setattr__(uri, "_parameters", parameters)
+        return uri
+
+    def _components(self) -> _UriParts:
+        parts = self._parts
+        if parts is None:
+            parts = _parse(self._raw or "")
+            object.__setattr__(self, "_parts", parts)
+        return parts
+
+    def _replace(self, **changes: Any) -> Uri:
+        parameters = None if "query" in changes else self._parameters
+        return Uri._of_parts(self._components()._replace(**changes), parameters)
+
+    def _query_parameters(self) -> _QueryParameters:
+        parameters = self._parameters
+        if parameters is None:
+            parameters = _QueryParameters(tuple(_to_parameters(self.query)))
+            object.__setattr__(self, "_parameters", parameters)
+        return parameters
+
+    def _with_query_parameters(self, parameters: list[QueryParameter]) -> Uri:
+        parts = self._components()._replace(query=_to_url_form_encoded(parameters))
+        return Uri._of_parts(parts, _QueryParameters(tuple(parameters)))
 
-        return cls(scheme, userinfo, host, port, path, query, fragment)
+    @property
+    def scheme(self) -> str:
+        return self._components().scheme
 
-    _RFC3986 = re.compile(r"^(?:([^:/?#]+):)?(?://([^/?#]*))?([^?#]*)(?:\?([^#]*))?(?:#(.*))?")
-    _AUTHORITY = re.compile(r"(?:([^@]+)@)?([^:]+)(?::(\d+))?")
+    @property
+    def userinfo(self) -> str:
+        return self._components().userinfo
 
-    @classmethod
-    def _parse_authority(cls, authority: str) -> tuple[str, str, int | None]:
-        if not authority:
-            return "", "", None
+    @property
+    def host(self) -> str:
+        return self._components().host
 
-        match = cls._AUTHORITY.match(authority)
-        if not match:
-            raise ValueError(f"Invalid authority: {authority}")
+    @property
+    def port(self) -> int | None:
+        return self._components().port
+
+    @property
+    def path(self) -> str:
+        return self._components().path
 
-        userinfo, host, port_str = match.groups()
-        userinfo = userinfo or ""
-        host = host or ""
-        port = int(port_str) if port_str else None
+    @property
+    def query(self) -> str:
+        return self._components().query
 
-        return userinfo, host, port
+    @property
+    def fragment(self) -> str:
+        return self._components().fragment
 
     @property
     def authority(self) -> str:
-        result = ""
-        if self.userinfo:
-            result += f"{self.userinfo}@"
-        result += self.host
-        if self.port is not None:
-            result += f":{self.port}"
-        return result
+        authority = self._authority
+        if authority is None:
+            parts = self._components()
+            authority = ""
+            if parts.userinfo:
+                authority += f"{parts.userinfo}@"
+            authority += parts.host
+            if parts.port is not None:
+                authority += f":{parts.port}"
+            object.__setattr__(self, "_authority", authority)
+        return authority
 
     def scheme_(self, scheme: str) -> Uri:
-        return replace(self, scheme=scheme)
+        return self._replace(scheme=scheme)
 
     def userinfo_(self, userinfo: str) -> Uri:
-        return replace(self, userinfo=userinfo)
+        return self._replace(userinfo=userinfo)
 
     def host_(self, host: str) -> Uri:
-        return replace(self, host=host)
+        return self._replace(host=host)
 
     def port_(self, port: int | None) -> Uri:
-        return replace(self, port=port)
+        return self._replace(port=port)
 
     def path_(self, path: str) -> Uri:
-        return replace(self, path=path)
+        return self._replace(path=path)
 
     def query_string(self, query: str) -> Uri:
-        return replace(self, query=query)
+        return self._replace(query=query)
 
     def fragment_(self, fragment: str) -> Uri:
-        return replace(self, fragment=fragment)
+        return self._replace(fragment=fragment)
 
     def authority_(self, authority: str) -> Uri:
-        userinfo, host, port = self._parse_authority(authority)
-        return replace(self, userinfo=userinfo, host=host, port=port)
+        userinfo, host, port = _parse_authority(authority)
+        return self._replace(userinfo=userinfo, host=host, port=port)
 
     def query_(self, name: str, value: str) -> Uri:
-        params = _to_parameters(self.query)
-        params.append((name, value))
-        return self.query_string(_to_url_form_encoded(params))
+        parts = self._components()
+        encoded = _encode_parameter(name, value)
+        query = f"{parts.query}&{encoded}" if parts.query else encoded
+        parameters = self._parameters.add(name, value) if self._parameters is not None else None
+        return Uri._of_parts(parts._replace(query=query), parameters)
 
     def remove_query(self, name: str) -> Uri:
-        params = _to_parameters(self.query)
-        filtered_params = [(k, v) for k, v in params if k != name]
-        return self.query_string(_to_url_form_encoded(filtered_params))
+        params = self._query_parameters().entries
+        return self._with_query_parameters([(k, v) for k, v in params if k != name])
 
     def remove_queries(self, prefix: str = "") -> Uri:
-        params = _to_parameters(self.query)
-        filtered_params = [(k, v) for k, v in params if not k.startswith(prefix)]
-        return self.query_string(_to_url_form_encoded(filtered_params))
+        params = self._query_parameters().entries
+        return self._with_query_parameters([(k, v) for k, v in params if not k.startswith(prefix)])
+
+    def queries(self) -> list[QueryParameter]:
+        return list(self._query_parameters().entries)
+
+    def query_value(self, name: str) -> str | None:
+        return self._query_parameters().get(name)
 
-    def queries(self) -> list[tuple[str, str | None]]:
-        return _to_parameters(self.query)
+    def query_values(self, name: str) -> list[str | None]:
+        return self._query_parameters().get_all(name)
 
     def append_to_path(self, path_to_append: str) -> Uri:
         if not path_to_append:
@@ -144,28 +296,60 @@ class Uri:
         return self.path_(new_path)
 
     def __str__(self) -> str:
+        string = self._string
+        if string is None:
+            string = self._render()
+            object.__setattr__(self, "_string", string)
+        return string
+
+    def _render(self) -> str:
+        parts = self._components()
         result = ""
 
-        if self.scheme:
-            result += f"{self.scheme}:"
+        if parts.scheme:
+            result += f"{parts.scheme}:"
 
         authority = self.authority
         if authority:
             result += f"//{authority}"
 
-        if authority and self.path and not self.path.startswith("/"):
-            result += f"/{self.path}"
+        if authority and parts.path and not parts.path.startswith("/"):
+            result += f"/{parts.path}"
         else:
-            result += self.path
+            result += parts.path
 
-        if self.query:
-            result += f"?{self.query}"
+        if parts.query:
+            result += f"?{parts.query}"
 
-        if self.fragment:
-            result += f"#{self.fragment}"
+        if parts.fragment:
+            result += f"#{parts.fragment}"
 
         return result
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Uri):
+            return NotImplemented
+        return self._components() == other._components()
+
+    def __hash__(self) -> int:
+        return hash(self._components())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self._components()._asdict().items())
+        return f"Uri({fields})"
+
+    def __reduce__(self) -> tuple[type[Uri], tuple[Any, ...]]:
+        return Uri, tuple(self._components())
+
+    def __replace__(self, **changes: Any) -> Uri:
+        return self._replace(**changes)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Uri):
             return NotImplemented
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from ..core.http import HttpHandler
 from ..core.method import Method
 
+if TYPE_CHECKING:
+    from .router import RoutingHttpHandler
+
 
 @dataclass(frozen=True)
 class Route:
@@ -13,6 +17,9 @@ class Route:
     def bind(self, method: Method) -> _PathMethod:
         return _PathMethod(self.path, method)
 
+    def to(self, routing: RoutingHttpHandler) -> _Mount:
+        return _Mount(self.path, routing)
+
 
 @dataclass(frozen=True)
 class _PathMethod:
@@ -30,5 +37,34 @@ class _RouteDefinition:
     handler: HttpHandler
 
 
+@dataclass(frozen=True)
+class _Mount:
+    prefix: str
+    routing: RoutingHttpHandler
+
+    def route_definitions(self) -> list[_RouteDefinition]:
+        return [
+            _RouteDefinition(_join(self.prefix, route_def.path), route_def.method, route_def.handler)
+            for route_def in _flatten(self.routing.routes)
+        ]
+
+
+def _flatten(definitions: list[_RouteDefinition | _Mount]) -> list[_RouteDefinition]:
+    flattened: list[_RouteDefinition] = []
+    for definition in definitions:
+        if isinstance(definition, _Mount):
+            flattened.extend(definition.route_definitions())
+        else:
+            flattened.append(definition)
+    return flattened
+
+
+def _join(prefix: str, path: str) -> str:
+    base = prefix.rstrip("/")
+    if path in ("", "/"):
+        return base or "/"
+    return f"{base}/{path.lstrip('/')}"
+
+
 def route(path: str) -> Route:
     return Route(path)
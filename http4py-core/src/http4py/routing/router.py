@@ -1,26 +1,62 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
-from .route import _RouteDefinition
+from .route import _Mount, _RouteDefinition
+from .tree import _Node, compile_routes
+from ..core.body import Body
 from ..core.message import Request, Response
+from ..core.method import Method
 from ..core.status import Status
 
 
 @dataclass(frozen=True)
 class RoutingHttpHandler:
-    routes: list[_RouteDefinition]
+    routes: list[_RouteDefinition | _Mount]
+    _tree: _Node = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_tree", compile_routes(self.routes))
 
     def __call__(self, request: Request) -> Response:
-        for route_def in self.routes:
-            if self._matches(request, route_def):
-                return route_def.handler(request)
+        path = request.uri.path
+        match = self._tree.find(request.method, path)
+        if match is not None:
+            node, path_parameters = match
+            return _dispatch(node.handlers[request.method], request, path_parameters)
+
+        if request.method == Method.HEAD:
+            match = self._tree.find(Method.GET, path)
+            if match is not None:
+                node, path_parameters = match
+                return _without_body(_dispatch(node.handlers[Method.GET], request, path_parameters))
+
+        allow = self._tree.allow(path)
+        if not allow:
+            return Response(Status.NOT_FOUND).body_("Not Found")
+
+        if request.method == Method.OPTIONS:
+            return Response(Status.NO_CONTENT).header_("Allow", allow)
+        return Response(Status.METHOD_NOT_ALLOWED).header_("Allow", allow).body_("Method Not Allowed")
+
+
+def _dispatch(route_def: _RouteDefinition, request: Request, path_parameters: dict[str, Any]) -> Response:
+    if path_parameters:
+        request = request.path_parameters_(path_parameters)
+    return route_def.handler(request)
 
-        return Response(Status.NOT_FOUND).body_("Not Found")
 
-    def _matches(self, request: Request, route_def: _RouteDefinition) -> bool:
-        return request.method == route_def.method and request.uri.path == route_def.path
+def _without_body(response: Response) -> Response:
+    length = response.body.length
+    response.body.close()
+    if length is None:
+        return response.body_(Body.iterator(()))
+    head_response = response.body_(b"")
+    if response.header("Content-Length") is None:
+        head_response = head_response.header_("Content-Length", str(length))
+    return head_response
 
 
-def routes(*route_definitions: _RouteDefinition) -> RoutingHttpHandler:
+def routes(*route_definitions: _RouteDefinition | _Mount) -> RoutingHttpHandler:
     return RoutingHttpHandler(list(route_definitions))
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import unquote
+from uuid import UUID
+
+from .route import _Mount, _RouteDefinition, _flatten
+from ..core.method import Method
+
+_PARAMETER = re.compile(r"^\{([A-Za-z_][A-Za-z0-9_]*)(?::([a-z]+))?\}$")
+
+_CONVERTERS: dict[str, tuple[re.Pattern[str], Callable[[str], Any]]] = {
+    "str": (re.compile(r".+"), str),
+    "int": (re.compile(r"-?[0-9]+"), int),
+    "float": (re.compile(r"-?[0-9]+(?:\.[0-9]+)?"), float),
+    "uuid": (re.compile(r"[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}"), UUID),
+}
+
+_REMAINDER = "path"
+
+
+@dataclass(frozen=True)
+class _Parameter:
+    name: str
+    type: str
+
+    def convert(self, segment: str) -> tuple[bool, Any]:
+        pattern, converter = _CONVERTERS[self.type]
+        value = unquote(segment)
+        if pattern.fullmatch(value) is None:
+            return False, None
+        return True, converter(value)
+
+
+@dataclass
+class _Node:
+    static: dict[str, _Node] = field(default_factory=dict)
+    parameters: list[tuple[_Parameter, _Node]] = field(default_factory=list)
+    remainder: tuple[_Parameter, _Node] | None = None
+    handlers: dict[Method, _RouteDefinition] = field(default_factory=dict)
+
+    def insert(self, route_def: _RouteDefinition) -> None:
+        node = self
+        segments = _split(route_def.path)
+        for index, segment in enumerate(segments):
+            parameter = _parse_parameter(segment)
+            if parameter is None:
+                node = node.static.setdefault(segment, _Node())
+            elif parameter.type == _REMAINDER:
+                if index != len(segments) - 1:
+                    raise ValueError(f"Path parameter '{parameter.name}' must be the last segment: {route_def.path}")
+                if node.remainder is None:
+                    node.remainder = (parameter, _Node())
+                elif node.remainder[0] != parameter:
+                    raise ValueError(f"Conflicting path parameter '{parameter.name}' in route: {route_def.path}")
+                node = node.remainder[1]
+            else:
+                node = node._parameter_child(parameter)
+        node.handlers.setdefault(route_def.method, route_def)
+
+    def find(self, method: Method, path: str) -> tuple[_Node, dict[str, Any]] | None:
+        captures: dict[str, Any] = {}
+        node = self._find(_split(path), 0, method, captures)
+        if node is None:
+            return None
+        return node, captures
+
+    def allow(self, path: str) -> str:
+        allowed: set[Method] = set()
+        self._collect(_split(path), 0, allowed)
+        if not allowed:
+            return ""
+        allowed.add(Method.OPTIONS)
+        if Method.GET in allowed:
+            allowed.add(Method.HEAD)
+        return ", ".join(method.value for method in Method if method in allowed)
+
+    def _accepts(self, method: Method) -> bool:
+        return method in self.handlers
+
+    def _parameter_child(self, parameter: _Parameter) -> _Node:
+        for existing, child in self.parameters:
+            if existing == parameter:
+                return child
+        child = _Node()
+        self.parameters.append((parameter, child))
+        return child
+
+    def _find(self, segments: list[str], index: int, method: Method, captures: dict[str, Any]) -> _Node | None:
+        if index == len(segments):
+            return self if self._accepts(method) else None
+
+        segment = segments[index]
+        child = self.static.get(segment)
+        if child is not None:
+            found = child._find(segments, index + 1, method, captures)
+            if found is not None:
+                return found
+
+        for parameter, child in self.parameters:
+            matched, value = parameter.convert(segment)
+            if not matched:
+                continue
+            captures[parameter.name] = value
+            found = child._find(segments, index + 1, method, captures)
+            if found is not None:
+                return found
+            del captures[parameter.name]
+
+        if self.remainder is not None:
+            parameter, child = self.remainder
+            if child._accepts(method):
+                captures[parameter.name] = unquote("/".join(segments[index:]))
+                return child
+
+        return None
+
+    def _collect(self, segments: list[str], index: int, allowed: set[Method]) -> None:
+        if index == len(segments):
+            allowed.update(self.handlers)
+            return
+
+        segment = segments[index]
+        child = self.static.get(segment)
+        if child is not None:
+            child._collect(segments, index + 1, allowed)
+
+        for parameter, child in self.parameters:
+            if parameter.convert(segment)[0]:
+                child._collect(segments, index + 1, allowed)
+
+        if self.remainder is not None:
+            allowed.update(self.remainder[1].handlers)
+
+
+def _split(path: str) -> list[str]:
+    return path.split("/")
+
+
+def _parse_parameter(segment: str) -> _Parameter | None:
+    if "{" not in segment and "}" not in segment:
+        return None
+    match = _PARAMETER.match(segment)
+    if match is None:
+        raise ValueError(f"Invalid path segment: {segment}")
+    name, type_name = match.groups()
+    type_name = type_name or "str"
+    if type_name != _REMAINDER and type_name not in _CONVERTERS:
+        raise ValueError(f"Unknown path parameter type '{type_name}' for '{name}'")
+    return _Parameter(name, type_name)
+
+
+def compile_routes(route_definitions: list[_RouteDefinition | _Mount]) -> _Node:
+    root = _Node()
+    for route_def in _flatten(route_definitions):
+        root.insert(route_def)
+    return root
@@ -1,3 +1,5 @@
-from .server import Http4pyServer as Http4pyServer
+from .server import DrainReport as DrainReport, Http4pyServer as Http4pyServer
 from .server_config import ServerConfig as ServerConfig
+from .prefork import PreFork as PreFork
 from .stdlib_server import StdLibServer as StdLibServer
+from .asyncio_server import AsyncioServer as AsyncioServer
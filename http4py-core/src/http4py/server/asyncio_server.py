@@ -0,0 +1,507 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+import traceback
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from typing import cast
+
+from http4py.core import AsyncHttpHandler, Body, Headers, HttpHandler, Method, Request, Response, Status, Uri
+from http4py.core.body import CHUNK_SIZE, Chunk, _BufferBody, _MemoryBody
+from http4py.core.http import is_async
+from http4py.core.http_version import HttpVersion
+
+from .server import DrainReport, Http4pyServer
+from .server_config import ServerConfig
+
+_MAX_HEAD_SIZE = 64 * 1024
+_READ_HIGH_WATER = 256 * 1024
+_DRAIN_LIMIT = 1024 * 1024
+_CONTINUE = b"HTTP/1.1 100 Continue\r\n\r\n"
+_VERSIONS = {"HTTP/1.1": HttpVersion.HTTP_1_1, "HTTP/1.0": HttpVersion.HTTP_1_0}
+
+
+class AsyncioServer(ServerConfig):
+    def __init__(
+        self,
+        port: int = 8080,
+        workers: int | None = None,
+        idle_timeout: float = 5.0,
+        max_requests_per_connection: int = 100,
+        backlog: int = 128,
+        shutdown_timeout: float = 10.0,
+    ):
+        self._port = port
+        self._workers = workers
+        self._idle_timeout = idle_timeout
+        self._max_requests_per_connection = max_requests_per_connection
+        self._backlog = backlog
+        self._shutdown_timeout = shutdown_timeout
+
+    def serve(self, http: HttpHandler | AsyncHttpHandler) -> Http4pyServer:
+        return _AsyncioServer(self, http, None)
+
+    def serve_on(self, http: HttpHandler | AsyncHttpHandler, listener: socket.socket) -> Http4pyServer:
+        return _AsyncioServer(self, http, listener)
+
+
+class _MalformedRequestError(Exception):
+    pass
+
+
+class _AsyncioServer(Http4pyServer):
+    def __init__(
+        self, config: AsyncioServer, http_handler: HttpHandler | AsyncHttpHandler, listener: socket.socket | None
+    ):
+        self.config = config
+        self._http_handler = http_handler
+        self._listener = listener
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_requested: asyncio.Event | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._port = listener.getsockname()[1] if listener is not None else config._port
+        self.connections: set[_HttpProtocol] = set()
+        self.closing = False
+        self._drain_timeout = config._shutdown_timeout
+        self._report = DrainReport()
+
+    def start(self) -> Http4pyServer:
+        if self._thread is not None:
+            return self
+
+        ready = threading.Event()
+        failures: list[BaseException] = []
+
+        def run() -> None:
+            try:
+                asyncio.run(self._main(ready))
+            except BaseException as e:
+                failures.append(e)
+                ready.set()
+
+        self.closing = False
+        self._executor = ThreadPoolExecutor(self.config._workers, thread_name_prefix="http4py-worker")
+        self._thread = threading.Thread(target=run, name="http4py-asyncio", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failures:
+            self._thread.join()
+            self._thread = None
+            raise failures[0]
+        return self
+
+    def stop(self) -> Http4pyServer:
+        self.drain(self.config._shutdown_timeout)
+        return self
+
+    def drain(self, timeout: float = 30.0) -> DrainReport:
+        if self._thread is None:
+            return DrainReport()
+        self._drain_timeout = timeout
+        if self._loop is not None and self._stop_requested is not None:
+            self._loop.call_soon_threadsafe(self._stop_requested.set)
+        self._thread.join()
+        self._thread = None
+        self._loop = None
+        report = self._report
+        if self._executor is not None:
+            self._executor.shutdown(wait=not report.abandoned, cancel_futures=True)
+            self._executor = None
+        return report
+
+    def block(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def port(self) -> int:
+        return self._port
+
+    async def _main(self, ready: threading.Event) -> None:
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._stop_requested = asyncio.Event()
+        config = self.config
+        if self._listener is not None:
+            server = await loop.create_server(lambda: _HttpProtocol(self), sock=self._listener, backlog=config._backlog)
+        else:
+            server = await loop.create_server(
+                lambda: _HttpProtocol(self), host="localhost", port=config._port, backlog=config._backlog
+            )
+        self._port = server.sockets[0].getsockname()[1]
+        ready.set()
+
+        await self._stop_requested.wait()
+        server.close()
+        self.closing = True
+        idle_closed = 0
+        tasks = []
+        for connection in list(self.connections):
+            if connection.close_if_idle():
+                idle_closed += 1
+            elif connection.task is not None:
+                tasks.append(connection.task)
+        completed = abandoned = 0
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=self._drain_timeout)
+            completed, abandoned = len(done), len(pending)
+            for connection in list(self.connections):
+                connection.abort()
+        self._report = DrainReport(completed, abandoned, idle_closed)
+        await server.wait_closed()
+
+    async def dispatch(self, request: Request) -> Response:
+        handler = self._http_handler
+        try:
+            if is_async(handler):
+                return await handler(request)
+            return await asyncio.get_running_loop().run_in_executor(self._executor, handler, request)
+        except Exception as e:
+            print(f"Error handling request: {e}")
+            traceback.print_exc()
+
+            error_body = f"Internal Server Error\n\n{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+            return Response(Status.INTERNAL_SERVER_ERROR).body_(error_body).header_("Content-Type", "text/plain")
+
+    async def next_chunk(self, chunks: Iterator[Chunk]) -> Chunk | None:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, _next_chunk, chunks)
+
+
+def _next_chunk(chunks: Iterator[Chunk]) -> Chunk | None:
+    return next(chunks, None)
+
+
+class _RequestBody:
+    __slots__ = ("remaining", "chunked", "expect_continue", "started", "complete")
+
+    def __init__(self, remaining: int | None, expect_continue: bool):
+        self.remaining = remaining
+        self.chunked = remaining is None
+        self.expect_continue = expect_continue
+        self.started = False
+        self.complete = remaining == 0
+
+    def discardable(self) -> bool:
+        if self.complete:
+            return True
+        if self.chunked or (self.expect_continue and not self.started):
+            return False
+        return (self.remaining or 0) <= _DRAIN_LIMIT
+
+
+class _HttpProtocol(asyncio.Protocol):
+    def __init__(self, server: _AsyncioServer):
+        self._server = server
+        self._transport: asyncio.Transport | None = None
+        self._buffer = bytearray()
+        self._data = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._eof = False
+        self._idle = False
+        self.task: asyncio.Task[None] | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = cast(asyncio.Transport, transport)
+        connection = transport.get_extra_info("socket")
+        if connection is not None:
+            try:
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+        self._server.connections.add(self)
+        self.task = asyncio.get_running_loop().create_task(self._serve())
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+        if len(self._buffer) > _READ_HIGH_WATER and self._transport is not None:
+            self._transport.pause_reading()
+        self._data.set()
+
+    def eof_received(self) -> bool:
+        self._eof = True
+        self._data.set()
+        return True
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._eof = True
+        self._data.set()
+        self._writable.set()
+        self._server.connections.discard(self)
+
+    def pause_writing(self) -> None:
+        self._writable.clear()
+
+    def resume_writing(self) -> None:
+        self._writable.set()
+
+    def close_if_idle(self) -> bool:
+        if self._idle and not self._buffer and self._transport is not None:
+            self._transport.close()
+            return True
+        return False
+
+    def abort(self) -> None:
+        if self._transport is not None:
+            self._transport.abort()
+
+    async def _serve(self) -> None:
+        server = self._server
+        config = server.config
+        handled = 0
+        try:
+            while not server.closing:
+                try:
+                    self._idle = True
+                    async with asyncio.timeout(config._idle_timeout):
+                        head = await self._read_head()
+                    self._idle = False
+                    if head is None:
+                        break
+                    method_name, target, version, headers = _parse_head(head)
+                    body = self._request_body(version, headers)
+                except TimeoutError:
+                    break
+                except _MalformedRequestError as e:
+                    await self._respond(None, "HTTP/1.1", Response(Status.BAD_REQUEST).body_(str(e)), keep_alive=False)
+                    break
+
+                handled += 1
+                keep_alive = (
+                    _wants_keep_alive(version, headers.get("Connection"))
+                    and handled < config._max_requests_per_connection
+                )
+
+                try:
+                    method = Method(method_name)
+                except ValueError:
+                    keep_alive = keep_alive and body.discardable()
+                    if not await self._respond(None, version, Response(Status.NOT_IMPLEMENTED), keep_alive):
+                        break
+                    if not await self._discard(body):
+                        break
+                    continue
+
+                request = Request(method, Uri.of(target), _VERSIONS[version]).headers_(headers)
+                if not body.complete:
+                    request = request.body_(self._body_content(body))
+                response = await server.dispatch(request)
+                keep_alive = keep_alive and not server.closing and body.discardable()
+                if not await self._respond(method, version, response, keep_alive):
+                    break
+                if not await self._discard(body):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._idle = False
+            if self._transport is not None and not self._transport.is_closing():
+                self._transport.close()
+
+    def _request_body(self, version: str, headers: Headers) -> _RequestBody:
+        expect_continue = version == "HTTP/1.1" and (headers.get("Expect") or "").lower() == "100-continue"
+        if "chunked" in (headers.get("Transfer-Encoding") or "").lower():
+            return _RequestBody(None, expect_continue)
+        content_length = headers.get("Content-Length")
+        if not content_length:
+            return _RequestBody(0, False)
+        try:
+            size = int(content_length)
+        except ValueError:
+            raise _MalformedRequestError("Invalid Content-Length") from None
+        if size < 0:
+            raise _MalformedRequestError("Invalid Content-Length")
+        return _RequestBody(size, expect_continue)
+
+    def _body_content(self, body: _RequestBody) -> bytes | Body:
+        size = body.remaining
+        if size is not None and not body.expect_continue and len(self._buffer) >= size:
+            content = bytes(self._buffer[:size])
+            del self._buffer[:size]
+            body.remaining = 0
+            body.started = body.complete = True
+            return content
+        return Body.async_iterator(self._body_chunks(body), size)
+
+    async def _body_chunks(self, body: _RequestBody) -> AsyncIterator[bytes]:
+        if body.expect_continue and not body.started and self._transport is not None:
+            self._transport.write(_CONTINUE)
+        body.started = True
+        if body.chunked:
+            async for chunk in self._read_chunked():
+                yield chunk
+        else:
+            while body.remaining:
+                if not self._buffer and not await self._fill():
+                    raise _MalformedRequestError("Incomplete request body")
+                size = min(body.remaining, len(self._buffer), CHUNK_SIZE)
+                chunk = bytes(self._buffer[:size])
+                del self._buffer[:size]
+                body.remaining -= size
+                yield chunk
+        body.complete = True
+
+    async def _discard(self, body: _RequestBody) -> bool:
+        if body.complete:
+            return True
+        if not body.discardable():
+            return False
+        try:
+            async for _ in self._body_chunks(body):
+                pass
+        except (TimeoutError, _MalformedRequestError):
+            return False
+        return True
+
+    async def _fill(self) -> bool:
+        if self._eof:
+            return False
+        self._data.clear()
+        if self._transport is not None:
+            self._transport.resume_reading()
+        async with asyncio.timeout(self._server.config._idle_timeout):
+            await self._data.wait()
+        return bool(self._buffer) or not self._eof
+
+    async def _read_head(self) -> bytes | None:
+        while True:
+            while self._buffer.startswith(b"\r\n"):
+                del self._buffer[:2]
+            end = self._buffer.find(b"\r\n\r\n")
+            if end >= 0:
+                break
+            if len(self._buffer) > _MAX_HEAD_SIZE:
+                raise _MalformedRequestError("Request head too large")
+            if not await self._fill():
+                return None
+        head = bytes(self._buffer[:end])
+        del self._buffer[: end + 4]
+        return head
+
+    async def _read_exactly(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            if not await self._fill():
+                raise _MalformedRequestError("Incomplete request body")
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    async def _read_line(self) -> bytes:
+        while (end := self._buffer.find(b"\r\n")) < 0:
+            if len(self._buffer) > _MAX_HEAD_SIZE:
+                raise _MalformedRequestError("Line too long")
+            if not await self._fill():
+                raise _MalformedRequestError("Incomplete request body")
+        line = bytes(self._buffer[:end])
+        del self._buffer[: end + 2]
+        return line
+
+    async def _read_chunked(self) -> AsyncIterator[bytes]:
+        while True:
+            line = await self._read_line()
+            try:
+                size = int(line.split(b";", 1)[0], 16)
+            except ValueError:
+                raise _MalformedRequestError("Invalid chunk size") from None
+            if size == 0:
+                break
+            yield await self._read_exactly(size)
+            if await self._read_exactly(2) != b"\r\n":
+                raise _MalformedRequestError("Invalid chunk")
+        while await self._read_line():
+            pass
+
+    async def _respond(self, method: Method | None, version: str, response: Response, keep_alive: bool) -> bool:
+        try:
+            return await self._write_response(method, version, response, keep_alive)
+        finally:
+            response.close()
+
+    async def _write_response(self, method: Method | None, version: str, response: Response, keep_alive: bool) -> bool:
+        transport = self._transport
+        assert transport is not None
+        body = response.body
+        chunked = "chunked" in (response.header("Transfer-Encoding") or "").lower()
+
+        head = [f"HTTP/1.1 {response.status.code} {response.status.description}\r\nDate: {_date()}\r\n"]
+        for name, value in response.headers:
+            if value is not None:
+                head.append(f"{name}: {value}\r\n")
+        if "Content-Length" not in response.headers and not chunked:
+            if body.length is not None:
+                head.append(f"Content-Length: {body.length}\r\n")
+            elif version == "HTTP/1.1":
+                head.append("Transfer-Encoding: chunked\r\n")
+                chunked = True
+            else:
+                keep_alive = False
+        connection = response.header("Connection")
+        if connection is not None:
+            keep_alive = keep_alive and connection.lower() != "close"
+        elif not keep_alive:
+            head.append("Connection: close\r\n")
+        elif version == "HTTP/1.0":
+            head.append("Connection: keep-alive\r\n")
+        head.append("\r\n")
+        encoded_head = "".join(head).encode("latin-1")
+
+        if method is Method.HEAD or (body.length == 0 and not chunked):
+            transport.write(encoded_head)
+        elif isinstance(body, (_MemoryBody, _BufferBody)) and not chunked:
+            transport.writelines((encoded_head, body.buffer))
+        else:
+            transport.write(encoded_head)
+            chunks = body.chunks()
+            while (chunk := await self._server.next_chunk(chunks)) is not None:
+                if transport.is_closing():
+                    return False
+                if not chunk:
+                    continue
+                if chunked:
+                    transport.writelines((b"%x\r\n" % len(chunk), chunk, b"\r\n"))
+                else:
+                    transport.write(chunk)
+                await self._writable.wait()
+            if chunked:
+                transport.write(b"0\r\n\r\n")
+        await self._writable.wait()
+        return keep_alive and not transport.is_closing()
+
+
+def _parse_head(head: bytes) -> tuple[str, str, str, Headers]:
+    lines = head.decode("latin-1").split("\r\n")
+    parts = lines[0].split(" ")
+    if len(parts) != 3:
+        raise _MalformedRequestError("Malformed request line")
+    method, target, version = parts
+    if version not in _VERSIONS:
+        raise _MalformedRequestError(f"Unsupported HTTP version: {version}")
+    headers = []
+    for line in lines[1:]:
+        name, separator, value = line.partition(":")
+        if not separator or not name or name != name.strip():
+            raise _MalformedRequestError("Malformed header")
+        headers.append((name, value.strip()))
+    return method, target, version, Headers(headers)
+
+
+def _wants_keep_alive(version: str, connection: str | None) -> bool:
+    tokens = {token.strip().lower() for token in connection.split(",")} if connection else set()
+    if version == "HTTP/1.1":
+        return "close" not in tokens
+    return "keep-alive" in tokens
+
+
+_date_cache: tuple[int, str] = (0, "")
+
+
+def _date() -> str:
+    global _date_cache
+    now = int(time.time())
+    if _date_cache[0] != now:
+        _date_cache = (now, formatdate(now, usegmt=True))
+    return _date_cache[1]
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import mmap
+import os
+import signal
+import socket
+import struct
+import sys
+import threading
+import time
+import traceback
+from typing import NoReturn
+
+from http4py.core import HttpHandler
+
+from .server import DrainReport, Http4pyServer
+from .server_config import ServerConfig
+
+_MONITOR_INTERVAL = 0.1
+_RESTART_BACKOFF = 1.0
+_EXIT_GRACE = 1.0
+_DEADLINE = struct.Struct("d")
+_REPORT = struct.Struct("3q")
+
+
+class PreFork(ServerConfig):
+    def __init__(
+        self,
+        config: ServerConfig,
+        workers: int | None = None,
+        port: int = 8080,
+        host: str = "localhost",
+        backlog: int = 128,
+        tcp_nodelay: bool = True,
+        reuse_port: bool = False,
+        shutdown_timeout: float = 10.0,
+    ):
+        if reuse_port and not hasattr(socket, "SO_REUSEPORT"):
+            raise ValueError("SO_REUSEPORT is not supported on this platform")
+        if type(config).serve_on is ServerConfig.serve_on:
+            raise TypeError(f"PreFork needs a config that implements serve_on, which {type(config).__name__} does not")
+        self._config = config
+        self._workers = workers or os.cpu_count() or 1
+        self._port = port
+        self._host = host
+        self._backlog = backlog
+        self._tcp_nodelay = tcp_nodelay
+        self._reuse_port = reuse_port
+        self._shutdown_timeout = shutdown_timeout
+
+    def serve(self, http: HttpHandler) -> Http4pyServer:
+        return _PreForkServer(self, http)
+
+    def serve_on(self, http: HttpHandler, listener: socket.socket) -> Http4pyServer:
+        return _PreForkServer(self, http, listener)
+
+    def _socket(self, port: int, listen: bool) -> socket.socket:
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if self._reuse_port:
+                listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            if self._tcp_nodelay:
+                listener.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            listener.bind((self._host, port))
+            if listen:
+                listener.listen(self._backlog)
+        except BaseException:
+            listener.close()
+            raise
+        return listener
+
+
+class _PreForkServer(Http4pyServer):
+    def __init__(self, config: PreFork, http_handler: HttpHandler, listener: socket.socket | None = None):
+        self._config = config
+        self._http_handler = http_handler
+        self._given_listener = listener
+        self._listener: socket.socket | None = None
+        self._workers: dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._stopped = threading.Event()
+        self._monitor: threading.Thread | None = None
+        self._deadline = mmap.mmap(-1, _DEADLINE.size)
+        self._reports: tuple[int, int] | None = None
+
+    def start(self) -> Http4pyServer:
+        if self._listener is not None:
+            return self
+
+        config = self._config
+        if self._given_listener is not None:
+            self._listener = self._given_listener
+        else:
+            self._listener = config._socket(config._port, listen=not config._reuse_port)
+        self._reports = os.pipe()
+        os.set_blocking(self._reports[0], False)
+        _DEADLINE.pack_into(self._deadline, 0, 0.0)
+        self._stopping.clear()
+        self._stopped.clear()
+        for _ in range(config._workers):
+            self._spawn()
+        self._monitor = threading.Thread(target=self._supervise, name="http4py-prefork", daemon=True)
+        self._monitor.start()
+        return self
+
+    def stop(self) -> Http4pyServer:
+        self.drain(self._config._shutdown_timeout)
+        return self
+
+    def drain(self, timeout: float = 30.0) -> DrainReport:
+        if self._listener is None or self._reports is None:
+            return DrainReport()
+
+        self._stopping.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+
+        with self._lock:
+            deadline = time.monotonic() + timeout
+            _DEADLINE.pack_into(self._deadline, 0, deadline)
+            for pid in self._workers:
+                _signal(pid, signal.SIGTERM)
+            self._listener.close()
+            while self._workers and time.monotonic() < deadline + _EXIT_GRACE:
+                self._reap()
+                time.sleep(_MONITOR_INTERVAL / 10)
+            for pid in list(self._workers):
+                _signal(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            self._workers.clear()
+
+        report = self._collect_reports()
+        self._listener = None
+        self._stopped.set()
+        return report
+
+    def _collect_reports(self) -> DrainReport:
+        assert self._reports is not None
+        reader, writer = self._reports
+        os.close(writer)
+        data = b""
+        try:
+            while chunk := os.read(reader, 65536):
+                data += chunk
+        except BlockingIOError:
+            pass
+        os.close(reader)
+        self._reports = None
+        report = DrainReport()
+        for offset in range(0, len(data) - len(data) % _REPORT.size, _REPORT.size):
+            report += DrainReport(*_REPORT.unpack_from(data, offset))
+        return report
+
+    def block(self) -> None:
+        terminated = threading.Event()
+        previous = None
+        if threading.current_thread() is threading.main_thread():
+            previous = signal.signal(signal.SIGTERM, lambda signum, frame: terminated.set())
+        try:
+            while not self._stopped.is_set() and not terminated.wait(0.5):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if previous is not None:
+                signal.signal(signal.SIGTERM, previous)
+        self.stop()
+
+    def port(self) -> int:
+        if self._listener is not None:
+            return int(self._listener.getsockname()[1])
+        return self._config._port
+
+    def workers(self) -> list[int]:
+        with self._lock:
+            return list(self._workers)
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker()
+        self._workers[pid] = time.monotonic()
+
+    def _supervise(self) -> None:
+        while not self._stopping.wait(_MONITOR_INTERVAL):
+            with self._lock:
+                if self._stopping.is_set():
+                    return
+                for pid, started in self._reap():
+                    print(f"Worker {pid} exited unexpectedly, restarting", file=sys.stderr)
+                    if time.monotonic() - started < _RESTART_BACKOFF:
+                        self._stopping.wait(_RESTART_BACKOFF)
+                    if not self._stopping.is_set():
+                        self._spawn()
+
+    def _reap(self) -> list[tuple[int, float]]:
+        exited = []
+        for pid, started in list(self._workers.items()):
+            try:
+                reaped, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                reaped = pid
+            if reaped == pid:
+                del self._workers[pid]
+                exited.append((pid, started))
+        return exited
+
+    def _run_worker(self) -> NoReturn:
+        code = 0
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            stopping = threading.Event()
+            signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
+
+            config = self._config
+            listener = self._listener
+            assert listener is not None
+            if config._reuse_port and self._given_listener is None:
+                port = listener.getsockname()[1]
+                listener.close()
+                listener = config._socket(port, listen=True)
+
+            server = config._config.serve_on(self._http_handler, listener).start()
+            serving = threading.Thread(target=server.block, daemon=True)
+            serving.start()
+            while not stopping.wait(_MONITOR_INTERVAL) and serving.is_alive():
+                pass
+            if stopping.is_set():
+                (deadline,) = _DEADLINE.unpack_from(self._deadline, 0)
+                timeout = max(deadline - time.monotonic(), 0.0) if deadline else config._shutdown_timeout
+                self._report(server.drain(timeout))
+                code = 0
+            else:
+                server.stop()
+                code = 1
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    def _report(self, report: DrainReport) -> None:
+        if self._reports is not None:
+            os.write(self._reports[1], _REPORT.pack(report.completed, report.abandoned, report.idle_closed))
+
+
+def _signal(pid: int, signum: int) -> None:
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
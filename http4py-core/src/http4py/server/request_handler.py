@@ -1,18 +1,92 @@
 from __future__ import annotations
 
+import shutil
 import traceback
 from http.server import BaseHTTPRequestHandler
-from typing import Any
-from urllib.parse import parse_qs, urlparse
+from io import BufferedIOBase, BufferedReader, RawIOBase
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, cast
 
 from http4py.core import HttpHandler, Request, Response, Method, Uri, Status
+from http4py.core.body import CHUNK_SIZE, _StreamBody
+
+
+class _BoundedReader(RawIOBase):
+    def __init__(self, source: BufferedIOBase, length: int):
+        self._source = source
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview | bytearray) -> int:  # type: ignore[override]
+        if self._remaining <= 0:
+            return 0
+        size = self._source.readinto(memoryview(buffer)[: min(len(buffer), self._remaining)])
+        self._remaining = self._remaining - size if size else 0
+        return size
+
+    @property
+    def remaining(self) -> int:
+        return self._remaining
+
+    def discard(self) -> None:
+        while self._remaining > 0 and (skipped := len(self._source.read(min(self._remaining, CHUNK_SIZE)))):
+            self._remaining -= skipped
+
+
+_DRAIN_LIMIT = 1024 * 1024
+
+
+class _MalformedRequestError(Exception):
+    pass
 
 
 class Http4pyRequestHandler(BaseHTTPRequestHandler):
-    def __init__(self, http_handler: HttpHandler, *args: Any, **kwargs: Any):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def __init__(
+        self,
+        http_handler: HttpHandler,
+        *args: Any,
+        spool_threshold: int | None = None,
+        idle_timeout: float = 5.0,
+        max_requests_per_connection: int = 100,
+        requests_handled: int = 0,
+        **kwargs: Any,
+    ):
         self.http_handler = http_handler
+        self.spool_threshold = spool_threshold
+        self.idle_timeout = idle_timeout
+        self.max_requests_per_connection = max_requests_per_connection
+        self.requests_handled = requests_handled
+        self._body_reader: _BoundedReader | None = None
         super().__init__(*args, **kwargs)
 
+    def setup(self) -> None:
+        super().setup()
+        self.connection.settimeout(self.idle_timeout)
+
+    def handle(self) -> None:
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self._request_waiting():
+            self.handle_one_request()
+
+    def _request_waiting(self) -> bool:
+        self.connection.setblocking(False)
+        try:
+            return bool(self.rfile.peek(1))  # type: ignore[attr-defined]
+        except OSError:
+            self.close_connection = True
+            return False
+        finally:
+            self.connection.settimeout(self.idle_timeout)
+
+    def _server_closing(self) -> bool:
+        return bool(getattr(self.server, "closing", False))
+
     def do_GET(self) -> None:
         self._handle_request()
 
@@ -25,71 +99,123 @@ class Http4pyRequestHandler(BaseHTTPRequestHandler):
     def do_DELETE(self) -> None:
         self._handle_request()
 
+    def do_PATCH(self) -> None:
+        self._handle_request()
+
+    def do_HEAD(self) -> None:
+        self._handle_request()
+
+    def do_OPTIONS(self) -> None:
+        self._handle_request()
+
     def _handle_request(self) -> None:
+        self.requests_handled += 1
+        self._body_reader = None
+        request: Request | None = None
         try:
             request = self._convert_to_http4py_request()
             response = self.http_handler(request)
-            self._send_http4py_response(response)
+        except _MalformedRequestError as e:
+            self.close_connection = True
+            response = Response(Status.BAD_REQUEST).body_(str(e))
         except Exception as e:
             print(f"Error handling request: {e}")
             traceback.print_exc()
 
             error_body = f"Internal Server Error\n\n{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
-            error_response = (
-                Response(Status.INTERNAL_SERVER_ERROR).body_(error_body).header_("Content-Type", "text/plain")
-            )
-            self._send_http4py_response(error_response)
+            response = Response(Status.INTERNAL_SERVER_ERROR).body_(error_body).header_("Content-Type", "text/plain")
+
+        try:
+            self._send_http4py_response(response)
+        finally:
+            response.close()
+            if request is not None:
+                request.close()
+            if self._body_reader is not None and not self.close_connection:
+                self._body_reader.discard()
 
     def _convert_to_http4py_request(self) -> Request:
         method = Method(self.command)
+        uri = Uri.of(self.path)
 
-        parsed_url = urlparse(self.path)
-        uri = Uri().path_(parsed_url.path)
+        request = Request(method, uri).headers_(self.headers.items())
 
-        if parsed_url.query:
-            query_params = parse_qs(parsed_url.query)
-            for key, values in query_params.items():
-                for value in values:
-                    uri = uri.query_(key, value)
+        content_length_header = request.header("Content-Length")
+        if content_length_header is None:
+            content_length = 0
+        elif content_length_header.isascii() and content_length_header.isdigit():
+            content_length = int(content_length_header)
+        else:
+            raise _MalformedRequestError("Invalid Content-Length")
 
-        headers = [(name, value) for name, value in self.headers.items()]
+        if content_length > 0:
+            request = request.body_(self._request_body(content_length))
 
-        content_length_header = None
-        for name, value in headers:
-            if name.lower() == "content-length":
-                content_length_header = value
-                break
-        
-        content_length = int(content_length_header) if content_length_header else 0
-        body_data = self.rfile.read(content_length) if content_length > 0 else b""
+        return request
 
-        request = Request(method, uri).headers_(headers)
-        if body_data:
-            request = request.body_(body_data)
+    def _request_body(self, content_length: int) -> _StreamBody:
+        self._body_reader = _BoundedReader(self.rfile, content_length)
+        stream = BufferedReader(self._body_reader, CHUNK_SIZE)
+        if self.spool_threshold is None:
+            return _StreamBody(cast(BinaryIO, stream), content_length)
 
-        return request
+        spool = SpooledTemporaryFile(max_size=self.spool_threshold)
+        try:
+            shutil.copyfileobj(stream, spool, CHUNK_SIZE)
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        return _StreamBody(cast(BinaryIO, spool), content_length)
+
+    def _must_close(self) -> bool:
+        if self.close_connection or self.requests_handled >= self.max_requests_per_connection:
+            return True
+        if self._server_closing():
+            return True
+        if "chunked" in (self.headers.get("Transfer-Encoding") or "").lower():
+            return True
+        reader = self._body_reader
+        return reader is not None and reader.remaining > _DRAIN_LIMIT
 
     def _send_http4py_response(self, response: Response) -> None:
         self.send_response(response.status.code)
 
-        body_bytes = response.body.bytes
-        
-        # Check if Content-Length header already exists
-        has_content_length = any(name.lower() == "content-length" for name, _ in response.headers)
-        
-        if not has_content_length:
-            if body_bytes:
-                self.send_header("Content-Length", str(len(body_bytes)))
+        body = response.body
+        chunked = "chunked" in (response.header("Transfer-Encoding") or "").lower()
+
+        close = self._must_close()
+
+        if "Content-Length" not in response.headers and not chunked:
+            if body.length is not None:
+                self.send_header("Content-Length", str(body.length))
+            elif self.request_version != "HTTP/1.0":
+                self.send_header("Transfer-Encoding", "chunked")
+                chunked = True
             else:
-                self.send_header("Content-Length", "0")
+                close = True
 
         for name, value in response.headers:
             if value is not None:
                 self.send_header(name, value)
-            
-        # Always close connection to prevent reuse issues
-        self.send_header("Connection", "close")
-        self.end_headers()
 
-        if body_bytes:
-            self.wfile.write(body_bytes)
+        if "Connection" not in response.headers:
+            if close:
+                self.send_header("Connection", "close")
+            elif self.request_version == "HTTP/1.0":
+                self.send_header("Connection", "keep-alive")
+        self.end_headers()
+        if close:
+            self.close_connection = True
+
+        if self.command == "HEAD":
+            return
+
+        if chunked:
+            for chunk in body.chunks():
+                if chunk:
+                    self.wfile.write(b"".join((b"%x\r\n" % len(chunk), chunk, b"\r\n")))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            for chunk in body.chunks():
+                self.wfile.write(chunk)
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class DrainReport:
+    completed: int = 0
+    abandoned: int = 0
+    idle_closed: int = 0
+
+    def __add__(self, other: DrainReport) -> DrainReport:
+        return DrainReport(
+            self.completed + other.completed,
+            self.abandoned + other.abandoned,
+            self.idle_closed + other.idle_closed,
+        )
+
+
 class Http4pyServer(ABC):
     @abstractmethod
     def start(self) -> Http4pyServer:
@@ -23,3 +38,7 @@ class Http4pyServer(ABC):
     @abstractmethod
     def port(self) -> int:
         pass
+
+    def drain(self, timeout: float = 30.0) -> DrainReport:
+        self.stop()
+        return DrainReport()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import socket
 from abc import ABC, abstractmethod
 
 from http4py.core import HttpHandler
@@ -10,3 +11,6 @@ class ServerConfig(ABC):
     @abstractmethod
     def serve(self, http: HttpHandler) -> Http4pyServer:
         pass
+
+    def serve_on(self, http: HttpHandler, listener: socket.socket) -> Http4pyServer:
+        raise TypeError(f"{type(self).__name__} cannot serve on an existing listening socket")
@@ -1,44 +1,359 @@
 from __future__ import annotations
 
+import selectors
+import socket
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer
-from typing import Any
+from typing import Any, NamedTuple, cast
 
 from http4py.core import HttpHandler
 
 from .request_handler import Http4pyRequestHandler
-from .server import Http4pyServer
+from .server import DrainReport, Http4pyServer
 from .server_config import ServerConfig
 
 
+_SERVICE_UNAVAILABLE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"Content-Length: 19\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+    b"Service Unavailable"
+)
+
+
+class _IdleConnection(NamedTuple):
+    client_address: Any
+    requests_handled: int
+    expires_at: float
+
+
+class _Http4pyHTTPServer(HTTPServer):
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler: Any,
+        idle_timeout: float,
+        listener: socket.socket | None = None,
+    ):
+        super().__init__(server_address, handler, bind_and_activate=listener is None)
+        if listener is not None:
+            self.socket.close()
+            self.socket = listener
+            self.server_address = listener.getsockname()[:2]
+        self.closing = False
+        self._handler_factory: Callable[..., Http4pyRequestHandler] = handler
+        self._idle_timeout = idle_timeout
+        self._wakeup, self._wakeup_writer = socket.socketpair()
+        self._wakeup.setblocking(False)
+        self._wakeup_writer.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.socket, selectors.EVENT_READ)
+        self._selector.register(self._wakeup, selectors.EVENT_READ)
+        self._activity = threading.Condition()
+        self._in_flight: set[socket.socket] = set()
+        self._idle: dict[socket.socket, _IdleConnection] = {}
+        self._returned: list[socket.socket] = []
+        self._serving = False
+        self._shutdown_requested = False
+        self._is_shut_down = threading.Event()
+        self._is_shut_down.set()
+        self._completed = 0
+        self._idle_closed = 0
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        with self._activity:
+            self._serving = True
+        self._is_shut_down.clear()
+        try:
+            while not self._shutdown_requested:
+                ready = self._selector.select(self._select_timeout(poll_interval))
+                if self._shutdown_requested:
+                    break
+                for key, _ in ready:
+                    if key.fileobj is self.socket:
+                        self._accept()
+                    elif key.fileobj is self._wakeup:
+                        self._register_returned()
+                    else:
+                        self._resume(cast(socket.socket, key.fileobj))
+                self._close_idle(expired_only=not self.closing)
+                self.service_actions()
+        finally:
+            self._shutdown_requested = False
+            with self._activity:
+                self._serving = False
+            self._close_idle(expired_only=False)
+            self._is_shut_down.set()
+
+    def shutdown(self) -> None:
+        self._shutdown_requested = True
+        self._wake()
+        self._is_shut_down.wait()
+
+    def close_idle_connections(self) -> None:
+        self.closing = True
+        self._wake()
+
+    def _accept(self) -> None:
+        try:
+            connection, client_address = self.get_request()
+        except OSError:
+            return
+        self.process_request(connection, client_address)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._dispatch(request, client_address, 0)
+
+    def _dispatch(self, connection: socket.socket, client_address: Any, requests_handled: int) -> None:
+        self._accept_work(connection)
+        handler = self._run_handler(connection, client_address, requests_handled)
+        self._work_done(connection, client_address, handler, requests_handled)
+
+    def _accept_work(self, connection: socket.socket) -> None:
+        with self._activity:
+            self._in_flight.add(connection)
+
+    def _run_handler(
+        self, connection: socket.socket, client_address: Any, requests_handled: int
+    ) -> Http4pyRequestHandler | None:
+        try:
+            return self._handler_factory(connection, client_address, self, requests_handled=requests_handled)
+        except Exception:
+            self.handle_error(connection, client_address)
+            return None
+
+    def _work_done(
+        self,
+        connection: socket.socket,
+        client_address: Any,
+        handler: Http4pyRequestHandler | None,
+        requests_handled: int,
+    ) -> None:
+        with self._activity:
+            self._in_flight.discard(connection)
+            if self.closing and handler is not None:
+                self._completed += handler.requests_handled - requests_handled
+            keep_alive = handler is not None and not handler.close_connection and self._serving and not self.closing
+            if keep_alive and handler is not None:
+                expires_at = time.monotonic() + self._idle_timeout
+                self._idle[connection] = _IdleConnection(client_address, handler.requests_handled, expires_at)
+                self._returned.append(connection)
+            self._activity.notify_all()
+        if keep_alive:
+            self._wake()
+        else:
+            self.shutdown_request(connection)
+
+    def _register_returned(self) -> None:
+        try:
+            while self._wakeup.recv(4096):
+                pass
+        except OSError:
+            pass
+        with self._activity:
+            returned, self._returned = self._returned, []
+        for connection in returned:
+            self._selector.register(connection, selectors.EVENT_READ)
+
+    def _resume(self, connection: socket.socket) -> None:
+        if self.closing:
+            return
+        with self._activity:
+            idle = self._idle.pop(connection, None)
+        if idle is None:
+            return
+        self._selector.unregister(connection)
+        self._dispatch(connection, idle.client_address, idle.requests_handled)
+
+    def _select_timeout(self, poll_interval: float) -> float:
+        with self._activity:
+            if not self._idle:
+                return poll_interval
+            next_expiry = min(idle.expires_at for idle in self._idle.values())
+        return max(min(poll_interval, next_expiry - time.monotonic()), 0.0)
+
+    def _close_idle(self, expired_only: bool) -> None:
+        now = time.monotonic()
+        with self._activity:
+            closed = [
+                connection for connection, idle in self._idle.items() if not expired_only or idle.expires_at <= now
+            ]
+            for connection in closed:
+                del self._idle[connection]
+            self._returned = [connection for connection in self._returned if connection in self._idle]
+            if not expired_only:
+                self._idle_closed += len(closed)
+            self._activity.notify_all()
+        for connection in closed:
+            try:
+                self._selector.unregister(connection)
+            except KeyError:
+                pass
+            self.shutdown_request(connection)
+
+    def _wake(self) -> None:
+        try:
+            self._wakeup_writer.send(b"\0")
+        except OSError:
+            pass
+
+    def drain(self, timeout: float) -> DrainReport:
+        with self._activity:
+            self.close_idle_connections()
+            self._activity.wait_for(lambda: not self._in_flight and not self._idle, timeout)
+            for connection in self._in_flight:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            return DrainReport(self._completed, len(self._in_flight), self._idle_closed)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._selector.close()
+        self._wakeup.close()
+        self._wakeup_writer.close()
+
+
+class _PooledHTTPServer(_Http4pyHTTPServer):
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler: Any,
+        idle_timeout: float,
+        workers: int,
+        accept_queue: int,
+        listener: socket.socket | None = None,
+    ):
+        self.request_queue_size = max(accept_queue, 1)
+        super().__init__(server_address, handler, idle_timeout, listener)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http4py-worker")
+        self._slots = threading.BoundedSemaphore(workers + accept_queue)
+
+    def _dispatch(self, connection: socket.socket, client_address: Any, requests_handled: int) -> None:
+        if not self._slots.acquire(blocking=False):
+            self._reject(connection)
+            return
+        self._accept_work(connection)
+        try:
+            self._pool.submit(self._process_in_worker, connection, client_address, requests_handled)
+        except RuntimeError:
+            self._slots.release()
+            self._work_done(connection, client_address, None, requests_handled)
+
+    def _process_in_worker(self, connection: socket.socket, client_address: Any, requests_handled: int) -> None:
+        try:
+            handler = self._run_handler(connection, client_address, requests_handled)
+        finally:
+            self._slots.release()
+        self._work_done(connection, client_address, handler, requests_handled)
+
+    def _reject(self, request: socket.socket) -> None:
+        try:
+            request.settimeout(1)
+            request.sendall(_SERVICE_UNAVAILABLE)
+            request.setblocking(False)
+            request.recv(65536)
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
 class StdLibServer(ServerConfig):
-    def __init__(self, port: int = 8080):
+    def __init__(
+        self,
+        port: int = 8080,
+        spool_threshold: int | None = None,
+        workers: int | None = None,
+        accept_queue: int = 64,
+        idle_timeout: float = 5.0,
+        max_requests_per_connection: int = 100,
+    ):
         self._port = port
+        self._spool_threshold = spool_threshold
+        self._workers = workers
+        self._accept_queue = accept_queue
+        self._idle_timeout = idle_timeout
+        self._max_requests_per_connection = max_requests_per_connection
 
     def serve(self, http: HttpHandler) -> Http4pyServer:
+        return self._serve(http, None)
+
+    def serve_on(self, http: HttpHandler, listener: socket.socket) -> Http4pyServer:
+        return self._serve(http, listener)
+
+    def _serve(self, http: HttpHandler, listener: socket.socket | None) -> Http4pyServer:
+        workers = self._workers
+        accept_queue = self._accept_queue
+        idle_timeout = self._idle_timeout
+        connection_settings: dict[str, Any] = {
+            "spool_threshold": self._spool_threshold,
+            "idle_timeout": self._idle_timeout,
+            "max_requests_per_connection": self._max_requests_per_connection,
+        }
+
         class _StdLibServer(Http4pyServer):
             def __init__(self, host: str, port: int, http_handler: HttpHandler):
                 self._host = host
                 self._port = port
                 self._http_handler = http_handler
-                self._server: HTTPServer | None = None
+                self._server: _Http4pyHTTPServer | None = None
 
             def start(self) -> Http4pyServer:
                 if self._server is not None:
                     return self
 
                 def handler_factory(*args: Any, **kwargs: Any) -> Http4pyRequestHandler:
-                    return Http4pyRequestHandler(self._http_handler, *args, **kwargs)
+                    return Http4pyRequestHandler(self._http_handler, *args, **connection_settings, **kwargs)
 
-                self._server = HTTPServer((self._host, self._port), handler_factory)
+                address = (self._host, self._port)
+                if workers is None:
+                    self._server = _Http4pyHTTPServer(address, handler_factory, idle_timeout, listener)
+                else:
+                    self._server = _PooledHTTPServer(
+                        address, handler_factory, idle_timeout, workers, accept_queue, listener
+                    )
                 return self
 
             def stop(self) -> Http4pyServer:
                 if self._server is not None:
+                    self._server.close_idle_connections()
                     self._server.shutdown()
                     self._server.server_close()
                     self._server = None
                 return self
 
+            def drain(self, timeout: float = 30.0) -> DrainReport:
+                server = self._server
+                if server is None:
+                    return DrainReport()
+                self._server = None
+
+                accepting = threading.Thread(target=server.shutdown, daemon=True)
+                accepting.start()
+                report = server.drain(timeout)
+
+                def close() -> None:
+                    accepting.join()
+                    server.server_close()
+
+                if report.abandoned:
+                    threading.Thread(target=close, daemon=True).start()
+                else:
+                    close()
+                return report
+
             def block(self) -> None:
                 if self._server is not None:
                     self._server.serve_forever()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+import requests
+from http4py.client import AsyncioClient
+from http4py.core import HttpHandler, Request, Response
+from http4py.core.http import is_async
+from http4py.core.method import GET, POST
+from http4py.core.status import INTERNAL_SERVER_ERROR, OK
+from http4py.server import AsyncioServer, Http4pyServer
+from http4py.testing import HttpClientContract
+
+
+async def call_once(request: Request) -> Response:
+    client = AsyncioClient()
+    try:
+        return await client(request)
+    finally:
+        await client.close()
+
+
+class TestAsyncioClient(HttpClientContract):
+    def create_client(self) -> HttpHandler:
+        return lambda request: asyncio.run(call_once(request))
+
+
+lock = threading.Lock()
+active = peak = 0
+
+
+def backend(request: Request) -> Response:
+    global active, peak
+    with lock:
+        active += 1
+        peak = max(peak, active)
+    time.sleep(float(request.query("sleep") or 0))
+    with lock:
+        active -= 1
+    response = Response(OK).body_(request.query("id") or request.body.bytes)
+    return response.header_("Set-Cookie", "a=1").header_("Set-Cookie", "b=2")
+
+
+@pytest.fixture(scope="module")
+def server() -> Iterator[Http4pyServer]:
+    server = AsyncioServer(0, workers=16).serve(backend).start()
+    threading.Thread(target=server.block, daemon=True).start()
+    yield server
+    server.stop()
+
+
+def run(
+    client: AsyncioClient, *requests: Request, max_concurrency: int = 10, timeout: float | None = None
+) -> list[Response]:
+    async def send() -> list[Response]:
+        try:
+            return await client.send_all(requests, max_concurrency, timeout)
+        finally:
+            await client.close()
+
+    return asyncio.run(send())
+
+
+class TestAsyncioClientBehaviour:
+    def test_is_an_async_http_handler(self) -> None:
+        assert is_async(AsyncioClient())
+
+    def test_send_all_returns_responses_in_request_order(self, server: Http4pyServer) -> None:
+        url = f"http://localhost:{server.port()}"
+        delays = [0.2, 0.0, 0.1, 0.05]
+
+        responses = run(AsyncioClient(), *(Request(GET, f"{url}/?id={i}&sleep={d}") for i, d in enumerate(delays)))
+
+        assert [response.body.text for response in responses] == ["0", "1", "2", "3"]
+
+    def test_send_all_bounds_concurrency(self, server: Http4pyServer) -> None:
+        global peak
+        peak = 0
+        url = f"http://localhost:{server.port()}/?sleep=0.05"
+
+        responses = run(AsyncioClient(), *(Request(GET, url) for _ in range(12)), max_concurrency=3)
+
+        assert [response.status for response in responses] == [OK] * 12
+        assert peak == 3
+
+    def test_times_out_slow_requests_without_failing_the_batch(self, server: Http4pyServer) -> None:
+        url = f"http://localhost:{server.port()}"
+        started = time.monotonic()
+
+        slow, fast = run(AsyncioClient(), Request(GET, f"{url}/?sleep=2"), Request(GET, f"{url}/?id=fast"), timeout=0.3)
+
+        assert time.monotonic() - started < 1.5
+        assert slow.status == INTERNAL_SERVER_ERROR
+        assert "timed out" in slow.body.text
+        assert fast.body.text == "fast"
+
+    def test_reuses_pooled_connections(self, server: Http4pyServer) -> None:
+        client = AsyncioClient()
+        url = f"http://localhost:{server.port()}/"
+
+        async def sequential() -> int:
+            for _ in range(5):
+                assert (await client(Request(GET, url))).status == OK
+            connections = len(client._pool._hosts()[("http", "localhost", server.port())].idle)
+            await client.close()
+            return connections
+
+        assert asyncio.run(sequential()) == 1
+
+    def test_sends_bodies_and_keeps_repeated_header_names(self, server: Http4pyServer) -> None:
+        url = f"http://localhost:{server.port()}/"
+
+        [sized, streamed] = run(
+            AsyncioClient(), Request(POST, url).body_("payload"), Request(POST, url).body_(iter([b"str", b"eamed"]))
+        )
+
+        assert sized.body.text == "payload"
+        assert streamed.body.text == "streamed"
+        assert sized.headers.get_all("Set-Cookie") == ["a=1", "b=2"]
+
+    def test_can_be_used_from_several_event_loops(self, server: Http4pyServer) -> None:
+        client = AsyncioClient(max_connections_per_host=1)
+        url = f"http://localhost:{server.port()}/?sleep=0.05"
+
+        first = run(client, Request(GET, url), Request(GET, url))
+        second = run(client, Request(GET, url), Request(GET, url))
+
+        assert [response.status for response in first + second] == [OK] * 4
+
+    def test_reads_generator_bodies_off_the_event_loop(self, server: Http4pyServer) -> None:
+        def slow_chunks() -> Iterator[bytes]:
+            for chunk in (b"slow", b"ly"):
+                time.sleep(0.2)
+                yield chunk
+
+        async def send() -> tuple[Response, int]:
+            client = AsyncioClient()
+            ticks = 0
+
+            async def tick() -> None:
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker = asyncio.create_task(tick())
+            try:
+                response = await client(Request(POST, f"http://localhost:{server.port()}/").body_(slow_chunks()))
+                return response, ticks
+            finally:
+                ticker.cancel()
+                await client.close()
+
+        response, ticks = asyncio.run(send())
+
+        assert response.body.text == "slowly"
+        assert ticks > 10
+
+    def test_forwards_a_streamed_request_body_from_an_async_handler(self, server: Http4pyServer) -> None:
+        client = AsyncioClient()
+        backend_url = f"http://localhost:{server.port()}/"
+
+        async def proxy(request: Request) -> Response:
+            return await client(Request(POST, backend_url).body_(request.body))
+
+        front = AsyncioServer(0).serve(proxy).start()
+        try:
+            chunks = (f"part {i};".encode() for i in range(1000))
+            response = requests.post(f"http://localhost:{front.port()}/", data=chunks, timeout=5)
+
+            assert response.status_code == 200
+            assert response.text == "".join(f"part {i};" for i in range(1000))
+        finally:
+            front.stop()
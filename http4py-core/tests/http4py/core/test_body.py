@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from http4py.core import Body, Request, Response
+from http4py.core.body import _MemoryBody
+from http4py.core.method import POST
+from http4py.core.status import OK
+
+
+class TestMemoryBody:
+    def test_bytes_are_not_decoded_until_text_is_read(self) -> None:
+        body = _MemoryBody(b"\x89PNG\r\n\x1a\n\x00\xff")
+
+        assert body.bytes == b"\x89PNG\r\n\x1a\n\x00\xff"
+        assert body.length == 10
+        assert body._text is None
+
+    def test_text_is_not_encoded_until_bytes_are_read(self) -> None:
+        body = _MemoryBody("hello")
+
+        assert body.text == "hello"
+        assert body._bytes is None
+        assert body.bytes == b"hello"
+        assert body.bytes is body.bytes
+
+    def test_decoded_text_is_cached(self) -> None:
+        body = _MemoryBody(b"caf\xc3\xa9")
+
+        assert body.text == "café"
+        assert body.text is body.text
+
+    def test_equality_compares_encoded_content(self) -> None:
+        assert _MemoryBody("abc") == _MemoryBody(b"abc")
+        assert hash(_MemoryBody("abc")) == hash(_MemoryBody(b"abc"))
+
+
+class TestBodyCharset:
+    def test_body_string_honours_content_type_charset(self) -> None:
+        request = Request(POST, "/").header_("Content-Type", "text/plain; charset=ISO-8859-1").body_(b"caf\xe9")
+
+        assert request.body_string() == "café"
+
+    def test_text_body_is_encoded_with_charset_set_before_it(self) -> None:
+        response = Response(OK).header_("Content-Type", "text/plain; charset=latin-1").body_("café")
+
+        assert response.body.bytes == b"caf\xe9"
+
+    def test_text_body_is_encoded_with_charset_set_after_it(self) -> None:
+        response = Response(OK).body_("café").header_("Content-Type", 'text/html; charset="iso-8859-1"')
+
+        assert response.body.bytes == b"caf\xe9"
+        assert response.body.length == 4
+
+    def test_unknown_charset_falls_back_to_utf8(self) -> None:
+        response = Response(OK).header_("Content-Type", "text/plain; charset=bogus").body_("café")
+
+        assert response.body.bytes == b"caf\xc3\xa9"
+        assert response.body_string() == "café"
+
+    def test_text_that_the_charset_cannot_encode_fails_when_the_message_is_built(self) -> None:
+        with pytest.raises(UnicodeEncodeError):
+            Response(OK).header_("Content-Type", "text/plain; charset=ascii").body_("café")
+
+        with pytest.raises(UnicodeEncodeError):
+            Response(OK).body_("café").header_("Content-Type", "text/plain; charset=ascii")
+
+    def test_defaults_to_utf8(self) -> None:
+        response = Response(OK).body_("café").headers_([("Content-Type", "text/plain")])
+
+        assert response.body.bytes == b"caf\xc3\xa9"
+        assert response.body_string() == "café"
+
+    def test_finding_the_charset_does_not_index_the_headers(self) -> None:
+        response = (
+            Response(OK)
+            .header_("Content-Type", "text/plain; charset=latin-1")
+            .headers_([("X-One", "1"), ("Content-Type", "text/html; charset=utf-16")])
+            .body_("café")
+        )
+
+        assert response.body.bytes == b"caf\xe9"
+        assert response.headers._index is None
+
+
+class TestBufferBody:
+    def test_wraps_buffers_without_copying(self) -> None:
+        payload = bytearray(b"0123456789")
+        response = Response(OK).body_(memoryview(payload)[2:8])
+
+        assert response.body.length == 6
+        assert response.body.buffer.obj is payload
+        assert response.body.buffer.readonly
+        assert response.body.bytes == b"234567"
+        assert response.body.text == "234567"
+
+    def test_hash_matches_equal_bodies_and_is_computed_once(self) -> None:
+        payload = bytearray(b"abcdef")
+        response = Response(OK).body_(payload)
+        before = hash(response.body)
+
+        payload[0:1] = b"z"
+
+        assert hash(response.body) == before
+        assert before == hash(_MemoryBody(b"abcdef"))
+        assert len({Response(OK).body_(bytearray(b"abc")), Response(OK).body_(b"abc")}) == 1
+
+    def test_stream_reads_from_the_buffer(self) -> None:
+        body = Response(OK).body_(bytearray(b"abcdef")).body
+
+        stream = body.stream
+        assert stream.read(2) == b"ab"
+        assert stream.read() == b"cdef"
+        assert body.stream.read() == b"abcdef"
+
+    def test_equal_to_memory_body_with_same_content(self) -> None:
+        assert Response(OK).body_(bytearray(b"same")).body == _MemoryBody(b"same")
+
+
+class TestMappedFileBody:
+    def test_maps_a_region_of_a_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.bin"
+        path.write_bytes(bytes(range(256)) * 100)
+
+        body = Body.file(path, offset=5000, length=300)
+
+        assert body.length == 300
+        assert body.buffer.tobytes() == (bytes(range(256)) * 100)[5000:5300]
+        assert body.stream.read(10) == (bytes(range(256)) * 100)[5000:5010]
+        body.close()
+
+    def test_maps_whole_file_by_default(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.txt"
+        path.write_text("hello mapped world")
+
+        body = Body.file(path)
+
+        assert body.length == 18
+        assert body.text == "hello mapped world"
+        body.close()
+
+    def test_length_is_clamped_to_the_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "short.txt"
+        path.write_bytes(b"abc")
+
+        assert Body.file(path, offset=1, length=100).bytes == b"bc"
+        assert Body.file(path, offset=3).bytes == b""
+
+    def test_rejects_offsets_outside_the_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "short.txt"
+        path.write_bytes(b"abc")
+
+        with pytest.raises(ValueError, match="outside"):
+            Body.file(path, offset=10)
+
+    def test_hashes_like_an_equal_memory_body(self, tmp_path: Path) -> None:
+        path = tmp_path / "short.txt"
+        path.write_bytes(b"abcdef")
+        body = Body.file(path, offset=1, length=3)
+
+        assert body == _MemoryBody(b"bcd")
+        assert hash(body) == hash(_MemoryBody(b"bcd"))
+        assert hash(Body.file(path, length=0)) == hash(_MemoryBody(b""))
+        body.close()
+
+
+class TestBodyChunks:
+    def test_memory_body_chunks_are_views_of_its_bytes(self) -> None:
+        chunks = list(_MemoryBody("abcdef").chunks(4))
+
+        assert [bytes(chunk) for chunk in chunks] == [b"abcd", b"ef"]
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+
+    def test_stream_body_is_read_in_fixed_size_chunks(self) -> None:
+        body = Response(OK).body_(BytesIO(b"x" * 10)).body
+
+        assert [len(chunk) for chunk in body.chunks(4)] == [4, 4, 2]
+
+
+class TestIteratorBody:
+    def test_chunks_are_produced_lazily(self) -> None:
+        produced: list[int] = []
+
+        def rows():
+            for i in range(3):
+                produced.append(i)
+                yield f"row {i}\n"
+
+        body = Response(OK).body_(rows()).body
+
+        assert produced == []
+        assert body.length is None
+        assert next(iter(body.chunks())) == b"row 0\n"
+        assert produced == [0]
+
+    def test_can_only_be_consumed_once(self) -> None:
+        body = Body.iterator([b"a", b"b"])
+
+        assert b"".join(body.chunks()) == b"ab"
+        with pytest.raises(RuntimeError):
+            list(body.chunks())
+
+    def test_bytes_buffers_the_remaining_chunks(self) -> None:
+        body = Body.iterator([b"abc", "déf"])
+
+        assert body.bytes == "abcdéf".encode()
+        assert body.length == len("abcdéf".encode())
+        assert body.text == "abcdéf"
+        assert b"".join(body.chunks(2)) == body.bytes
+
+    def test_stream_reads_across_chunk_boundaries(self) -> None:
+        body = Body.iterator([b"ab", b"", b"cde", b"f"])
+        stream = body.stream
+
+        assert stream.read(3) == b"abc"
+        assert stream.read() == b"def"
+
+    def test_close_closes_the_generator(self) -> None:
+        closed: list[bool] = []
+
+        def rows():
+            try:
+                yield b"row"
+            finally:
+                closed.append(True)
+
+        body = Body.iterator(rows())
+        next(iter(body.chunks()))
+        body.close()
+
+        assert closed == [True]
+
+
+async def produce(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+class TestAsyncIteratorBody:
+    def test_chunks_are_read_asynchronously(self) -> None:
+        async def read() -> list[bytes]:
+            body = Body.async_iterator(produce(b"ab", b"", b"cd"), length=4)
+            assert body.length == 4
+            return [bytes(chunk) async for chunk in body.achunks()]
+
+        assert asyncio.run(read()) == [b"ab", b"cd"]
+
+    def test_can_be_read_synchronously_from_another_thread(self) -> None:
+        async def read_on_a_thread() -> bytes:
+            body = Body.async_iterator(produce(b"abc", b"def"))
+            stream = body.stream
+            first = await asyncio.to_thread(stream.read, 4)
+            rest = await asyncio.to_thread(stream.read)
+            assert threading.current_thread() is threading.main_thread()
+            return first + b"|" + rest
+
+        assert asyncio.run(read_on_a_thread()) == b"abcd|ef"
+
+    def test_cannot_be_read_synchronously_on_its_event_loop(self) -> None:
+        async def read() -> None:
+            _ = Body.async_iterator(produce(b"abc")).bytes
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(read())
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
 from http4py.core import Request, Response
-from http4py.core.http import Filter, HttpHandler
+from http4py.core.http import AsyncFilter, AsyncHttpHandler, Filter, HttpHandler, is_async
 from http4py.core.method import POST
 from http4py.core.status import OK
 
@@ -18,6 +19,16 @@ class ReversingFilter(Filter):
         return decorated
 
 
+@dataclass(frozen=True)
+class AsyncReversingFilter(AsyncFilter):
+    def __call__(self, fn: AsyncHttpHandler) -> AsyncHttpHandler:
+        async def decorated(request: Request) -> Response:
+            reversed_body = request.body.text[::-1]
+            return await fn(request.body_(reversed_body))
+
+        return decorated
+
+
 class TestFilter:
     def test_compose_filter(self) -> None:
         def echo(request: Request) -> Response:
@@ -40,3 +51,40 @@ class TestFilter:
 
         assert response.status == OK
         assert response.body.text == "hello"
+
+
+class TestAsyncFilter:
+    def test_compose_with_async_handler(self) -> None:
+        async def echo(request: Request) -> Response:
+            return Response(OK).body_(request.body)
+
+        decorated_handler = AsyncReversingFilter().then(echo)
+
+        response = asyncio.run(decorated_handler(Request(POST, "/test").body_("hello")))
+
+        assert is_async(decorated_handler)
+        assert response.body.text == "olleh"
+
+    def test_compose_with_sync_handler(self) -> None:
+        def echo(request: Request) -> Response:
+            return Response(OK).body_(request.body)
+
+        decorated_handler = AsyncReversingFilter().thenF(AsyncReversingFilter()).then(echo)
+
+        response = asyncio.run(decorated_handler(Request(POST, "/test").body_("hello")))
+
+        assert is_async(decorated_handler)
+        assert not is_async(echo)
+        assert response.body.text == "hello"
+
+    def test_detects_callable_objects_with_an_async_call(self) -> None:
+        class AsyncHandler:
+            async def __call__(self, request: Request) -> Response:
+                return Response(OK)
+
+        class SyncHandler:
+            def __call__(self, request: Request) -> Response:
+                return Response(OK)
+
+        assert is_async(AsyncHandler())
+        assert not is_async(SyncHandler())
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from http4py.core import Headers, Request, Response
+from http4py.core.method import GET
+from http4py.core.status import OK
+
+
+class TestHeaders:
+    def test_lookup_is_case_insensitive(self) -> None:
+        headers = Headers([("Content-Type", "text/plain"), ("X-Custom", "a")])
+
+        assert headers.get("content-type") == "text/plain"
+        assert headers.get("CONTENT-TYPE") == "text/plain"
+        assert headers.get("missing") is None
+        assert "x-custom" in headers
+        assert "missing" not in headers
+
+    def test_keeps_repeated_names_in_order(self) -> None:
+        headers = Headers([("Set-Cookie", "a=1"), ("Accept", "*/*"), ("set-cookie", "b=2")])
+
+        assert headers.get("Set-Cookie") == "a=1"
+        assert headers.get_all("SET-COOKIE") == ["a=1", "b=2"]
+        assert list(headers) == [("Set-Cookie", "a=1"), ("Accept", "*/*"), ("set-cookie", "b=2")]
+
+    def test_modifications_return_new_instances(self) -> None:
+        original = Headers([("A", "1")])
+
+        added = original.add("B", "2")
+        extended = added.extend([("a", "3")])
+        removed = extended.remove("A")
+
+        assert list(original) == [("A", "1")]
+        assert list(added) == [("A", "1"), ("B", "2")]
+        assert extended.get_all("a") == ["1", "3"]
+        assert list(removed) == [("B", "2")]
+
+    def test_lookups_after_modification_see_new_entries(self) -> None:
+        original = Headers([("A", "1")])
+        assert original.get("B") is None
+
+        assert original.add("B", "2").get("b") == "2"
+
+    def test_equality_and_hashing(self) -> None:
+        assert Headers([("A", "1")]) == Headers([("A", "1")])
+        assert Headers([("A", "1")]) == [("A", "1")]
+        assert Headers([("A", "1")]) != Headers([("A", "2")])
+        assert hash(Headers([("A", "1")])) == hash(Headers([("A", "1")]))
+
+
+class TestMessageHeaders:
+    def test_request_headers_are_indexed(self) -> None:
+        request = Request(GET, "/").header_("Accept", "text/html").headers_([("X-Trace", "1"), ("x-trace", "2")])
+
+        assert request.header("accept") == "text/html"
+        assert request.header_values("X-TRACE") == ["1", "2"]
+
+    def test_response_headers_are_indexed(self) -> None:
+        response = Response(OK).header_("Content-Type", "application/json")
+
+        assert response.header("content-type") == "application/json"
+        assert isinstance(response.headers, Headers)
+
+
+class TestHeaderSharing:
+    def test_branches_from_a_shared_parent_are_independent(self) -> None:
+        base = Request(GET, "/").header_("A", "1").header_("B", "2")
+
+        left = base.header_("C", "left")
+        right = base.header_("C", "right").header_("D", "4")
+
+        assert list(base.headers) == [("A", "1"), ("B", "2")]
+        assert list(left.headers) == [("A", "1"), ("B", "2"), ("C", "left")]
+        assert list(right.headers) == [("A", "1"), ("B", "2"), ("C", "right"), ("D", "4")]
+        assert len(right.headers) == 4
+
+    def test_header_by_header_building_matches_bulk_building(self) -> None:
+        entries: list[tuple[str, str | None]] = [(f"X-{i}", str(i)) for i in range(50)]
+
+        one_by_one = Response(OK)
+        for name, value in entries:
+            one_by_one = one_by_one.header_(name, value)
+
+        assert one_by_one.headers == Response(OK).headers_(entries).headers
+        assert one_by_one.header("x-49") == "49"
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+from http4py.core import Request, Response, Uri
+from http4py.core.method import GET
+from http4py.core.status import OK
+
+
+class TestMessageRepresentation:
+    def test_messages_are_slotted(self) -> None:
+        for instance in [Request(GET, "/"), Response(OK), Uri.of("/"), Response(OK).body_("x").body]:
+            assert not hasattr(instance, "__dict__")
+
+    def test_messages_are_frozen(self) -> None:
+        with pytest.raises(FrozenInstanceError):
+            Request(GET, "/").method = GET  # type: ignore[misc]
+
+        with pytest.raises(FrozenInstanceError):
+            Uri.of("/").path = "/other"  # type: ignore[misc]
+
+    def test_equal_messages_hash_equally(self) -> None:
+        first = Request(GET, "/a?b=c").header_("X", "1").body_("body")
+        second = Request(GET, "/a?b=c").header_("X", "1").body_("body")
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second, Request(GET, "/other")}) == 2
+        assert hash(Response(OK).body_("x")) == hash(Response(OK).body_("x"))
+        assert {Uri.of("/x"): 1}[Uri.of("/x")] == 1
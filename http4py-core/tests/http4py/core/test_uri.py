@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
-from http4py.core import Uri
+from http4py.core import Request, Uri
+from http4py.core.method import GET
 
 
 class TestUriStringRepresentation:
@@ -229,6 +233,123 @@ class TestUriQueries:
         uri = Uri.of("/api")
         assert uri.queries() == []
 
+    def test_query_value_lookup(self) -> None:
+        """Test single and multi-valued lookup by name."""
+        uri = Uri.of("/search?q=hello%20world&tag=a&tag=b&flag")
+
+        assert uri.query_value("q") == "hello world"
+        assert uri.query_value("tag") == "a"
+        assert uri.query_values("tag") == ["a", "b"]
+        assert uri.query_value("flag") is None
+        assert uri.query_values("flag") == [None]
+        assert uri.query_value("missing") is None
+        assert uri.query_values("missing") == []
+
+    def test_query_parameters_are_parsed_once(self) -> None:
+        """Test that repeated lookups reuse the cached multi-map."""
+        uri = Uri.of("/parsed-once?a=1&b=2")
+        uri.query_value("a")
+        parameters = uri._parameters
+
+        uri.query_value("b")
+        uri.queries()
+
+        assert parameters is not None
+        assert uri._parameters is parameters
+
+    def test_appending_a_query_keeps_existing_pairs_as_written(self) -> None:
+        """Test that query_ appends without re-encoding existing pairs."""
+        uri = Uri.of("/api?filter=a+b&x=%7E").query_("name", "j d")
+
+        assert uri.query == "filter=a+b&x=%7E&name=j%20d"
+        assert uri.query_value("name") == "j d"
+        assert uri.queries() == [("filter", "a+b"), ("x", "~"), ("name", "j d")]
+
+    def test_request_query_accessors(self) -> None:
+        """Test query accessors exposed on Request."""
+        request = Request(GET, "/items?page=2").query_("sort", "name")
+
+        assert request.query("page") == "2"
+        assert request.query("sort") == "name"
+        assert request.queries("page") == ["2"]
+        assert str(request.uri) == "/items?page=2&sort=name"
+
+
+class TestUriCaching:
+    """Test lazy parsing, the parse cache and memoised rendering."""
+
+    def test_repeated_uris_share_a_parsed_instance(self) -> None:
+        """Test that parsing the same string twice hits the cache."""
+        assert Uri.of("/cached/path?x=1") is Uri.of("/cached/path?x=1")
+
+    def test_request_targets_are_parsed_on_first_access(self) -> None:
+        """Test that components are only split when they are read."""
+        uri = Uri.of("/lazy/target?name=value#frag")
+        assert uri._parts is None
+
+        assert uri.path == "/lazy/target"
+        assert uri.query == "name=value"
+        assert uri.fragment == "frag"
+        assert uri._parts is not None
+
+    def test_parsed_uri_renders_from_its_components(self) -> None:
+        """Test that equal URIs render identically, whatever string they were parsed from."""
+        assert str(Uri.of("/render/me?please=1")) == "/render/me?please=1"
+        assert Uri.of("/render/me?") == Uri.of("/render/me")
+        assert str(Uri.of("/render/me?")) == str(Uri.of("/render/me")) == "/render/me"
+        assert str(Uri.of("/render/me#")) == "/render/me"
+        assert str(Uri.of("http://example.com:0080/x")) == "http://example.com:80/x"
+
+    def test_lazy_and_built_uris_are_equal(self) -> None:
+        """Test equality compares components regardless of how a Uri was made."""
+        built = Uri().scheme_("http").host_("example.com").port_(8080).path_("/a").query_string("b=c")
+
+        assert Uri.of("http://example.com:8080/a?b=c") == built
+        assert hash(Uri.of("http://example.com:8080/a?b=c")) == hash(built)
+
+    def test_rendering_and_authority_are_memoised(self) -> None:
+        """Test that str() and authority return the same cached objects."""
+        uri = Uri().scheme_("https").host_("example.com").port_(443).path_("/x")
+
+        assert str(uri) is str(uri)
+        assert uri.authority is uri.authority
+        assert str(uri) == "https://example.com:443/x"
+
+
+def pickled(value: object) -> object:
+    return pickle.loads(pickle.dumps(value))  # noqa: S301 - round-trips data the test just pickled
+
+
+class TestUriCopying:
+    """Test that Uri and requests holding one survive copy, pickle and replace."""
+
+    def test_copy_and_pickle_round_trip(self) -> None:
+        """Test copies of lazy and built URIs are equal to the original."""
+        lazy = Uri.of("http://user@example.com:8080/copy/me?a=1&b=2#top")
+        built = Uri().scheme_("https").host_("example.com").path_("/built").query_("q", "x y")
+
+        for uri in (lazy, built):
+            assert copy.copy(uri) == uri
+            assert copy.deepcopy(uri) == uri
+            assert pickled(uri) == uri
+            assert str(pickled(uri)) == str(uri)
+
+    def test_requests_can_be_deep_copied_and_pickled(self) -> None:
+        """Test that a request with a Uri can be deep copied and pickled."""
+        request = Request(GET, "/items?page=2").header_("Accept", "text/plain").body_("payload")
+
+        for copied in (copy.deepcopy(request), pickled(request)):
+            assert isinstance(copied, Request)
+            assert copied.uri == request.uri
+            assert copied.header("Accept") == "text/plain"
+            assert copied.body.text == "payload"
+
+    def test_copy_replace_changes_components(self) -> None:
+        """Test copy.replace builds a new Uri with the given components."""
+        uri = Uri.of("http://example.com/old?x=1")
+
+        assert copy.replace(uri, path="/new", port=8080) == Uri.of("http://example.com:8080/new?x=1")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+from http4py.core import Request, Response
+from http4py.core.method import DELETE, GET, HEAD, OPTIONS, POST, PUT
+from http4py.core.status import METHOD_NOT_ALLOWED, NO_CONTENT, NOT_FOUND, OK
+from http4py.routing import RoutingHttpHandler, route, routes
+
+
+def echo_path(request: Request) -> Response:
+    return Response(OK).body_(repr(request.path_parameters))
+
+
+class TestRouting:
+    def test_matches_static_routes(self) -> None:
+        app = routes(
+            route("/").bind(GET).to(lambda req: Response(OK).body_("root")),
+            route("/hello").bind(GET).to(lambda req: Response(OK).body_("hello")),
+            route("/hello").bind(POST).to(lambda req: Response(OK).body_("posted")),
+        )
+
+        assert app(Request(GET, "/")).body.text == "root"
+        assert app(Request(GET, "/hello")).body.text == "hello"
+        assert app(Request(POST, "/hello")).body.text == "posted"
+        assert app(Request(GET, "/hello/")).status == NOT_FOUND
+        assert app(Request(GET, "/missing")).status == NOT_FOUND
+
+    def test_first_registered_route_wins(self) -> None:
+        app = routes(
+            route("/a").bind(GET).to(lambda req: Response(OK).body_("first")),
+            route("/a").bind(GET).to(lambda req: Response(OK).body_("second")),
+        )
+
+        assert app(Request(GET, "/a")).body.text == "first"
+
+    def test_captures_path_parameters(self) -> None:
+        app = routes(route("/users/{name}/posts/{post}").bind(GET).to(echo_path))
+
+        response = app(Request(GET, "/users/bob/posts/hello%20world"))
+
+        assert response.body.text == repr({"name": "bob", "post": "hello world"})
+
+    def test_converts_typed_path_parameters(self) -> None:
+        captured: list[Request] = []
+
+        def capture(request: Request) -> Response:
+            captured.append(request)
+            return Response(OK)
+
+        app = routes(
+            route("/int/{value:int}").bind(GET).to(capture),
+            route("/float/{value:float}").bind(GET).to(capture),
+            route("/uuid/{value:uuid}").bind(GET).to(capture),
+        )
+
+        app(Request(GET, "/int/-42"))
+        app(Request(GET, "/float/1.5"))
+        app(Request(GET, "/uuid/12345678-1234-5678-1234-567812345678"))
+
+        assert [request.path("value") for request in captured] == [
+            -42,
+            1.5,
+            UUID("12345678-1234-5678-1234-567812345678"),
+        ]
+        assert app(Request(GET, "/int/abc")).status == NOT_FOUND
+
+    def test_static_segments_take_precedence_over_parameters(self) -> None:
+        app = routes(
+            route("/users/{id:int}").bind(GET).to(echo_path),
+            route("/users/me").bind(GET).to(lambda req: Response(OK).body_("me")),
+            route("/users/{name}").bind(GET).to(echo_path),
+        )
+
+        assert app(Request(GET, "/users/me")).body.text == "me"
+        assert app(Request(GET, "/users/7")).body.text == repr({"id": 7})
+        assert app(Request(GET, "/users/alice")).body.text == repr({"name": "alice"})
+
+    def test_backtracks_when_a_branch_does_not_match(self) -> None:
+        app = routes(
+            route("/a/static/x").bind(GET).to(lambda req: Response(OK).body_("static")),
+            route("/a/{name}/y").bind(GET).to(echo_path),
+        )
+
+        assert app(Request(GET, "/a/static/y")).body.text == repr({"name": "static"})
+
+    def test_remainder_parameter_captures_rest_of_path(self) -> None:
+        app = routes(route("/files/{file:path}").bind(GET).to(echo_path))
+
+        assert app(Request(GET, "/files/a/b/c.txt")).body.text == repr({"file": "a/b/c.txt"})
+
+    def test_path_parameters_survive_request_modification(self) -> None:
+        app = routes(route("/users/{id:int}").bind(GET).to(lambda req: echo_path(req.header_("X-Test", "1"))))
+
+        assert app(Request(GET, "/users/3")).body.text == repr({"id": 3})
+
+    def test_invalid_templates_are_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown path parameter type"):
+            routes(route("/users/{id:bogus}").bind(GET).to(echo_path))
+
+        with pytest.raises(ValueError, match="Invalid path segment"):
+            routes(route("/users/prefix-{id}").bind(GET).to(echo_path))
+
+        with pytest.raises(ValueError, match="must be the last segment"):
+            routes(route("/files/{rest:path}/more").bind(GET).to(echo_path))
+
+
+class TestMountedRoutes:
+    def test_mounts_routes_under_a_prefix(self) -> None:
+        app = routes(
+            route("/api").to(
+                routes(
+                    route("/").bind(GET).to(lambda req: Response(OK).body_("api root")),
+                    route("/users/{id:int}").bind(GET).to(echo_path),
+                )
+            ),
+            route("/health").bind(GET).to(lambda req: Response(OK).body_("ok")),
+        )
+
+        assert app(Request(GET, "/api")).body.text == "api root"
+        assert app(Request(GET, "/api/users/5")).body.text == repr({"id": 5})
+        assert app(Request(GET, "/health")).body.text == "ok"
+        assert app(Request(GET, "/users/5")).status == NOT_FOUND
+
+    def test_nested_mounts_are_merged_into_one_tree(self) -> None:
+        inner = routes(route("/items/{item}").bind(GET).to(lambda req: Response(OK).body_(req.uri.path)))
+        app = routes(route("/v1").to(routes(route("/tenants/{tenant}").to(inner))))
+
+        response = app(Request(GET, "/v1/tenants/acme/items/42"))
+
+        assert response.body.text == "/v1/tenants/acme/items/42"
+        match = app._tree.find(GET, "/v1/tenants/acme/items/42")
+        assert match is not None
+        assert match[0].handlers[GET].path == "/v1/tenants/{tenant}/items/{item}"
+
+    def test_mounted_routes_capture_prefix_parameters(self) -> None:
+        app = routes(route("/tenants/{tenant}").to(routes(route("/items/{item:int}").bind(GET).to(echo_path))))
+
+        assert app(Request(GET, "/tenants/acme/items/1")).body.text == repr({"tenant": "acme", "item": 1})
+
+
+class TestMethodDispatch:
+    def app(self) -> RoutingHttpHandler:
+        return routes(
+            route("/items").bind(GET).to(lambda req: Response(OK).body_("all items")),
+            route("/items").bind(POST).to(lambda req: Response(OK).body_("created")),
+            route("/items/{id:int}").bind(DELETE).to(echo_path),
+        )
+
+    def test_unsupported_method_returns_405_with_allow_header(self) -> None:
+        response = self.app()(Request(PUT, "/items"))
+
+        assert response.status == METHOD_NOT_ALLOWED
+        assert response.header("Allow") == "GET, POST, HEAD, OPTIONS"
+
+    def test_options_is_answered_from_the_method_table(self) -> None:
+        response = self.app()(Request(OPTIONS, "/items/3"))
+
+        assert response.status == NO_CONTENT
+        assert response.header("Allow") == "DELETE, OPTIONS"
+
+    def test_head_is_served_by_get_handler_without_body(self) -> None:
+        response = self.app()(Request(HEAD, "/items"))
+
+        assert response.status == OK
+        assert response.body.bytes == b""
+        assert response.header("Content-Length") == str(len("all items"))
+
+    def test_head_keeps_the_length_of_a_streamed_get_unknown(self) -> None:
+        app = routes(route("/stream").bind(GET).to(lambda req: Response(OK).body_(iter([b"chunk"]))))
+
+        response = app(Request(HEAD, "/stream"))
+
+        assert response.status == OK
+        assert response.body.length is None
+        assert response.header("Content-Length") is None
+        assert response.body.bytes == b""
+
+    def test_allow_lists_the_methods_of_every_route_matching_the_path(self) -> None:
+        app = routes(
+            route("/files/{id:int}").bind(DELETE).to(echo_path),
+            route("/files/{name}").bind(GET).to(echo_path),
+            route("/files/{rest:path}").bind(PUT).to(echo_path),
+        )
+
+        response = app(Request(POST, "/files/3"))
+
+        assert response.status == METHOD_NOT_ALLOWED
+        assert response.header("Allow") == "GET, PUT, DELETE, HEAD, OPTIONS"
+        assert app(Request(OPTIONS, "/files/readme")).header("Allow") == "GET, PUT, HEAD, OPTIONS"
+
+    def test_explicit_head_and_options_routes_take_precedence(self) -> None:
+        app = routes(
+            route("/probe").bind(HEAD).to(lambda req: Response(NO_CONTENT)),
+            route("/probe").bind(OPTIONS).to(lambda req: Response(OK).body_("custom")),
+            route("/probe").bind(GET).to(lambda req: Response(OK).body_("full")),
+        )
+
+        assert app(Request(HEAD, "/probe")).status == NO_CONTENT
+        assert app(Request(OPTIONS, "/probe")).body.text == "custom"
+
+    def test_unknown_path_is_still_404(self) -> None:
+        assert self.app()(Request(PUT, "/unknown")).status == NOT_FOUND
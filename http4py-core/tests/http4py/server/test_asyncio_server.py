@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from http4py.core import Request, Response
+from http4py.core.status import OK
+from http4py.server import AsyncioServer, Http4pyServer
+
+
+def echo(request: Request) -> Response:
+    return Response(OK).body_(f"{request.method.value} {request.uri.path}:{request.body.text}")
+
+
+def start(config: AsyncioServer) -> Http4pyServer:
+    return config.serve(echo).start()
+
+
+def exchange(port: int, payload: bytes) -> bytes:
+    with socket.create_connection(("localhost", port), timeout=5) as connection:
+        connection.sendall(payload)
+        received = b""
+        while chunk := connection.recv(65536):
+            received += chunk
+        return received
+
+
+def bodies(raw: bytes) -> list[bytes]:
+    found = []
+    while raw:
+        head, _, rest = raw.partition(b"\r\n\r\n")
+        length = next(
+            int(line.split(b":")[1]) for line in head.split(b"\r\n") if line.lower().startswith(b"content-length:")
+        )
+        found.append(rest[:length])
+        raw = rest[length:]
+    return found
+
+
+class TestAsyncioServer:
+    def test_processes_pipelined_requests_in_order(self) -> None:
+        server = start(AsyncioServer(0))
+        try:
+            raw = exchange(
+                server.port(),
+                b"POST /first HTTP/1.1\r\nHost: localhost\r\nContent-Length: 3\r\n\r\none"
+                b"GET /second HTTP/1.1\r\nHost: localhost\r\n\r\n"
+                b"POST /third HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\nContent-Length: 5\r\n\r\nthree",
+            )
+
+            assert bodies(raw) == [b"POST /first:one", b"GET /second:", b"POST /third:three"]
+        finally:
+            server.stop()
+
+    def test_decodes_chunked_request_body(self) -> None:
+        server = start(AsyncioServer(0))
+        try:
+            raw = exchange(
+                server.port(),
+                b"POST /chunked HTTP/1.1\r\nTransfer-Encoding: chunked\r\nConnection: close\r\n\r\n"
+                b"3\r\nabc\r\n4;ext=1\r\ndefg\r\n0\r\nTrailer: x\r\n\r\n",
+            )
+
+            assert bodies(raw) == [b"POST /chunked:abcdefg"]
+        finally:
+            server.stop()
+
+    def test_rejects_malformed_and_unknown_requests(self) -> None:
+        server = start(AsyncioServer(0))
+        try:
+            malformed = exchange(server.port(), b"NONSENSE\r\n\r\n")
+            unknown = exchange(server.port(), b"BREW /pot HTTP/1.1\r\nConnection: close\r\n\r\n")
+
+            assert malformed.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+            assert unknown.startswith(b"HTTP/1.1 501 Not Implemented\r\n")
+        finally:
+            server.stop()
+
+    def test_head_response_has_no_body(self) -> None:
+        server = start(AsyncioServer(0))
+        try:
+            raw = exchange(server.port(), b"HEAD /x HTTP/1.1\r\nConnection: close\r\n\r\n")
+
+            assert b"Content-Length: 8\r\n" in raw
+            assert raw.endswith(b"\r\n\r\n")
+        finally:
+            server.stop()
+
+    def test_http_1_0_connection_closes_by_default(self) -> None:
+        server = start(AsyncioServer(0))
+        try:
+            raw = exchange(server.port(), b"GET /old HTTP/1.0\r\n\r\n")
+
+            assert b"Connection: close\r\n" in raw
+            assert bodies(raw) == [b"GET /old:"]
+        finally:
+            server.stop()
+
+    def test_closes_idle_connection_after_timeout(self) -> None:
+        server = start(AsyncioServer(0, idle_timeout=0.2))
+        try:
+            started = time.monotonic()
+            raw = exchange(server.port(), b"GET /one HTTP/1.1\r\n\r\n")
+
+            assert bodies(raw) == [b"GET /one:"]
+            assert time.monotonic() - started < 2
+        finally:
+            server.stop()
+
+    def test_stop_closes_idle_connections_promptly(self) -> None:
+        server = start(AsyncioServer(0, idle_timeout=30))
+        with socket.create_connection(("localhost", server.port()), timeout=5) as connection:
+            connection.sendall(b"GET /one HTTP/1.1\r\n\r\n")
+            connection.recv(65536)
+
+            started = time.monotonic()
+            server.stop()
+
+            assert time.monotonic() - started < 2
+            assert connection.recv(65536) == b""
+
+    def test_runs_blocking_handlers_off_the_event_loop(self) -> None:
+        def handler(request: Request) -> Response:
+            time.sleep(float(request.query("sleep") or 0))
+            return Response(OK).body_(request.uri.path)
+
+        server = AsyncioServer(0).serve(handler).start()
+        try:
+            with ThreadPoolExecutor(1) as clients:
+                slow = clients.submit(
+                    exchange, server.port(), b"GET /slow?sleep=1 HTTP/1.1\r\nConnection: close\r\n\r\n"
+                )
+                time.sleep(0.1)
+
+                started = time.monotonic()
+                fast = exchange(server.port(), b"GET /fast HTTP/1.1\r\nConnection: close\r\n\r\n")
+
+                assert bodies(fast) == [b"/fast"]
+                assert time.monotonic() - started < 0.5
+                assert bodies(slow.result()) == [b"/slow"]
+        finally:
+            server.stop()
+
+    def test_runs_async_handlers_on_the_event_loop(self) -> None:
+        async def handler(request: Request) -> Response:
+            chunks = [chunk async for chunk in request.body.achunks()]
+            return Response(OK).body_(f"{threading.current_thread().name}:{b''.join(chunks).decode()}")
+
+        server = AsyncioServer(0).serve(handler).start()
+        try:
+            raw = exchange(
+                server.port(),
+                b"POST / HTTP/1.1\r\nConnection: close\r\nTransfer-Encoding: chunked\r\n\r\n3\r\nabc\r\n0\r\n\r\n",
+            )
+
+            assert bodies(raw) == [b"http4py-asyncio:abc"]
+        finally:
+            server.stop()
+
+    def test_streams_request_body_to_the_handler(self) -> None:
+        reading = threading.Event()
+
+        def handler(request: Request) -> Response:
+            stream = request.body.stream
+            first = stream.read(3)
+            reading.set()
+            return Response(OK).body_(first + stream.read())
+
+        server = AsyncioServer(0).serve(handler).start()
+        try:
+            with socket.create_connection(("localhost", server.port()), timeout=5) as connection:
+                connection.sendall(b"POST / HTTP/1.1\r\nConnection: close\r\nContent-Length: 6\r\n\r\nabc")
+
+                assert reading.wait(5)
+                connection.sendall(b"def")
+                raw = b""
+                while chunk := connection.recv(65536):
+                    raw += chunk
+
+            assert bodies(raw) == [b"abcdef"]
+        finally:
+            server.stop()
+
+    def test_answers_expect_100_continue_when_the_body_is_read(self) -> None:
+        server = start(AsyncioServer(0))
+        try:
+            with socket.create_connection(("localhost", server.port()), timeout=5) as connection:
+                connection.sendall(
+                    b"POST /upload HTTP/1.1\r\nExpect: 100-continue\r\nConnection: close\r\nContent-Length: 4\r\n\r\n"
+                )
+
+                assert connection.recv(65536) == b"HTTP/1.1 100 Continue\r\n\r\n"
+                connection.sendall(b"data")
+                raw = b""
+                while chunk := connection.recv(65536):
+                    raw += chunk
+
+            assert bodies(raw) == [b"POST /upload:data"]
+        finally:
+            server.stop()
+
+    def test_closes_connection_when_the_handler_skips_an_expected_body(self) -> None:
+        server = AsyncioServer(0).serve(lambda request: Response(OK).body_("skipped")).start()
+        try:
+            raw = exchange(server.port(), b"POST / HTTP/1.1\r\nExpect: 100-continue\r\nContent-Length: 4\r\n\r\n")
+
+            assert b"100 Continue" not in raw
+            assert b"Connection: close" in raw
+            assert bodies(raw) == [b"skipped"]
+        finally:
+            server.stop()
+
+    def test_times_out_a_stalled_request_body(self) -> None:
+        server = start(AsyncioServer(0, idle_timeout=0.2))
+        try:
+            started = time.monotonic()
+            raw = exchange(server.port(), b"POST / HTTP/1.1\r\nContent-Length: 10\r\n\r\nabc")
+
+            assert raw.startswith(b"HTTP/1.1 500 Internal Server Error\r\n")
+            assert time.monotonic() - started < 2
+        finally:
+            server.stop()
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from http4py.server import AsyncioServer, ServerConfig
+from http4py.testing import HttpServerContract
+
+
+class TestAsyncioServerContract(HttpServerContract):
+    def create_server_config(self, port: int) -> ServerConfig:
+        return AsyncioServer(port)
+
+
+class TestPooledAsyncioServerContract(HttpServerContract):
+    def create_server_config(self, port: int) -> ServerConfig:
+        return AsyncioServer(port, workers=4)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import http.client
+import os
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from http4py.core import HttpHandler, Request, Response
+from http4py.core.status import OK
+from http4py.server import Http4pyServer, PreFork, ServerConfig, StdLibServer
+from http4py.server.prefork import _PreForkServer
+from http4py.testing import HttpServerContract
+
+
+class TestPreForkContract(HttpServerContract):
+    def create_server_config(self, port: int) -> ServerConfig:
+        return PreFork(StdLibServer(), workers=2, port=port)
+
+
+def report_pid(request: Request) -> Response:
+    time.sleep(float(request.query("sleep") or 0))
+    return Response(OK).body_(str(os.getpid()))
+
+
+def start(config: PreFork) -> _PreForkServer:
+    server = config.serve(report_pid).start()
+    assert isinstance(server, _PreForkServer)
+    return server
+
+
+def pids(server: _PreForkServer, count: int, sleep: float = 0.2) -> set[int]:
+    url = f"http://localhost:{server.port()}/?sleep={sleep}"
+    with ThreadPoolExecutor(count) as clients:
+        return {int(text) for text in clients.map(lambda _: requests.get(url, timeout=10).text, range(count))}
+
+
+class ServeOnlyConfig(ServerConfig):
+    def serve(self, http: HttpHandler) -> Http4pyServer:
+        return StdLibServer(0).serve(http)
+
+
+class TestPreFork:
+    def test_configs_without_serve_on_can_still_be_created_but_not_pre_forked(self) -> None:
+        config = ServeOnlyConfig()
+
+        with (
+            socket.socket() as listener,
+            pytest.raises(TypeError, match="cannot serve on an existing listening socket"),
+        ):
+            config.serve_on(report_pid, listener)
+        with pytest.raises(TypeError, match="ServeOnlyConfig"):
+            PreFork(config, workers=1)
+
+    def test_spreads_requests_over_worker_processes(self) -> None:
+        server = start(PreFork(StdLibServer(), workers=2, port=0))
+        try:
+            served_by = pids(server, 6)
+
+            assert served_by == set(server.workers())
+            assert os.getpid() not in served_by
+        finally:
+            server.stop()
+
+    def test_workers_can_bind_with_reuse_port(self) -> None:
+        server = start(PreFork(StdLibServer(), workers=2, port=0, reuse_port=True))
+        try:
+            assert pids(server, 2, sleep=0) <= set(server.workers())
+        finally:
+            server.stop()
+
+    def test_idle_connections_survive_new_clients_on_a_shared_socket(self) -> None:
+        server = start(PreFork(StdLibServer(), workers=2, port=0))
+        idle = http.client.HTTPConnection("localhost", server.port(), timeout=5)
+        try:
+            idle.request("GET", "/")
+            idle.getresponse().read()
+            idle_socket = idle.sock
+
+            for _ in range(20):
+                assert requests.get(f"http://localhost:{server.port()}/", timeout=5).status_code == 200
+                idle.request("GET", "/")
+                response = idle.getresponse()
+                response.read()
+                assert response.status == 200
+                assert idle.sock is idle_socket
+        finally:
+            idle.close()
+            server.stop()
+
+    def test_serves_on_a_given_listener(self) -> None:
+        listener = socket.create_server(("localhost", 0))
+        server = PreFork(StdLibServer(), workers=2).serve_on(report_pid, listener).start()
+        assert isinstance(server, _PreForkServer)
+        try:
+            assert server.port() == listener.getsockname()[1]
+            assert pids(server, 4) <= set(server.workers())
+        finally:
+            server.stop()
+
+    def test_restarts_crashed_worker(self) -> None:
+        server = start(PreFork(StdLibServer(), workers=1, port=0))
+        try:
+            [crashed] = server.workers()
+            os.kill(crashed, signal.SIGKILL)
+
+            deadline = time.monotonic() + 5
+            while server.workers() in ([], [crashed]) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            [replacement] = server.workers()
+
+            assert replacement != crashed
+            assert pids(server, 1, sleep=0) == {replacement}
+        finally:
+            server.stop()
+
+    def test_stop_lets_in_flight_requests_finish(self) -> None:
+        server = start(PreFork(StdLibServer(), workers=1, port=0))
+        workers = server.workers()
+        with ThreadPoolExecutor(1) as clients:
+            in_flight = clients.submit(requests.get, f"http://localhost:{server.port()}/?sleep=0.5", timeout=10)
+            time.sleep(0.2)
+            stopping = threading.Thread(target=server.stop)
+            stopping.start()
+
+            assert in_flight.result().status_code == 200
+            stopping.join()
+
+        assert server.workers() == []
+        for pid in workers:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                continue
+            raise AssertionError(f"worker {pid} is still running")
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import http.client
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+
+import pytest
+import requests
+from http4py.core import HttpHandler, Request, Response
+from http4py.core.status import OK
+from http4py.server import Http4pyServer, StdLibServer
+
+
+def describe_body(request: Request) -> Response:
+    stream = request.body.stream
+    spooled = isinstance(stream, SpooledTemporaryFile)
+    on_disk = spooled and stream._rolled  # type: ignore[attr-defined]
+    return Response(OK).body_(f"{request.body.length},{spooled},{on_disk},{len(request.body.bytes)}")
+
+
+@pytest.fixture
+def server(request: pytest.FixtureRequest) -> Iterator[Http4pyServer]:
+    server = StdLibServer(0, spool_threshold=request.param).serve(describe_body).start()
+    threading.Thread(target=server.block, daemon=True).start()
+    yield server
+    server.stop()
+
+
+class TestStdLibServerRequestBodies:
+    @pytest.mark.parametrize("server", [None], indirect=True)
+    def test_request_body_is_streamed_from_the_socket_by_default(self, server: Http4pyServer) -> None:
+        response = requests.post(f"http://localhost:{server.port()}/", data=b"x" * 100_000, timeout=5)
+
+        assert response.text == "100000,False,False,100000"
+
+    @pytest.mark.parametrize("server", [1024], indirect=True)
+    def test_small_request_body_is_spooled_in_memory(self, server: Http4pyServer) -> None:
+        response = requests.post(f"http://localhost:{server.port()}/", data=b"x" * 100, timeout=5)
+
+        assert response.text == "100,True,False,100"
+
+    @pytest.mark.parametrize("server", [1024], indirect=True)
+    def test_large_request_body_is_spooled_to_disk(self, server: Http4pyServer) -> None:
+        response = requests.post(f"http://localhost:{server.port()}/", data=b"x" * 100_000, timeout=5)
+
+        assert response.text == "100000,True,True,100000"
+
+
+def start(config: StdLibServer, handler: HttpHandler) -> Http4pyServer:
+    server = config.serve(handler).start()
+    threading.Thread(target=server.block, daemon=True).start()
+    return server
+
+
+class TestStdLibServerWorkerPool:
+    def test_serves_requests_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(request: Request) -> Response:
+            barrier.wait()
+            return Response(OK).body_("met")
+
+        server = start(StdLibServer(0, workers=2), meet)
+        try:
+            with ThreadPoolExecutor(2) as clients:
+                url = f"http://localhost:{server.port()}/"
+                responses = list(clients.map(lambda _: requests.get(url, timeout=5), range(2)))
+
+            assert [response.text for response in responses] == ["met", "met"]
+        finally:
+            server.stop()
+
+    def test_rejects_with_503_when_saturated(self) -> None:
+        entered = threading.Event()
+        release = threading.Event()
+
+        def hold(request: Request) -> Response:
+            entered.set()
+            release.wait(5)
+            return Response(OK).body_("held")
+
+        server = start(StdLibServer(0, workers=1, accept_queue=0), hold)
+        try:
+            url = f"http://localhost:{server.port()}/"
+            with ThreadPoolExecutor(1) as clients:
+                first = clients.submit(requests.get, url, timeout=5)
+                assert entered.wait(5)
+
+                rejected = requests.get(url, timeout=5)
+                release.set()
+
+                assert rejected.status_code == 503
+                assert rejected.headers["Retry-After"] == "1"
+                assert first.result().text == "held"
+        finally:
+            release.set()
+            server.stop()
+
+    def test_drain_waits_for_requests_queued_behind_busy_workers(self) -> None:
+        entered = threading.Semaphore(0)
+
+        def slow(request: Request) -> Response:
+            entered.release()
+            time.sleep(0.3)
+            return Response(OK).body_(request.uri.path)
+
+        server = start(StdLibServer(0, workers=1, accept_queue=1), slow)
+        try:
+            url = f"http://localhost:{server.port()}"
+            with ThreadPoolExecutor(2) as clients:
+                running = clients.submit(requests.get, f"{url}/running", timeout=5)
+                assert entered.acquire(timeout=5)
+                queued = clients.submit(requests.get, f"{url}/queued", timeout=5)
+                time.sleep(0.1)
+
+                report = server.drain(timeout=5)
+
+                assert (report.completed, report.abandoned) == (2, 0)
+                assert running.result().text == "/running"
+                assert queued.result().text == "/queued"
+        finally:
+            server.stop()
+
+
+def exchange(port: int, payload: bytes, responses: int) -> list[bytes]:
+    with socket.create_connection(("localhost", port), timeout=5) as connection:
+        connection.sendall(payload)
+        reader = connection.makefile("rb")
+        received = []
+        for _ in range(responses):
+            assert reader.readline().startswith(b"HTTP/1.1 200")
+            headers = http.client.parse_headers(reader)
+            received.append(reader.read(int(headers["Content-Length"])))
+        return received
+
+
+def echo_path(request: Request) -> Response:
+    return Response(OK).body_(f"{request.uri.path}:{request.body.text}")
+
+
+class TestStdLibServerKeepAlive:
+    def test_processes_pipelined_requests_in_order(self) -> None:
+        server = start(StdLibServer(0), echo_path)
+        try:
+            payload = (
+                b"POST /first HTTP/1.1\r\nHost: localhost\r\nContent-Length: 3\r\n\r\none"
+                b"GET /second HTTP/1.1\r\nHost: localhost\r\n\r\n"
+                b"POST /third HTTP/1.1\r\nHost: localhost\r\nContent-Length: 5\r\n\r\nthree"
+            )
+
+            assert exchange(server.port(), payload, 3) == [b"/first:one", b"/second:", b"/third:three"]
+        finally:
+            server.stop()
+
+    def test_discards_unread_request_body_before_the_next_request(self) -> None:
+        server = start(StdLibServer(0), lambda request: Response(OK).body_(request.uri.path))
+        try:
+            payload = (
+                b"POST /ignored HTTP/1.1\r\nHost: localhost\r\nContent-Length: 4\r\n\r\nbody"
+                b"GET /next HTTP/1.1\r\nHost: localhost\r\n\r\n"
+            )
+
+            assert exchange(server.port(), payload, 2) == [b"/ignored", b"/next"]
+        finally:
+            server.stop()
+
+    @pytest.mark.parametrize("content_length", [b"abc", b"-4", b"1_0"])
+    def test_rejects_invalid_content_length_and_closes_the_connection(self, content_length: bytes) -> None:
+        server = start(StdLibServer(0), echo_path)
+        try:
+            with socket.create_connection(("localhost", server.port()), timeout=5) as connection:
+                connection.sendall(
+                    b"POST /bad HTTP/1.1\r\nHost: localhost\r\nContent-Length: " + content_length + b"\r\n\r\n"
+                    b"GET /smuggled HTTP/1.1\r\nHost: localhost\r\n\r\n"
+                )
+                received = b""
+                while chunk := connection.recv(65536):
+                    received += chunk
+
+            assert received.startswith(b"HTTP/1.1 400 ")
+            assert b"Connection: close\r\n" in received
+            assert b"/smuggled" not in received
+            assert received.count(b"HTTP/1.1 ") == 1
+        finally:
+            server.stop()
+
+    def test_closes_connection_after_max_requests(self) -> None:
+        server = start(StdLibServer(0, max_requests_per_connection=2), echo_path)
+        connection = http.client.HTTPConnection("localhost", server.port(), timeout=5)
+        try:
+            connection.request("GET", "/one")
+            first = connection.getresponse()
+            first.read()
+            connection.request("GET", "/two")
+            second = connection.getresponse()
+            second.read()
+
+            assert first.getheader("Connection") is None
+            assert second.getheader("Connection") == "close"
+        finally:
+            connection.close()
+            server.stop()
+
+    def test_closes_idle_connection_after_timeout(self) -> None:
+        server = start(StdLibServer(0, idle_timeout=0.2), echo_path)
+        try:
+            with socket.create_connection(("localhost", server.port()), timeout=5) as connection:
+                connection.sendall(b"GET /one HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                received = b""
+                while chunk := connection.recv(65536):
+                    received += chunk
+
+            assert received.endswith(b"/one:")
+        finally:
+            server.stop()
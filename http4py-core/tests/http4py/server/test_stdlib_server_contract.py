@@ -8,3 +8,8 @@ from http4py.testing import HttpServerContract
 class TestStdLibServerContract(HttpServerContract):
     def create_server_config(self, port: int) -> ServerConfig:
         return StdLibServer(port)
+
+
+class TestPooledStdLibServerContract(HttpServerContract):
+    def create_server_config(self, port: int) -> ServerConfig:
+        return StdLibServer(port, workers=4)
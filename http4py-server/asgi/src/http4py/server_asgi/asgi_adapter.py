@@ -1,32 +1,98 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Any
 
-from http4py.core import HttpHandler, Request
+from http4py.core import AsyncHttpHandler, HttpHandler, Request, Response
+from http4py.core.body import CHUNK_SIZE, Body, Chunk, _BufferBody, _MemoryBody
+from http4py.core.http import is_async
 from http4py.core.method import Method
 from http4py.core.uri import Uri
 
-AsgiApp = Callable[
-    [dict[str, Any], Callable[[], Awaitable[dict[str, Any]]], Callable[[dict[str, Any]], Awaitable[None]]],
-    Awaitable[None],
-]
+AsgiReceive = Callable[[], Awaitable[dict[str, Any]]]
+AsgiSend = Callable[[dict[str, Any]], Awaitable[None]]
+AsgiApp = Callable[[dict[str, Any], AsgiReceive, AsgiSend], Awaitable[None]]
+
+_COMMON_HEADER_NAMES = (
+    "Accept-Ranges",
+    "Allow",
+    "Cache-Control",
+    "Connection",
+    "Content-Disposition",
+    "Content-Encoding",
+    "Content-Language",
+    "Content-Length",
+    "Content-Location",
+    "Content-Range",
+    "Content-Type",
+    "Date",
+    "ETag",
+    "Expires",
+    "Last-Modified",
+    "Location",
+    "Retry-After",
+    "Server",
+    "Set-Cookie",
+    "Transfer-Encoding",
+    "Vary",
+    "WWW-Authenticate",
+)
+
+_COMMON_HEADER_VALUES = (
+    "application/json",
+    "application/octet-stream",
+    "text/html",
+    "text/html; charset=utf-8",
+    "text/plain",
+    "text/plain; charset=utf-8",
+    "no-cache",
+    "no-store",
+    "max-age=0",
+    "public",
+    "private",
+    "close",
+    "keep-alive",
+    "chunked",
+    "gzip",
+    "bytes",
+    "Accept-Encoding",
+    "*",
+)
+
+_ENCODED_NAMES = {
+    spelling: name.lower().encode("latin1") for name in _COMMON_HEADER_NAMES for spelling in (name, name.lower())
+}
+_ENCODED_VALUES = {value: value.encode("latin1") for value in _COMMON_HEADER_VALUES}
+_CONTENT_LENGTH = _ENCODED_NAMES["Content-Length"]
 
 
 class AsgiAdapter(ABC):
     @abstractmethod
-    def to_asgi(self, handler: HttpHandler) -> AsgiApp:
+    def to_asgi(self, handler: HttpHandler | AsyncHttpHandler) -> AsgiApp:
         pass
 
 
 class StandardAsgiAdapter(AsgiAdapter):
-    def to_asgi(self, handler: HttpHandler) -> AsgiApp:
-        async def asgi_app(
-            scope: dict[str, Any],
-            receive: Callable[[], Awaitable[dict[str, Any]]],
-            send: Callable[[dict[str, Any]], Awaitable[None]],
-        ) -> None:
+    def __init__(self, workers: int | None = None, executor: Executor | None = None):
+        if executor is not None and workers is not None:
+            raise ValueError("Pass either workers or executor, not both")
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http4py-asgi")
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def to_asgi(self, handler: HttpHandler | AsyncHttpHandler) -> AsgiApp:
+        executor = self._executor
+
+        async def asgi_app(scope: dict[str, Any], receive: AsgiReceive, send: AsgiSend) -> None:
+            if scope["type"] == "lifespan":
+                await self._lifespan(receive, send)
+                return
             if scope["type"] != "http":
                 return
 
@@ -39,51 +105,103 @@ class StandardAsgiAdapter(AsgiAdapter):
 
             uri = Uri.of(path)
 
-            request = Request(method, uri)
-
-            headers: list[tuple[str, str]] = []
-            for name_bytes, value_bytes in scope.get("headers", []):
-                name = name_bytes.decode("latin1")
-                value = value_bytes.decode("latin1")
-                headers.append((name, value))
-
-            request = request.headers_(headers)
+            request = Request(method, uri).headers_(
+                (name.decode("latin1"), value.decode("latin1")) for name, value in scope.get("headers", [])
+            )
 
-            body_parts: list[bytes] = []
-            while True:
-                message = await receive()
-                if message["type"] == "http.request":
-                    body_parts.append(message.get("body", b""))
-                    if not message.get("more_body", False):
-                        break
-                elif message["type"] == "http.disconnect":
-                    return
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
 
-            body = b"".join(body_parts)
-            if body:
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                content_length = request.header("Content-Length")
+                request = request.body_(
+                    Body.async_iterator(_receive_chunks(receive, body), int(content_length) if content_length else None)
+                )
+            elif body:
                 request = request.body_(body)
 
-            response = handler(request)
-
-            await send(
-                {
-                    "type": "http.response.start",
-                    "status": response.status.code,
-                    "headers": [
-                        # [name.encode("latin1"), value.encode("latin1")] for name, value in response.headers if value is not None
-                    ],
-                }
-            )
-
-            await send(
-                {
-                    "type": "http.response.body",
-                    "body": response.body.bytes,
-                }
-            )
+            if is_async(handler):
+                response = await handler(request)
+            else:
+                response = await asyncio.get_running_loop().run_in_executor(executor, handler, request)
+
+            try:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": response.status.code,
+                        "headers": _encode_headers(response),
+                    }
+                )
+                await _send_body(response.body, send, executor)
+            finally:
+                response.close()
 
         return asgi_app
 
+    async def _lifespan(self, receive: AsgiReceive, send: AsgiSend) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
 
-def asgi_adapter(http_handler: HttpHandler) -> AsgiApp:
-    return StandardAsgiAdapter().to_asgi(http_handler)
+async def _receive_chunks(receive: AsgiReceive, first_chunk: bytes) -> AsyncIterator[bytes]:
+    yield first_chunk
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise ConnectionResetError("Client disconnected before the request body was complete")
+        yield message.get("body", b"")
+        if not message.get("more_body", False):
+            return
+
+
+def _encode_headers(response: Response) -> list[tuple[bytes, bytes]]:
+    encoded: list[tuple[bytes, bytes]] = []
+    has_length = False
+    for name, value in response.headers:
+        if value is None:
+            continue
+        encoded_name = _ENCODED_NAMES.get(name) or name.lower().encode("latin1")
+        has_length = has_length or encoded_name == _CONTENT_LENGTH
+        encoded.append((encoded_name, _ENCODED_VALUES.get(value) or value.encode("latin1")))
+    if not has_length:
+        length = response.body.length
+        if length is not None:
+            encoded.append((_CONTENT_LENGTH, b"%d" % length))
+    return encoded
+
+
+async def _send_body(body: Body, send: AsgiSend, executor: Executor) -> None:
+    if isinstance(body, (_MemoryBody, _BufferBody)) and (body.length or 0) <= CHUNK_SIZE:
+        await send({"type": "http.response.body", "body": body.bytes})
+        return
+
+    if isinstance(body, (_MemoryBody, _BufferBody)):
+        for chunk in body.chunks():
+            await send({"type": "http.response.body", "body": bytes(chunk), "more_body": True})
+    else:
+        loop = asyncio.get_running_loop()
+        chunks = body.chunks()
+        while (produced := await loop.run_in_executor(executor, _next_chunk, chunks)) is not None:
+            view = memoryview(produced)
+            for start in range(0, view.nbytes, CHUNK_SIZE):
+                await send(
+                    {"type": "http.response.body", "body": bytes(view[start : start + CHUNK_SIZE]), "more_body": True}
+                )
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def _next_chunk(chunks: Iterator[Chunk]) -> Chunk | None:
+    return next(chunks, None)
+
+
+def asgi_adapter(http_handler: HttpHandler | AsyncHttpHandler, executor: Executor | None = None) -> AsgiApp:
+    return StandardAsgiAdapter(executor=executor).to_asgi(http_handler)
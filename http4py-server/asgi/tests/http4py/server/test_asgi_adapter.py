@@ -1,7 +1,15 @@
 from __future__ import annotations
 
-from http4py.core import Request, Response
-from http4py.core.status import OK
+import asyncio
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from http4py.core import AsyncHttpHandler, HttpHandler, Request, Response
+from http4py.core.body import CHUNK_SIZE
+from http4py.core.status import BAD_REQUEST, OK
 from http4py.server_asgi import AsgiAdapter, StandardAsgiAdapter, asgi_adapter
 
 
@@ -25,3 +33,286 @@ def test_asgi_adapter_function() -> None:
 def test_asgi_adapter_interface() -> None:
     adapter = StandardAsgiAdapter()
     assert isinstance(adapter, AsgiAdapter)
+
+
+class _Client:
+    def __init__(self, *chunks: bytes):
+        self.messages = [
+            {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+            for index, chunk in enumerate(chunks)
+        ]
+        self.received = 0
+        self.sent: list[dict[str, Any]] = []
+
+    async def receive(self) -> dict[str, Any]:
+        if self.received == len(self.messages):
+            return {"type": "http.disconnect"}
+        message = self.messages[self.received]
+        self.received += 1
+        return message
+
+    async def send(self, message: dict[str, Any]) -> None:
+        self.sent.append(message)
+
+    def call(self, handler: HttpHandler | AsyncHttpHandler) -> bytes:
+        scope = {"type": "http", "method": "POST", "path": "/upload", "headers": []}
+        asyncio.run(asgi_adapter(handler)(scope, self.receive, self.send))
+        return b"".join(message.get("body", b"") for message in self.sent[1:])
+
+
+def test_streams_request_body_from_receive() -> None:
+    def handler(request: Request) -> Response:
+        return Response(OK).body_(b"|".join(request.body.chunks(4)))
+
+    client = _Client(b"abc", b"defg", b"hi")
+
+    assert client.call(handler) == b"abcd|efgh|i"
+    assert client.received == 3
+
+
+def test_handler_can_reject_after_the_first_chunk() -> None:
+    def handler(request: Request) -> Response:
+        if request.body.stream.read(5) != b"magic":
+            return Response(BAD_REQUEST)
+        return Response(OK)
+
+    client = _Client(b"junk!", b"x" * 1000, b"x" * 1000, b"x" * 1000)
+    client.call(handler)
+
+    assert client.sent[0]["status"] == 400
+    assert client.received == 1
+
+
+def test_reading_past_a_disconnect_fails() -> None:
+    def handler(request: Request) -> Response:
+        try:
+            _ = request.body.bytes
+        except ConnectionResetError:
+            return Response(BAD_REQUEST)
+        return Response(OK)
+
+    client = _Client(b"partial", b"more")
+    client.messages.pop()
+
+    client.call(handler)
+
+    assert client.sent[0]["status"] == 400
+
+
+def test_single_message_body_is_passed_in_memory() -> None:
+    def handler(request: Request) -> Response:
+        return Response(OK).body_(request.body.bytes.upper())
+
+    assert _Client(b"hello").call(handler) == b"HELLO"
+
+
+def test_small_memory_body_is_sent_in_one_message() -> None:
+    client = _Client(b"")
+    client.call(lambda request: Response(OK).body_("Hello World"))
+
+    assert client.sent[1] == {"type": "http.response.body", "body": b"Hello World"}
+
+
+def test_streams_iterator_body_as_a_series_of_messages() -> None:
+    events: list[str] = []
+
+    def rows() -> Iterator[bytes]:
+        for i in range(3):
+            events.append(f"produce {i}")
+            yield f"row {i}\n".encode()
+
+    class RecordingClient(_Client):
+        async def send(self, message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.body" and message["body"]:
+                events.append(f"send {message['body'].decode().strip()}")
+            await super().send(message)
+
+    client = RecordingClient(b"")
+
+    assert client.call(lambda request: Response(OK).body_(rows())) == b"row 0\nrow 1\nrow 2\n"
+    assert events == ["produce 0", "send row 0", "produce 1", "send row 1", "produce 2", "send row 2"]
+    assert [message.get("more_body") for message in client.sent[1:]] == [True, True, True, False]
+
+
+def test_streams_large_memory_body_in_bounded_chunks() -> None:
+    client = _Client(b"")
+    content = b"x" * (CHUNK_SIZE * 2 + 1)
+
+    assert client.call(lambda request: Response(OK).body_(content)) == content
+    assert [len(message["body"]) for message in client.sent[1:]] == [CHUNK_SIZE, CHUNK_SIZE, 1, 0]
+
+
+def test_splits_large_iterator_chunks_into_bounded_messages() -> None:
+    client = _Client(b"")
+    content = b"x" * (CHUNK_SIZE + 10)
+
+    assert client.call(lambda request: Response(OK).body_(iter([b"ab", content]))) == b"ab" + content
+    assert [len(message["body"]) for message in client.sent[1:]] == [2, CHUNK_SIZE, 10, 0]
+
+
+def test_emits_encoded_response_headers_with_content_length() -> None:
+    client = _Client(b"")
+    client.call(
+        lambda request: (
+            Response(OK)
+            .body_("Hello World")
+            .header_("Content-Type", "text/plain")
+            .header_("X-Trace", "abc")
+            .header_("X-Multi", "1")
+            .header_("X-Multi", "2")
+        )
+    )
+
+    assert client.sent[0]["headers"] == [
+        (b"content-type", b"text/plain"),
+        (b"x-trace", b"abc"),
+        (b"x-multi", b"1"),
+        (b"x-multi", b"2"),
+        (b"content-length", b"11"),
+    ]
+
+
+def test_keeps_declared_content_length_and_omits_unknown_length() -> None:
+    declared = _Client(b"")
+    declared.call(lambda request: Response(OK).body_(iter([b"abc"])).header_("Content-Length", "3"))
+    unknown = _Client(b"")
+    unknown.call(lambda request: Response(OK).body_(iter([b"abc"])))
+
+    assert declared.sent[0]["headers"] == [(b"content-length", b"3")]
+    assert unknown.sent[0]["headers"] == []
+
+
+def test_sync_handler_runs_off_the_event_loop_thread() -> None:
+    threads: list[threading.Thread] = []
+
+    def handler(request: Request) -> Response:
+        threads.append(threading.current_thread())
+        return Response(OK).body_(request.body.bytes.upper())
+
+    assert _Client(b"hello").call(handler) == b"HELLO"
+    assert threads[0] is not threading.main_thread()
+
+
+def test_async_handler_runs_on_the_event_loop_and_streams_the_body() -> None:
+    threads: list[threading.Thread] = []
+    received_before_chunk: list[int] = []
+    client = _Client(b"abc", b"def", b"ghi")
+
+    async def handler(request: Request) -> Response:
+        threads.append(threading.current_thread())
+        chunks = []
+        async for chunk in request.body.achunks():
+            received_before_chunk.append(client.received)
+            chunks.append(bytes(chunk))
+        return Response(OK).body_(b"".join(chunks).upper())
+
+    assert client.call(handler) == b"ABCDEFGHI"
+    assert received_before_chunk == [1, 2, 3]
+    assert threads == [threading.main_thread()]
+
+
+def test_async_handler_cannot_read_a_streamed_body_synchronously() -> None:
+    async def handler(request: Request) -> Response:
+        try:
+            _ = request.body.bytes
+        except RuntimeError:
+            return Response(BAD_REQUEST)
+        return Response(OK)
+
+    client = _Client(b"abc", b"def")
+    client.call(handler)
+
+    assert client.sent[0]["status"] == 400
+
+
+def test_blocking_sync_handlers_are_bounded_by_the_worker_pool() -> None:
+    adapter = StandardAsgiAdapter(workers=2)
+    lock = threading.Lock()
+    active = peak = 0
+
+    def handler(request: Request) -> Response:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        threading.Event().wait(0.02)
+        with lock:
+            active -= 1
+        return Response(OK)
+
+    async def serve_all() -> None:
+        app = adapter.to_asgi(handler)
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+        clients = [_Client(b"") for _ in range(6)]
+        await asyncio.gather(*(app(scope, client.receive, client.send) for client in clients))
+
+    try:
+        asyncio.run(serve_all())
+    finally:
+        adapter.close()
+
+    assert peak == 2
+
+
+def test_sync_handler_does_not_block_async_handlers() -> None:
+    release = threading.Event()
+    adapter = StandardAsgiAdapter(workers=1)
+
+    def blocking(request: Request) -> Response:
+        release.wait(5)
+        return Response(OK)
+
+    async def fast(request: Request) -> Response:
+        release.set()
+        return Response(OK)
+
+    async def serve_both() -> None:
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+        slow_client, fast_client = _Client(b""), _Client(b"")
+        await asyncio.wait_for(
+            asyncio.gather(
+                adapter.to_asgi(blocking)(scope, slow_client.receive, slow_client.send),
+                adapter.to_asgi(fast)(scope, fast_client.receive, fast_client.send),
+            ),
+            timeout=5,
+        )
+
+    try:
+        asyncio.run(serve_both())
+    finally:
+        adapter.close()
+
+    assert release.is_set()
+
+
+def test_lifespan_shutdown_closes_the_executor_it_created() -> None:
+    adapter = StandardAsgiAdapter(workers=1)
+    messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return next(messages)
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    asyncio.run(adapter.to_asgi(lambda request: Response(OK))({"type": "lifespan"}, receive, send))
+
+    assert sent == [{"type": "lifespan.startup.complete"}, {"type": "lifespan.shutdown.complete"}]
+    with pytest.raises(RuntimeError):
+        adapter._executor.submit(print)
+
+
+def test_lifespan_shutdown_leaves_a_caller_executor_running() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+
+        async def receive() -> dict[str, Any]:
+            return next(messages)
+
+        async def send(message: dict[str, Any]) -> None:
+            pass
+
+        asyncio.run(asgi_adapter(lambda request: Response(OK), executor=executor)({"type": "lifespan"}, receive, send))
+
+        assert executor.submit(lambda: 42).result() == 42
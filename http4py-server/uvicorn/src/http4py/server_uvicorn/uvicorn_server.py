@@ -1,23 +1,94 @@
 from __future__ import annotations
 
 import asyncio
+import socket
 import threading
+from typing import cast
 
 import uvicorn
-from http4py.core import HttpHandler
-from http4py.server import Http4pyServer, ServerConfig
-from http4py.server_asgi import StandardAsgiAdapter
+from http4py.core import AsyncHttpHandler, HttpHandler
+from http4py.server import DrainReport, Http4pyServer, PreFork, ServerConfig
+from http4py.server_asgi import AsgiApp, StandardAsgiAdapter
 
 
 class Uvicorn(ServerConfig):
-    def __init__(self, port: int = 8080):
+    def __init__(
+        self,
+        port: int = 8080,
+        host: str = "localhost",
+        workers: int = 1,
+        loop: str = "auto",
+        http: str = "auto",
+        backlog: int = 2048,
+        limit_concurrency: int | None = None,
+        timeout_keep_alive: int = 5,
+        access_log: bool = False,
+        log_level: str | None = None,
+    ):
         self._port = port
+        self._host = host
+        self._workers = workers
+        self._loop = loop
+        self._http = http
+        self._backlog = backlog
+        self._limit_concurrency = limit_concurrency
+        self._timeout_keep_alive = timeout_keep_alive
+        self._access_log = access_log
+        self._log_level = log_level
+
+    def serve(self, http: HttpHandler | AsyncHttpHandler) -> Http4pyServer:
+        if self._workers > 1:
+            worker = Uvicorn(
+                host=self._host,
+                loop=self._loop,
+                http=self._http,
+                backlog=self._backlog,
+                limit_concurrency=self._limit_concurrency,
+                timeout_keep_alive=self._timeout_keep_alive,
+                access_log=self._access_log,
+                log_level=self._log_level,
+            )
+            return PreFork(worker, self._workers, self._port, self._host, self._backlog).serve(cast(HttpHandler, http))
+        return self._serve(http, None)
+
+    def serve_on(self, http: HttpHandler | AsyncHttpHandler, listener: socket.socket) -> Http4pyServer:
+        if self._workers > 1:
+            raise ValueError("serve_on runs a single worker; use Uvicorn(workers=1) when serving on a listener")
+        return self._serve(http, listener)
+
+    def _config(self, app: AsgiApp) -> uvicorn.Config:
+        return uvicorn.Config(
+            app=app,
+            host=self._host,
+            port=self._port,
+            loop=self._loop,
+            http=self._http,
+            backlog=self._backlog,
+            limit_concurrency=self._limit_concurrency,
+            timeout_keep_alive=self._timeout_keep_alive,
+            access_log=self._access_log,
+            log_level=self._log_level,
+        )
+
+    def _serve(self, http: HttpHandler | AsyncHttpHandler, listener: socket.socket | None) -> Http4pyServer:
+        settings = self
+
+        class _StartupSignallingServer(uvicorn.Server):
+            def __init__(self, config: uvicorn.Config, ready: threading.Event):
+                super().__init__(config)
+                self._ready = ready
+
+            async def startup(self, sockets: list[socket.socket] | None = None) -> None:
+                try:
+                    await super().startup(sockets)
+                finally:
+                    self._ready.set()
 
-    def serve(self, http: HttpHandler) -> Http4pyServer:
         class _UvicornServer(Http4pyServer):
-            def __init__(self, port: int, http_handler: HttpHandler):
+            def __init__(self, port: int, http_handler: HttpHandler | AsyncHttpHandler):
                 self._port = port
                 self._http_handler = http_handler
+                self._adapter: StandardAsgiAdapter | None = None
                 self._server: uvicorn.Server | None = None
                 self._thread: threading.Thread | None = None
                 self._loop: asyncio.AbstractEventLoop | None = None
@@ -26,43 +97,84 @@ class Uvicorn(ServerConfig):
                 if self._server is not None:
                     return self
 
-                config = uvicorn.Config(
-                    app=StandardAsgiAdapter().to_asgi(self._http_handler),
-                    host="localhost",
-                    port=self._port,
-                    access_log=False,
-                )
-                self._server = uvicorn.Server(config)
+                self._adapter = StandardAsgiAdapter()
+                config = settings._config(self._adapter.to_asgi(self._http_handler))
+                config.load()
+                ready = threading.Event()
+                server = _StartupSignallingServer(config, ready)
+                self._server = server
 
                 def run_server() -> None:
-                    self._loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(self._loop)
-                    if self._server is not None:
-                        self._loop.run_until_complete(self._server.serve())
+                    try:
+                        with asyncio.Runner(loop_factory=config.get_loop_factory()) as runner:
+                            self._loop = runner.get_loop()
+                            runner.run(server.serve(sockets=[listener] if listener is not None else None))
+                    except SystemExit:
+                        if server.started:
+                            raise
+                    finally:
+                        ready.set()
 
                 self._thread = threading.Thread(target=run_server, daemon=True)
                 self._thread.start()
+                ready.wait()
 
-                while self._server is None or not self._server.started:
-                    pass
-
+                if not server.started:
+                    self._thread.join()
+                    self._server = None
+                    self._thread = None
+                    self._loop = None
+                    self._adapter.close()
+                    self._adapter = None
+                    raise RuntimeError(f"Uvicorn failed to start on {settings._host}:{self._port}")
                 return self
 
             def stop(self) -> Http4pyServer:
                 if self._server is not None and self._loop is not None:
-                    self._loop.call_soon_threadsafe(self._server.should_exit.__setattr__, "value", True)
-                    if self._thread is not None:
-                        self._thread.join()
-                    self._server = None
-                    self._thread = None
-                    self._loop = None
+                    self._loop.call_soon_threadsafe(setattr, self._server, "should_exit", True)
+                self._finish()
                 return self
 
+            def drain(self, timeout: float = 30.0) -> DrainReport:
+                if self._server is None or self._loop is None:
+                    return DrainReport()
+                report = asyncio.run_coroutine_threadsafe(_drain(self._server, timeout), self._loop).result()
+                self._finish()
+                return report
+
+            def _finish(self) -> None:
+                if self._thread is not None:
+                    self._thread.join()
+                self._server = None
+                self._thread = None
+                self._loop = None
+                if self._adapter is not None:
+                    self._adapter.close()
+                    self._adapter = None
+
             def block(self) -> None:
                 if self._thread is not None:
                     self._thread.join()
 
             def port(self) -> int:
+                if listener is not None:
+                    return int(listener.getsockname()[1])
+                if self._server is not None and self._server.started:
+                    for server in self._server.servers:
+                        for sock in server.sockets:
+                            return int(sock.getsockname()[1])
                 return self._port
 
         return _UvicornServer(self._port, http)
+
+
+async def _drain(server: uvicorn.Server, timeout: float) -> DrainReport:
+    state = server.server_state
+    in_flight = set(state.tasks)
+    idle = max(len(state.connections) - len(in_flight), 0)
+    server.config.timeout_graceful_shutdown = timeout  # type: ignore[assignment]
+    server.should_exit = True
+    if not in_flight:
+        return DrainReport(idle_closed=idle)
+    done, pending = await asyncio.wait(in_flight, timeout=timeout)
+    return DrainReport(len(done), len(pending), idle)
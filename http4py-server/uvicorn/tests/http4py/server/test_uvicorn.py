@@ -1,5 +1,14 @@
 from __future__ import annotations
 
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from http4py.core import Request, Response
+from http4py.core.status import OK
 from http4py.server import ServerConfig
 from http4py.server_uvicorn import Uvicorn
 from http4py.testing import HttpServerContract
@@ -8,3 +17,60 @@ from http4py.testing import HttpServerContract
 class TestUvicornServerContract(HttpServerContract):
     def create_server_config(self, port: int) -> ServerConfig:
         return Uvicorn(port)
+
+
+def report_pid(request: Request) -> Response:
+    return Response(OK).body_(str(os.getpid()))
+
+
+class TestUvicorn:
+    def test_reports_the_bound_port_when_started_on_port_zero(self) -> None:
+        server = Uvicorn(0).serve(report_pid).start()
+        try:
+            assert server.port() != 0
+            assert requests.get(f"http://localhost:{server.port()}/", timeout=5).text == str(os.getpid())
+        finally:
+            server.stop()
+
+    @pytest.mark.filterwarnings("error::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_start_fails_when_the_port_is_taken(self) -> None:
+        with socket.socket() as taken:
+            taken.bind(("localhost", 0))
+            taken.listen()
+
+            with pytest.raises(RuntimeError):
+                Uvicorn(taken.getsockname()[1]).serve(report_pid).start()
+
+    def test_limit_concurrency_rejects_excess_requests(self) -> None:
+        entered, release = threading.Event(), threading.Event()
+
+        def blocking(request: Request) -> Response:
+            entered.set()
+            release.wait(5)
+            return Response(OK)
+
+        server = Uvicorn(0, limit_concurrency=2).serve(blocking).start()
+        try:
+            url = f"http://localhost:{server.port()}/"
+            with ThreadPoolExecutor(1) as client:
+                held = client.submit(requests.get, url, timeout=10)
+                assert entered.wait(5)
+
+                assert requests.get(url, timeout=5).status_code == 503
+
+                release.set()
+                assert held.result().status_code == 200
+        finally:
+            release.set()
+            server.stop()
+
+    def test_workers_serve_from_separate_processes(self) -> None:
+        server = Uvicorn(0, workers=2).serve(report_pid).start()
+        try:
+            url = f"http://localhost:{server.port()}/"
+            served_by = {int(requests.get(url, timeout=10).text) for _ in range(4)}
+
+            assert served_by
+            assert os.getpid() not in served_by
+        finally:
+            server.stop()
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import http.client
 import socket
 import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 
 import requests
 
@@ -11,7 +15,7 @@ from http4py.core import Request, Response
 from http4py.core.method import GET, POST
 from http4py.core.status import OK, CREATED
 from http4py.routing import route, routes
-from http4py.server import Http4pyServer, ServerConfig
+from http4py.server import DrainReport, Http4pyServer, ServerConfig
 
 
 def get_free_port() -> int:
@@ -40,11 +44,49 @@ def header_handler(request: Request) -> Response:
     return response.body_("{}")
 
 
+STREAMED_CONTENT = b"".join(f"line {i}\n".encode() for i in range(20_000))
+
+
+def stream_handler(request: Request) -> Response:
+    return Response(OK).body_(BytesIO(STREAMED_CONTENT)).header_("Content-Type", "text/plain")
+
+
+def sized_stream_handler(request: Request) -> Response:
+    return (
+        Response(OK)
+        .body_(BytesIO(STREAMED_CONTENT))
+        .header_("Content-Type", "text/plain")
+        .header_("Content-Length", str(len(STREAMED_CONTENT)))
+    )
+
+
+def generated_handler(request: Request) -> Response:
+    rows = (f"line {i}\n" for i in range(20_000))
+    return Response(OK).header_("Content-Type", "text/plain").body_(rows)
+
+
+def upload_handler(request: Request) -> Response:
+    digest = hashlib.sha256()
+    for chunk in request.body.chunks():
+        digest.update(chunk)
+    return Response(OK).body_(digest.hexdigest()).header_("Content-Type", "text/plain")
+
+
+def slow_handler(request: Request) -> Response:
+    time.sleep(float(request.query("seconds") or 0))
+    return Response(OK).body_("done").header_("Content-Type", "text/plain")
+
+
 def create_test_app():
     return routes(
         route("/hello").bind(GET).to(hello_handler),
         route("/echo").bind(POST).to(echo_handler),
-        route("/headers").bind(GET).to(header_handler)
+        route("/headers").bind(GET).to(header_handler),
+        route("/stream").bind(GET).to(stream_handler),
+        route("/stream-sized").bind(GET).to(sized_stream_handler),
+        route("/generated").bind(GET).to(generated_handler),
+        route("/upload").bind(POST).to(upload_handler),
+        route("/slow").bind(GET).to(slow_handler),
     )
 
 
@@ -111,3 +153,162 @@ class HttpServerContract(ABC):
                 assert response.headers[echo_header_name] == value, f"Header value mismatch for {echo_header_name}"
         finally:
             server.stop()
+
+    def test_streams_body_of_unknown_length_chunked(self) -> None:
+        server = self._start_test_server()
+        try:
+            response = requests.get(f"http://localhost:{server.port()}/stream", timeout=5)
+
+            assert response.status_code == 200
+            assert response.headers.get("Transfer-Encoding") == "chunked"
+            assert "Content-Length" not in response.headers
+            assert response.content == STREAMED_CONTENT
+        finally:
+            server.stop()
+
+    def test_streams_body_of_declared_length(self) -> None:
+        server = self._start_test_server()
+        try:
+            response = requests.get(f"http://localhost:{server.port()}/stream-sized", timeout=5)
+
+            assert response.status_code == 200
+            assert response.headers["Content-Length"] == str(len(STREAMED_CONTENT))
+            assert response.content == STREAMED_CONTENT
+        finally:
+            server.stop()
+
+    def test_streams_body_produced_by_generator(self) -> None:
+        server = self._start_test_server()
+        try:
+            response = requests.get(f"http://localhost:{server.port()}/generated", timeout=5)
+
+            assert response.status_code == 200
+            assert response.content == STREAMED_CONTENT
+        finally:
+            server.stop()
+
+    def test_reads_large_request_body_incrementally(self) -> None:
+        server = self._start_test_server()
+        try:
+            response = requests.post(f"http://localhost:{server.port()}/upload", data=STREAMED_CONTENT, timeout=5)
+
+            assert response.status_code == 200
+            assert response.text == hashlib.sha256(STREAMED_CONTENT).hexdigest()
+        finally:
+            server.stop()
+
+    def test_head_of_a_streamed_body_does_not_advertise_a_length(self) -> None:
+        server = self._start_test_server()
+        connection = http.client.HTTPConnection("localhost", server.port(), timeout=5)
+        try:
+            connection.request("HEAD", "/generated")
+            head = connection.getresponse()
+            assert head.read() == b""
+
+            assert head.status == 200
+            assert head.getheader("Content-Length") is None
+
+            connection.request("GET", "/hello")
+            assert connection.getresponse().read() == b"Hello World"
+        finally:
+            connection.close()
+            server.stop()
+
+    def test_reuses_connection_for_consecutive_requests(self) -> None:
+        server = self._start_test_server()
+        connection = http.client.HTTPConnection("localhost", server.port(), timeout=5)
+        try:
+            connection.request("GET", "/hello")
+            first = connection.getresponse()
+            assert first.read() == b"Hello World"
+            socket_after_first = connection.sock
+
+            connection.request("POST", "/echo", body=b"again", headers={"Content-Type": "text/plain"})
+            second = connection.getresponse()
+            assert second.read() == b"Received: again"
+
+            connection.request("GET", "/generated")
+            third = connection.getresponse()
+            assert third.read() == STREAMED_CONTENT
+
+            assert socket_after_first is not None
+            assert connection.sock is socket_after_first
+        finally:
+            connection.close()
+            server.stop()
+
+    def test_serves_new_clients_while_idle_keep_alive_connections_are_open(self) -> None:
+        server = self._start_test_server()
+        idle = [http.client.HTTPConnection("localhost", server.port(), timeout=5) for _ in range(8)]
+        try:
+            for connection in idle:
+                connection.request("GET", "/hello")
+                assert connection.getresponse().read() == b"Hello World"
+            reused_socket = idle[0].sock
+
+            started = time.monotonic()
+            response = requests.get(f"http://localhost:{server.port()}/hello", timeout=5)
+
+            assert response.text == "Hello World"
+            assert time.monotonic() - started < 1
+            idle[0].request("GET", "/hello")
+            assert idle[0].getresponse().read() == b"Hello World"
+            assert idle[0].sock is reused_socket
+        finally:
+            for connection in idle:
+                connection.close()
+            server.stop()
+
+    def test_drain_finishes_in_flight_requests_and_stops_accepting(self) -> None:
+        server = self._start_test_server()
+        url = f"http://localhost:{server.port()}"
+        client = ThreadPoolExecutor(1)
+        try:
+            in_flight = client.submit(requests.get, f"{url}/slow?seconds=0.5", timeout=5)
+            time.sleep(0.2)
+
+            report = server.drain(timeout=5)
+
+            assert in_flight.result().text == "done"
+            assert (report.completed, report.abandoned) == (1, 0)
+            try:
+                requests.get(f"{url}/hello", timeout=1)
+                raise AssertionError("Expected the drained server to refuse connections")
+            except requests.ConnectionError:
+                pass
+        finally:
+            client.shutdown(wait=False)
+            server.stop()
+
+    def test_drain_closes_idle_keep_alive_connections(self) -> None:
+        server = self._start_test_server()
+        connection = http.client.HTTPConnection("localhost", server.port(), timeout=5)
+        try:
+            connection.request("GET", "/hello")
+            assert connection.getresponse().read() == b"Hello World"
+            time.sleep(0.1)
+
+            report = server.drain(timeout=5)
+
+            assert report == DrainReport(completed=0, abandoned=0, idle_closed=1)
+            assert connection.sock is not None
+            assert connection.sock.recv(1) == b""
+        finally:
+            connection.close()
+            server.stop()
+
+    def test_drain_abandons_requests_still_running_at_the_deadline(self) -> None:
+        server = self._start_test_server()
+        client = ThreadPoolExecutor(1)
+        try:
+            client.submit(requests.get, f"http://localhost:{server.port()}/slow?seconds=3", timeout=5)
+            time.sleep(0.2)
+
+            started = time.monotonic()
+            report = server.drain(timeout=0.3)
+
+            assert time.monotonic() - started < 2.5
+            assert (report.completed, report.abandoned) == (0, 1)
+        finally:
+            client.shutdown(wait=False)
+            server.stop()